@@ -25,6 +25,7 @@ from openai import AsyncOpenAI
 from src.config.settings import get_settings
 from src.database.models import LEGAL_CATEGORIES
 from src.schemas.knowledge import (
+    RAG_RESULTS_ADAPTER,
     RAGSearchResult,
     StudyAgentRequest,
     StudyAgentResponse,
@@ -236,19 +237,18 @@ class StudyAgent:
                 max_results,
             )
 
-        # Converter para RAGSearchResult
-        results = []
+        # Converter para RAGSearchResult, validando o lote inteiro de uma vez
+        payload = []
         for row in rows:
-            metadata = row["archival_metadata"] or {}
-            results.append(
-                RAGSearchResult(
-                    content=row["content"],
-                    similarity=float(row["similarity"]),
-                    category=row["category"],
-                    metadata=metadata,
-                    source=metadata.get("fonte", "Fonte desconhecida"),
-                )
+            payload.append(
+                {
+                    "content": row["content"],
+                    "similarity": float(row["similarity"]),
+                    "category": row["category"],
+                    "metadata": RAGSearchResult.metadata_from_archival(row["archival_metadata"]),
+                }
             )
+        results = RAG_RESULTS_ADAPTER.validate_python(payload)
 
         logger.info(
             f"Busca RAG retornou {len(results)} resultados "
@@ -4,6 +4,8 @@ This module defines the hierarchy of custom exceptions used throughout the appli
 providing clear error categorization and descriptive error messages.
 """
 
+from typing import Any, ClassVar
+
 
 class AgnaldoError(Exception):
     """Base exception for all Agnaldo-specific errors.
@@ -20,6 +22,12 @@ class AgnaldoError(Exception):
         AgnaldoError: Something went wrong
     """
 
+    error_code: ClassVar[str] = "AGNALDO_ERROR"
+    """Machine-readable code reported in error responses."""
+
+    retry_after: int | None = None
+    """Seconds the caller should wait before retrying, if known."""
+
     def __init__(self, message: str, details: dict | None = None) -> None:
         """Initialize the exception with a message and optional details.
 
@@ -35,6 +43,13 @@ class AgnaldoError(Exception):
         """Return the error message."""
         return self.message
 
+    def error_details(self) -> dict[str, Any]:
+        """Return the details reported in error responses.
+
+        Subclasses extend ``details`` with their own context fields.
+        """
+        return self.details
+
 
 class DatabaseError(AgnaldoError):
     """Exception raised for database-related errors.
@@ -52,6 +67,8 @@ class DatabaseError(AgnaldoError):
         >>> raise DatabaseError("Failed to connect to database", operation="connect")
     """
 
+    error_code: ClassVar[str] = "DATABASE_ERROR"
+
     def __init__(
         self,
         message: str,
@@ -78,6 +95,10 @@ class DatabaseError(AgnaldoError):
             return f"Database error in '{self.operation}': {self.message}"
         return f"Database error: {self.message}"
 
+    def error_details(self) -> dict[str, Any]:
+        """Add ``operation`` to the base details."""
+        return {**self.details, "operation": self.operation}
+
 
 class MemoryServiceError(AgnaldoError):
     """Exception raised for memory/knowledge base related errors.
@@ -94,6 +115,8 @@ class MemoryServiceError(AgnaldoError):
         >>> raise MemoryServiceError("Failed to generate embeddings", memory_type="vector")
     """
 
+    error_code: ClassVar[str] = "MEMORY_ERROR"
+
     def __init__(
         self,
         message: str,
@@ -120,6 +143,10 @@ class MemoryServiceError(AgnaldoError):
             return f"Memory error ({self.memory_type}): {self.message}"
         return f"Memory error: {self.message}"
 
+    def error_details(self) -> dict[str, Any]:
+        """Add ``memory_type`` to the base details."""
+        return {**self.details, "memory_type": self.memory_type}
+
 
 class IntentClassificationError(AgnaldoError):
     """Exception raised when intent classification fails.
@@ -136,6 +163,8 @@ class IntentClassificationError(AgnaldoError):
         >>> raise IntentClassificationError("Low confidence score", confidence=0.3)
     """
 
+    error_code: ClassVar[str] = "INTENT_CLASSIFICATION_ERROR"
+
     def __init__(
         self,
         message: str,
@@ -162,6 +191,10 @@ class IntentClassificationError(AgnaldoError):
             return f"Intent classification error (confidence: {self.confidence:.2f}): {self.message}"
         return f"Intent classification error: {self.message}"
 
+    def error_details(self) -> dict[str, Any]:
+        """Add ``confidence`` to the base details."""
+        return {**self.details, "confidence": self.confidence}
+
 
 class RateLimitError(AgnaldoError):
     """Exception raised when API rate limits are exceeded.
@@ -179,6 +212,8 @@ class RateLimitError(AgnaldoError):
         >>> raise RateLimitError("Too many requests", retry_after=60, limit=100)
     """
 
+    error_code: ClassVar[str] = "RATE_LIMIT_ERROR"
+
     def __init__(
         self,
         message: str,
@@ -214,6 +249,10 @@ class RateLimitError(AgnaldoError):
             parts.append(f" - Retry after {self.retry_after} seconds")
         return "".join(parts)
 
+    def error_details(self) -> dict[str, Any]:
+        """Add ``limit`` to the base details."""
+        return {**self.details, "limit": self.limit}
+
 
 class AgentCommunicationError(AgnaldoError):
     """Exception raised for agent-to-agent communication failures.
@@ -231,6 +270,8 @@ class AgentCommunicationError(AgnaldoError):
         >>> raise AgentCommunicationError("Message timeout", source_agent="planner", target_agent="executor")
     """
 
+    error_code: ClassVar[str] = "AGENT_COMMUNICATION_ERROR"
+
     def __init__(
         self,
         message: str,
@@ -266,6 +307,14 @@ class AgentCommunicationError(AgnaldoError):
             return f"Agent communication error (to {self.target_agent}): {self.message}"
         return f"Agent communication error: {self.message}"
 
+    def error_details(self) -> dict[str, Any]:
+        """Add ``source_agent`` and ``target_agent`` to the base details."""
+        return {
+            **self.details,
+            "source_agent": self.source_agent,
+            "target_agent": self.target_agent,
+        }
+
 
 class SupabaseConnectionError(DatabaseError):
     """Exception raised for Supabase-specific connection errors.
@@ -282,6 +331,8 @@ class SupabaseConnectionError(DatabaseError):
         >>> raise SupabaseConnectionError("Invalid API key", status_code=401)
     """
 
+    error_code: ClassVar[str] = "SUPABASE_CONNECTION_ERROR"
+
     def __init__(
         self,
         message: str,
@@ -310,6 +361,14 @@ class SupabaseConnectionError(DatabaseError):
             return f"Supabase connection error (HTTP {self.status_code}): {self.message}"
         return f"Supabase connection error: {self.message}"
 
+    def error_details(self) -> dict[str, Any]:
+        """Add ``status_code`` and ``operation`` to the base details."""
+        return {
+            **self.details,
+            "status_code": self.status_code,
+            "operation": self.operation,
+        }
+
 
 class EmbeddingGenerationError(MemoryServiceError):
     """Exception raised when embedding generation fails.
@@ -327,6 +386,8 @@ class EmbeddingGenerationError(MemoryServiceError):
         >>> raise EmbeddingGenerationError("Token limit exceeded", model="text-embedding-3-large", text_length=10000)
     """
 
+    error_code: ClassVar[str] = "EMBEDDING_GENERATION_ERROR"
+
     def __init__(
         self,
         message: str,
@@ -365,3 +426,11 @@ class EmbeddingGenerationError(MemoryServiceError):
         if self.text_length is not None:
             parts.append(f" (text length: {self.text_length})")
         return "".join(parts)
+
+    def error_details(self) -> dict[str, Any]:
+        """Add ``model`` and ``text_length`` to the base details."""
+        return {
+            **self.details,
+            "model": self.model,
+            "text_length": self.text_length,
+        }
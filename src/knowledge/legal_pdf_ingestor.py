@@ -119,7 +119,7 @@ class LegalPDFIngestor:
                 category=category,
                 total_chunks=len(chunks),
                 chunks_inserted=chunks_inserted,
-                errors=errors,
+                errors=tuple(errors),
                 duration_seconds=duration,
             )
 
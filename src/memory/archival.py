@@ -12,6 +12,7 @@ from typing import Any
 from loguru import logger
 
 from src.exceptions import DatabaseError, MemoryServiceError
+from src.schemas.memory import decode_cursor, encode_cursor
 
 
 class ArchivalMemory:
@@ -203,6 +204,7 @@ class ArchivalMemory:
         filters: dict[str, Any],
         limit: int = 50,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[dict[str, Any]]:
         """Search memories by JSONB metadata filters.
 
@@ -210,7 +212,11 @@ class ArchivalMemory:
             filters: Dict of metadata key-value pairs to match.
                 Supports nested queries with dot notation (e.g., "key.subkey").
             limit: Maximum results to return.
-            offset: Pagination offset.
+            offset: Pagination offset. Ignored when ``cursor`` is given.
+            cursor: Keyset cursor from ``encode_cursor`` for the last row of
+                the previous page. Prefer it over ``offset`` for deep pages:
+                the database seeks straight to the position instead of
+                scanning and discarding ``offset`` rows.
 
         Returns:
             List of memory dicts matching the filters.
@@ -221,6 +227,13 @@ class ArchivalMemory:
         if not filters:
             raise MemoryServiceError("At least one filter is required", memory_type="archival")
 
+        after: tuple[datetime, str] | None = None
+        if cursor is not None:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError as e:
+                raise MemoryServiceError(str(e), memory_type="archival") from e
+
         try:
             async with self.repository.acquire() as conn:
                 where_clauses = []
@@ -239,7 +252,17 @@ class ArchivalMemory:
                     params.append(str(value))
                     param_idx += 1
 
-                params.extend([limit, offset])
+                if after is not None:
+                    where_clauses.append(
+                        f"(created_at, id) < (${param_idx}::timestamptz, ${param_idx + 1}::uuid)"
+                    )
+                    params.extend(after)
+                    param_idx += 2
+                    page_clause = f"LIMIT ${param_idx}"
+                    params.append(limit)
+                else:
+                    page_clause = f"LIMIT ${param_idx} OFFSET ${param_idx + 1}"
+                    params.extend([limit, offset])
                 where_clause = f" AND {' AND '.join(where_clauses)}" if where_clauses else ""
 
                 query = f"""
@@ -249,8 +272,8 @@ class ArchivalMemory:
                         created_at, updated_at
                     FROM archival_memories
                     WHERE user_id = $1{where_clause}
-                    ORDER BY created_at DESC
-                    LIMIT ${param_idx} OFFSET ${param_idx + 1}
+                    ORDER BY created_at DESC, id DESC
+                    {page_clause}
                 """
 
                 rows = await conn.fetch(query, *params)
@@ -281,6 +304,36 @@ class ArchivalMemory:
         except Exception as e:
             raise DatabaseError(f"Metadata search failed: {e}", operation="search") from e
 
+    async def search_page_by_metadata(
+        self,
+        filters: dict[str, Any],
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Fetch one keyset page of a metadata search and the cursor for the next.
+
+        Loop by passing the returned cursor back in until it is ``None``; each
+        page is a ``LIMIT`` seek, never an ``OFFSET`` scan.
+
+        Args:
+            filters: Dict of metadata key-value pairs to match.
+            limit: Page size.
+            cursor: Cursor returned with the previous page, or ``None`` for the
+                first page.
+
+        Returns:
+            The page of memory dicts and the cursor for the following page, or
+            ``None`` when this page was not full.
+
+        Raises:
+            DatabaseError: If search fails.
+        """
+        results = await self.search_by_metadata(filters, limit=limit, cursor=cursor)
+        if len(results) < limit:
+            return results, None
+        last = results[-1]
+        return results, encode_cursor(last["created_at"], last["memory_id"])
+
     async def search_by_content(
         self,
         query: str,
@@ -108,14 +108,20 @@ class CoreMemory:
                     )
 
                     for row in rows:
-                        item = CoreMemoryItem(
-                            id=str(row["id"]),
-                            content=row["value"],
-                            importance=row["importance"] if row["importance"] is not None else 0.5,
-                            access_count=row["access_count"] if row["access_count"] is not None else 0,
-                            last_accessed=row["last_accessed"],
-                            created_at=row["created_at"],
-                            metadata={"key": row["key"], **(row["metadata"] or {})},
+                        item = CoreMemoryItem.from_row(
+                            {
+                                "id": str(row["id"]),
+                                "content": row["value"],
+                                "importance": (
+                                    row["importance"] if row["importance"] is not None else 0.5
+                                ),
+                                "access_count": (
+                                    row["access_count"] if row["access_count"] is not None else 0
+                                ),
+                                "last_accessed": row["last_accessed"],
+                                "created_at": row["created_at"],
+                                "metadata": {"key": row["key"], **(row["metadata"] or {})},
+                            }
                         )
                         self._cache[row["key"]] = item
 
@@ -40,7 +40,7 @@ class MemoryIsolationError(Exception):
 class IsolationAuditLog:
     """Log de auditoria para operações de memória."""
 
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=functools.partial(datetime.now, timezone.utc))
     operation: str = ""
     user_id: str = ""
     resource_type: str = ""
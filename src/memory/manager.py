@@ -501,11 +501,9 @@ class MemoryManager:
                 core_count=core_stats.get("item_count", 0),
                 recall_count=recall_count,
                 archival_count=archival_count,
-                total_count=core_stats.get("item_count", 0) + recall_count + archival_count,
                 core_tokens=core_tokens,
                 recall_tokens=recall_tokens,
                 archival_tokens=archival_tokens,
-                total_tokens=core_tokens + recall_tokens + archival_tokens,
             )
 
         except Exception as e:
@@ -4,9 +4,10 @@ This module provides a memory tier optimized for fast retrieval of relevant
 memories using vector embeddings and cosine similarity search.
 """
 
+import asyncio
 import hashlib
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import tiktoken
 from loguru import logger
@@ -15,6 +16,11 @@ from openai import AsyncOpenAI
 from src.config.settings import get_settings
 from src.exceptions import DatabaseError, EmbeddingGenerationError, MemoryServiceError
 
+if TYPE_CHECKING:
+    from contextlib import AbstractAsyncContextManager
+
+    from asyncpg import Connection
+
 
 class RecallMemory:
     """Recall Memory tier for semantic search over stored memories.
@@ -108,23 +114,73 @@ class RecallMemory:
         logger.info(f"Added recall memory {memory_id} with importance {importance}")
         return memory_id
 
+    async def add_many(self, memories: list[tuple[str, float]]) -> list[str]:
+        """Add several memories with one embedding request and one insert.
+
+        Args:
+            memories: ``(content, importance)`` pairs to store.
+
+        Returns:
+            UUIDs of the created memories, in input order.
+
+        Raises:
+            MemoryServiceError: If any content is empty or importance is out of range.
+            EmbeddingGenerationError: If embedding generation fails.
+            DatabaseError: If database insert fails.
+        """
+        for content, importance in memories:
+            if not content or not content.strip():
+                raise MemoryServiceError("Content cannot be empty", memory_type="recall")
+            if not 0.0 <= importance <= 1.0:
+                raise MemoryServiceError("Importance must be between 0.0 and 1.0", memory_type="recall")
+
+        if not memories:
+            return []
+
+        contents = [content for content, _ in memories]
+        importances = [importance for _, importance in memories]
+
+        try:
+            embeddings = await self._generate_embeddings(contents)
+        except Exception as e:
+            raise EmbeddingGenerationError(
+                f"Failed to generate embeddings: {e}",
+                model=self.embedding_model,
+                text_length=sum(len(content) for content in contents),
+            ) from e
+
+        memory_ids = await self._insert_many(contents, embeddings, importances)
+
+        logger.info(f"Added {len(memory_ids)} recall memories in batch")
+        return memory_ids
+
     async def search(
         self,
         query: str,
         limit: int = 10,
         threshold: float = 0.7,
         min_importance: float = 0.0,
+        after: tuple[float, str] | None = None,
     ) -> list[dict[str, Any]]:
         """Search memories by semantic similarity.
 
+        Results are ordered by cosine distance, then id, so they can be paged
+        with a keyset cursor: pass the ``cursor`` of the last result of one
+        page as ``after`` to fetch the next page without re-scanning it. The id
+        breaks ties, so memories at the same distance are neither skipped nor
+        repeated across pages.
+
         Args:
             query: Search query text.
             limit: Maximum number of results to return.
             threshold: Minimum cosine similarity (0.0-1.0) for results.
             min_importance: Minimum importance score to filter results.
+            after: Only return memories ordered after this ``(distance,
+                memory_id)`` pair (keyset cursor from a previous page).
 
         Returns:
-            List of memory dicts with content, similarity, and metadata.
+            List of memory dicts with content, similarity, distance, cursor,
+            and metadata.
 
         Raises:
             MemoryServiceError: If search query is empty or search fails.
@@ -132,28 +188,46 @@ class RecallMemory:
         if not query or not query.strip():
             raise MemoryServiceError("Search query cannot be empty", memory_type="recall")
 
+        # Start acquiring the pool connection while the embedding request is in
+        # flight, so a cold pool does not add its latency after the OpenAI call.
+        acquire_ctx: AbstractAsyncContextManager[Connection] = self.repository.acquire()
+        conn_task: asyncio.Task[Connection] = asyncio.create_task(acquire_ctx.__aenter__())
         try:
-            query_embedding = await self._generate_embedding(query)
-        except Exception as e:
-            raise EmbeddingGenerationError(
-                f"Failed to generate query embedding: {e}",
-                model=self.embedding_model,
-                text_length=len(query),
-            ) from e
+            try:
+                query_embedding = await self._generate_embedding(query)
+            except Exception as e:
+                raise EmbeddingGenerationError(
+                    f"Failed to generate query embedding: {e}",
+                    model=self.embedding_model,
+                    text_length=len(query),
+                ) from e
 
-        try:
-            async with self.repository.acquire() as conn:
+            try:
+                conn = await conn_task
                 # Use pgvector <-> operator for cosine distance
                 # Convert cosine similarity threshold to distance: distance = 1 - similarity
                 max_distance = 1.0 - threshold
 
+                params: list[Any] = [
+                    "[" + ",".join(map(str, query_embedding)) + "]",
+                    self.user_id,
+                    min_importance,
+                    max_distance,
+                    limit,
+                ]
+                cursor_filter = ""
+                if after is not None:
+                    cursor_filter = "AND (embedding <=> $1::vector, id) > ($6, $7::uuid)"
+                    params.extend(after)
+
                 rows = await conn.fetch(
-                    """
+                    f"""
                     SELECT
                         id,
                         content,
                         importance,
                         1 - (embedding <=> $1::vector) as similarity,
+                        embedding <=> $1::vector as distance,
                         created_at,
                         updated_at,
                         access_count
@@ -161,14 +235,11 @@ class RecallMemory:
                     WHERE user_id = $2
                         AND importance >= $3
                         AND (embedding <=> $1::vector) <= $4
-                    ORDER BY embedding <=> $1::vector
+                        {cursor_filter}
+                    ORDER BY embedding <=> $1::vector, id
                     LIMIT $5
                     """,
-                    "[" + ",".join(map(str, query_embedding)) + "]",
-                    self.user_id,
-                    min_importance,
-                    max_distance,
-                    limit,
+                    *params,
                 )
 
                 results = [
@@ -177,9 +248,11 @@ class RecallMemory:
                         "content": row["content"],
                         "importance": row["importance"],
                         "similarity": float(row["similarity"]),
+                        "distance": float(row["distance"]),
                         "created_at": self._to_utc(row["created_at"]),
                         "updated_at": self._to_utc(row["updated_at"]),
                         "access_count": row["access_count"],
+                        "cursor": (float(row["distance"]), str(row["id"])),
                     }
                     for row in rows
                 ]
@@ -207,8 +280,26 @@ class RecallMemory:
                 )
                 return results
 
-        except Exception as e:
-            raise DatabaseError(f"Recall search failed: {e}", operation="search") from e
+            except Exception as e:
+                raise DatabaseError(f"Recall search failed: {e}", operation="search") from e
+        finally:
+            await self._finish_acquire(acquire_ctx, conn_task)
+
+    @staticmethod
+    async def _finish_acquire(
+        acquire_ctx: "AbstractAsyncContextManager[Connection]",
+        conn_task: "asyncio.Task[Connection]",
+    ) -> None:
+        """Release a connection acquired in the background, or cancel a pending acquire."""
+        if not conn_task.done():
+            conn_task.cancel()
+            # asyncio.wait() never raises the task's outcome, so only a
+            # cancellation of the calling task propagates from here.
+            await asyncio.wait((conn_task,))
+        if conn_task.cancelled() or conn_task.exception() is not None:
+            return
+        # The cancel can lose the race with a connection being handed out
+        await acquire_ctx.__aexit__(None, None, None)
 
     async def update_importance(self, memory_id: str, importance: float) -> bool:
         """Update the importance score of a memory.
@@ -347,6 +438,8 @@ class RecallMemory:
         """
         try:
             truncated_text = self._truncate_for_embedding(text)
+            # encoding_format is left unset on purpose: the SDK then requests
+            # base64 on the wire and decodes it to floats itself.
             response = await self.openai.embeddings.create(
                 model=self.embedding_model,
                 input=truncated_text,
@@ -367,6 +460,42 @@ class RecallMemory:
                 text_length=len(text),
             ) from e
 
+    async def _generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Generate embedding vectors for several texts in one OpenAI request.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            One embedding per input text, in input order.
+
+        Raises:
+            EmbeddingGenerationError: If API call fails.
+        """
+        try:
+            response = await self.openai.embeddings.create(
+                model=self.embedding_model,
+                input=[self._truncate_for_embedding(text) for text in texts],
+            )
+            embeddings = [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+            for embedding in embeddings:
+                if len(embedding) != self._embedding_dim:
+                    raise EmbeddingGenerationError(
+                        "Embedding dimension mismatch",
+                        model=self.embedding_model,
+                        details={
+                            "expected_dim": self._embedding_dim,
+                            "actual_dim": len(embedding),
+                        },
+                    )
+            return embeddings
+        except Exception as e:
+            raise EmbeddingGenerationError(
+                f"OpenAI API error: {e}",
+                model=self.embedding_model,
+                text_length=sum(len(text) for text in texts),
+            ) from e
+
     async def _insert_memory(
         self,
         content: str,
@@ -401,3 +530,40 @@ class RecallMemory:
 
         except Exception as e:
             raise DatabaseError(f"Failed to insert memory: {e}", operation="insert") from e
+
+    async def _insert_many(
+        self,
+        contents: list[str],
+        embeddings: list[list[float]],
+        importances: list[float],
+    ) -> list[str]:
+        """Insert several memories in a single round-trip.
+
+        Args:
+            contents: Memory content texts.
+            embeddings: Vector embeddings, aligned with ``contents``.
+            importances: Importance scores, aligned with ``contents``.
+
+        Returns:
+            UUIDs of inserted memories, in input order.
+        """
+        try:
+            async with self.repository.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    INSERT INTO recall_memories
+                        (user_id, content, embedding, importance, created_at)
+                    SELECT $1, t.content, t.embedding::vector, t.importance, NOW()
+                    FROM unnest($2::text[], $3::text[], $4::float8[])
+                        AS t(content, embedding, importance)
+                    RETURNING id
+                    """,
+                    self.user_id,
+                    contents,
+                    ["[" + ",".join(map(str, embedding)) + "]" for embedding in embeddings],
+                    importances,
+                )
+                return [str(row["id"]) for row in rows]
+
+        except Exception as e:
+            raise DatabaseError(f"Failed to insert memories: {e}", operation="insert") from e
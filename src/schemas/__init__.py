@@ -0,0 +1,5 @@
+"""Pydantic schemas for the Agnaldo Discord bot."""
+
+from src.schemas.json_schema import json_schema_for
+
+__all__ = ["json_schema_for"]
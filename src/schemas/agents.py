@@ -2,6 +2,7 @@
 
 from datetime import datetime, timezone
 from enum import Enum
+from functools import partial
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer
@@ -24,9 +25,8 @@ class ResponseStatus(str, Enum):
     PENDING = "pending"
 
 
-def _get_utc_now() -> datetime:
-    """Retorna datetime atual em UTC."""
-    return datetime.now(timezone.utc)
+# Retorna datetime atual em UTC; ``partial`` evita um frame Python por instância.
+_get_utc_now = partial(datetime.now, timezone.utc)
 
 
 class AgentMessage(BaseModel):
@@ -67,7 +67,17 @@ class AgentResponse(BaseModel):
     data: dict[str, Any] | None = Field(default=None, description="Response data")
     error: str | None = Field(default=None, description="Error message if status is error")
 
-    model_config = ConfigDict(use_enum_values=True)
+    @field_serializer("status")
+    def serialize_status(self, value: ResponseStatus) -> str:
+        """Serializa o status pelo valor, mantendo o enum no atributo.
+
+        Args:
+            value: Status da resposta.
+
+        Returns:
+            Valor string do enum.
+        """
+        return value.value
 
 
 class AgentMetrics(BaseModel):
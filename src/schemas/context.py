@@ -7,8 +7,12 @@ including modes, window tracking, reduction results, and metrics.
 
 from datetime import datetime, timezone
 from enum import Enum
+from functools import partial
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, field_serializer, model_validator
+
+# Shared default factory for the timestamp fields below.
+_get_utc_now = partial(datetime.now, timezone.utc)
 
 
 class ContextMode(str, Enum):
@@ -47,10 +51,10 @@ class ContextWindow(BaseModel):
         description="Percentage of context window utilization",
     )
     last_updated: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Timestamp of last update"
+        default_factory=_get_utc_now, description="Timestamp of last update"
     )
 
-    model_config = {"use_enum_values": True, "json_schema_extra": {
+    model_config = {"json_schema_extra": {
         "examples": [
             {
                 "total_tokens": 45000,
@@ -88,7 +92,7 @@ class ContextOffloadItem(BaseModel):
     content: str = Field(..., description="The content that was offloaded")
     token_count: int = Field(..., ge=0, description="Number of tokens in offloaded content")
     offloaded_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Timestamp when offloaded"
+        default_factory=_get_utc_now, description="Timestamp when offloaded"
     )
     storage_path: str | None = Field(
         None, description="Path or reference to storage location"
@@ -100,7 +104,7 @@ class ContextOffloadItem(BaseModel):
         description="Score indicating likelihood of retrieval need",
     )
 
-    model_config = {"use_enum_values": True, "json_schema_extra": {
+    model_config = {"json_schema_extra": {
         "examples": [
             {
                 "id": "offload_123",
@@ -136,10 +140,10 @@ class ContextReductionResult(BaseModel):
         ..., description="Strategy used for context reduction"
     )
     processed_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Timestamp of reduction"
+        default_factory=_get_utc_now, description="Timestamp of reduction"
     )
 
-    model_config = {"use_enum_values": True, "json_schema_extra": {
+    model_config = {"json_schema_extra": {
         "examples": [
             {
                 "original_tokens": 95000,
@@ -195,10 +199,15 @@ class ContextMetrics(BaseModel):
         None, description="Most recent reduction result"
     )
     metrics_collected_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Timestamp of metrics collection"
+        default_factory=_get_utc_now, description="Timestamp of metrics collection"
     )
 
-    model_config = {"use_enum_values": True, "json_schema_extra": {
+    @field_serializer("mode")
+    def serialize_mode(self, value: ContextMode) -> str:
+        """Dump the mode as its string value."""
+        return value.value
+
+    model_config = {"json_schema_extra": {
         "examples": [
             {
                 "mode": "active",
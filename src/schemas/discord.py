@@ -6,10 +6,92 @@ users, messages, commands, attachments, channels, and guilds.
 """
 
 from datetime import datetime
-from enum import Enum
-from typing import Any
-
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, Final, Literal
+
+from annotated_types import Interval
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, TypeAdapter
+
+# Discord snowflakes are unsigned 64-bit integers. The API sends them as JSON
+# strings, which lax validation coerces to int; they are stored as int (smaller
+# and cheaper to hash than 18-20 digit strings) and written back as strings in
+# JSON output so JavaScript clients do not lose precision.
+Snowflake = Annotated[
+    int,
+    Interval(ge=0, lt=1 << 64),
+    PlainSerializer(str, return_type=str, when_used="json"),
+]
+
+
+# Documentation examples for the JSON schema, built once at import and shared
+# by reference from each model_config.
+_DISCORD_USER_EXAMPLE: Final[dict[str, Any]] = {
+    "id": "123456789012345678",
+    "username": "Agnaldo",
+    "discriminator": "0000",
+    "global_name": "Agnaldo Bot",
+    "avatar_hash": "a_hash_value",
+    "is_bot": True,
+    "is_system": False,
+    "public_flags": 0,
+}
+
+_DISCORD_ATTACHMENT_EXAMPLE: Final[dict[str, Any]] = {
+    "id": "987654321098765432",
+    "filename": "document.pdf",
+    "url": "https://cdn.discordapp.com/attachments/...",
+    "proxy_url": "https://media.discordapp.net/attachments/...",
+    "size": 1048576,
+    "content_type": "application/pdf",
+    "description": "Project documentation",
+    "ephemeral": False,
+}
+
+_DISCORD_MESSAGE_EXAMPLE: Final[dict[str, Any]] = {
+    "id": "111222333444555666",
+    "channel_id": "777888999000111222",
+    "guild_id": "333444555666777888",
+    "author": {"id": "123456789012345678", "username": "User", "is_bot": False},
+    "content": "Hello, Agnaldo!",
+    "timestamp": "2026-02-17T12:00:00Z",
+    "attachments": [],
+    "pinned": False,
+    "type": 0,
+}
+
+_DISCORD_COMMAND_EXAMPLE: Final[dict[str, Any]] = {
+    "id": "999888777666555444",
+    "type": "chat_input",
+    "application_id": "111222333444555666",
+    "name": "ask",
+    "description": "Ask Agnaldo a question",
+    "options": [],
+    "default_permission": True,
+    "version": "1.0.0",
+}
+
+_DISCORD_CHANNEL_EXAMPLE: Final[dict[str, Any]] = {
+    "id": "777888999000111222",
+    "type": "guild_text",
+    "guild_id": "333444555666777888",
+    "position": 0,
+    "name": "general",
+    "topic": "General discussion",
+    "nsfw": False,
+    "rate_limit_per_user": 0,
+}
+
+_DISCORD_GUILD_EXAMPLE: Final[dict[str, Any]] = {
+    "id": "333444555666777888",
+    "name": "Agnaldo's Server",
+    "icon_hash": "icon_hash_value",
+    "owner_id": "123456789012345678",
+    "afk_timeout": 300,
+    "verification_level": 0,
+    "default_message_notifications": 0,
+    "explicit_content_filter": 0,
+    "premium_tier": 1,
+    "member_count": 150,
+}
 
 
 class DiscordEmbed(BaseModel):
@@ -21,12 +103,62 @@ class DiscordEmbed(BaseModel):
     url: str | None = None
 
 
+class DiscordEmoji(BaseModel):
+    """Typed representation for emojis used in reactions."""
+
+    id: Snowflake | None = None
+    name: str | None = None
+    animated: bool = False
+
+
+class DiscordGuildEmoji(DiscordEmoji):
+    """Typed representation for custom emojis registered in a guild."""
+
+    roles: tuple[Snowflake, ...] = ()
+    require_colons: bool = True
+    managed: bool = False
+    available: bool = True
+
+
+class DiscordRole(BaseModel):
+    """Typed representation for guild roles."""
+
+    id: Snowflake
+    name: str
+    color: int = 0
+    hoist: bool = False
+    position: int = 0
+    permissions: str = "0"
+    managed: bool = False
+    mentionable: bool = False
+
+
+class DiscordMessageReference(BaseModel):
+    """Typed representation for the message a reply or crosspost points to."""
+
+    message_id: Snowflake | None = None
+    channel_id: Snowflake | None = None
+    guild_id: Snowflake | None = None
+    fail_if_not_exists: bool = True
+
+
+class DiscordCommandOption(BaseModel):
+    """Typed representation for slash command options."""
+
+    type: int
+    name: str
+    description: str = ""
+    required: bool = False
+    choices: tuple[dict[str, str | int | float], ...] = ()
+    options: tuple["DiscordCommandOption", ...] = ()
+
+
 class DiscordReaction(BaseModel):
     """Typed representation for Discord reactions."""
 
-    emoji: dict[str, Any] = Field(default_factory=dict)
-    count: int = Field(default=0, ge=0)
-    me: bool = Field(default=False)
+    emoji: Annotated[DiscordEmoji, Field(default_factory=DiscordEmoji)]
+    count: Annotated[int, Interval(ge=0)] = 0
+    me: bool = False
 
 
 class DiscordUser(BaseModel):
@@ -44,35 +176,21 @@ class DiscordUser(BaseModel):
         created_at: Account creation timestamp.
     """
 
-    id: str = Field(..., description="Discord user ID (snowflake)")
-    username: str = Field(..., min_length=1, max_length=32, description="Discord username")
-    discriminator: str | None = Field(
-        None, description="User discriminator (legacy 4-digit tag)"
+    id: Annotated[Snowflake, Field(description="Discord user ID (snowflake)")]
+    username: Annotated[str, Field(min_length=1, max_length=32, description="Discord username")]
+    discriminator: Annotated[
+        str | None, Field(description="User discriminator (legacy 4-digit tag)")
+    ] = None
+    global_name: Annotated[str | None, Field(description="User's display name")] = None
+    avatar_hash: Annotated[str | None, Field(description="Hash for user's avatar")] = None
+    is_bot: Annotated[bool, Field(description="Whether the user is a bot")] = False
+    is_system: Annotated[bool, Field(description="Whether the user is a system user")] = False
+    public_flags: Annotated[int, Field(description="Public flags for the user")] = 0
+    created_at: Annotated[datetime | None, Field(description="Account creation timestamp")] = None
+
+    model_config = ConfigDict(
+        json_schema_extra={"examples": [_DISCORD_USER_EXAMPLE]},
     )
-    global_name: str | None = Field(None, description="User's display name")
-    avatar_hash: str | None = Field(None, description="Hash for user's avatar")
-    is_bot: bool = Field(default=False, description="Whether the user is a bot")
-    is_system: bool = Field(default=False, description="Whether the user is a system user")
-    public_flags: int = Field(default=0, description="Public flags for the user")
-    created_at: datetime | None = Field(None, description="Account creation timestamp")
-
-    model_config = {"use_enum_values": True}
-
-    class Config:
-        json_schema_extra = {
-            "examples": [
-                {
-                    "id": "123456789012345678",
-                    "username": "Agnaldo",
-                    "discriminator": "0000",
-                    "global_name": "Agnaldo Bot",
-                    "avatar_hash": "a_hash_value",
-                    "is_bot": True,
-                    "is_system": False,
-                    "public_flags": 0,
-                }
-            ]
-        }
 
 
 class DiscordAttachment(BaseModel):
@@ -91,34 +209,26 @@ class DiscordAttachment(BaseModel):
         height: Image height if applicable.
     """
 
-    id: str = Field(..., description="Attachment ID (snowflake)")
-    filename: str = Field(..., description="Original filename")
-    url: str = Field(..., description="URL to download the attachment")
-    proxy_url: str = Field(..., description="Proxied URL for the attachment")
-    size: int = Field(..., ge=0, description="Size in bytes")
-    content_type: str | None = Field(None, description="MIME type of the attachment")
-    description: str | None = Field(None, description="User-provided description (alt text)")
-    ephemeral: bool = Field(default=False, description="Whether attachment is ephemeral")
-    width: int | None = Field(None, ge=0, description="Image width if applicable")
-    height: int | None = Field(None, ge=0, description="Image height if applicable")
-
-    model_config = {"use_enum_values": True}
-
-    class Config:
-        json_schema_extra = {
-            "examples": [
-                {
-                    "id": "987654321098765432",
-                    "filename": "document.pdf",
-                    "url": "https://cdn.discordapp.com/attachments/...",
-                    "proxy_url": "https://media.discordapp.net/attachments/...",
-                    "size": 1048576,
-                    "content_type": "application/pdf",
-                    "description": "Project documentation",
-                    "ephemeral": False,
-                }
-            ]
-        }
+    id: Annotated[Snowflake, Field(description="Attachment ID (snowflake)")]
+    filename: Annotated[str, Field(description="Original filename")]
+    url: Annotated[str, Field(description="URL to download the attachment")]
+    proxy_url: Annotated[str, Field(description="Proxied URL for the attachment")]
+    size: Annotated[int, Interval(ge=0), Field(description="Size in bytes")]
+    content_type: Annotated[str | None, Field(description="MIME type of the attachment")] = None
+    description: Annotated[
+        str | None, Field(description="User-provided description (alt text)")
+    ] = None
+    ephemeral: Annotated[bool, Field(description="Whether attachment is ephemeral")] = False
+    width: Annotated[int | None, Interval(ge=0), Field(description="Image width if applicable")] = (
+        None
+    )
+    height: Annotated[
+        int | None, Interval(ge=0), Field(description="Image height if applicable")
+    ] = None
+
+    model_config = ConfigDict(
+        json_schema_extra={"examples": [_DISCORD_ATTACHMENT_EXAMPLE]},
+    )
 
 
 class DiscordMessage(BaseModel):
@@ -142,64 +252,33 @@ class DiscordMessage(BaseModel):
         message_reference: Reference if this is a reply.
     """
 
-    id: str = Field(..., description="Message ID (snowflake)")
-    channel_id: str = Field(..., description="Channel ID where message was sent")
-    guild_id: str | None = Field(None, description="Guild ID if in a guild")
-    author: DiscordUser = Field(..., description="Message author information")
-    content: str = Field(default="", description="Message content text")
-    timestamp: datetime = Field(..., description="Message creation timestamp")
-    edited_timestamp: datetime | None = Field(None, description="Timestamp of last edit")
-    tts: bool = Field(default=False, description="Whether this is a TTS message")
-    mention_everyone: bool = Field(
-        default=False, description="Whether @everyone was mentioned"
-    )
-    attachments: list[DiscordAttachment] = Field(
-        default_factory=list, description="Message attachments"
-    )
-    embeds: list[DiscordEmbed] = Field(default_factory=list, description="Message embeds")
-    reactions: list[DiscordReaction] = Field(
-        default_factory=list, description="Message reactions"
-    )
-    pinned: bool = Field(default=False, description="Whether the message is pinned")
-    type: int = Field(default=0, description="Message type integer")
-    message_reference: dict[str, Any] | None = Field(
-        None, description="Reference if this is a reply"
+    id: Annotated[Snowflake, Field(description="Message ID (snowflake)")]
+    channel_id: Annotated[Snowflake, Field(description="Channel ID where message was sent")]
+    guild_id: Annotated[Snowflake | None, Field(description="Guild ID if in a guild")] = None
+    author: Annotated[DiscordUser, Field(description="Message author information")]
+    content: Annotated[str, Field(description="Message content text")] = ""
+    timestamp: Annotated[datetime, Field(description="Message creation timestamp")]
+    edited_timestamp: Annotated[datetime | None, Field(description="Timestamp of last edit")] = None
+    tts: Annotated[bool, Field(description="Whether this is a TTS message")] = False
+    mention_everyone: Annotated[bool, Field(description="Whether @everyone was mentioned")] = False
+    attachments: Annotated[
+        tuple[DiscordAttachment, ...], Field(description="Message attachments")
+    ] = ()
+    embeds: Annotated[tuple[DiscordEmbed, ...], Field(description="Message embeds")] = ()
+    reactions: Annotated[tuple[DiscordReaction, ...], Field(description="Message reactions")] = ()
+    pinned: Annotated[bool, Field(description="Whether the message is pinned")] = False
+    type: Annotated[int, Field(description="Message type integer")] = 0
+    message_reference: Annotated[
+        DiscordMessageReference | None, Field(description="Reference if this is a reply")
+    ] = None
+
+    model_config = ConfigDict(
+        json_schema_extra={"examples": [_DISCORD_MESSAGE_EXAMPLE]},
     )
 
-    model_config = {"use_enum_values": True}
-
-    class Config:
-        json_schema_extra = {
-            "examples": [
-                {
-                    "id": "111222333444555666",
-                    "channel_id": "777888999000111222",
-                    "guild_id": "333444555666777888",
-                    "author": {"id": "123456789012345678", "username": "User", "is_bot": False},
-                    "content": "Hello, Agnaldo!",
-                    "timestamp": "2026-02-17T12:00:00Z",
-                    "attachments": [],
-                    "pinned": False,
-                    "type": 0,
-                }
-            ]
-        }
-
-
-class DiscordCommandType(str, Enum):
-    """Types of Discord commands."""
-
-    CHAT_INPUT = "chat_input"
-    """Slash command invoked from chat input."""
 
-    USER = "user"
-    """Context menu command on a user."""
-
-    MESSAGE = "message"
-    """Context menu command on a message."""
-
-    class Config:
-        use_enum_values = True
+DiscordCommandType = Literal["chat_input", "user", "message"]
+"""Types of Discord commands (slash command, user or message context menu)."""
 
 
 class DiscordCommand(BaseModel):
@@ -219,75 +298,50 @@ class DiscordCommand(BaseModel):
         updated_at: Last update timestamp.
     """
 
-    id: str = Field(..., description="Command ID (snowflake)")
-    type: DiscordCommandType = Field(
-        default=DiscordCommandType.CHAT_INPUT, description="Type of command"
-    )
-    application_id: str = Field(..., description="Application ID that created the command")
-    guild_id: str | None = Field(None, description="Guild ID if guild-specific")
-    name: str = Field(..., min_length=1, max_length=32, description="Command name")
-    description: str = Field(default="", description="Command description")
-    options: list[dict[str, Any]] = Field(
-        default_factory=list, description="Command options/parameters"
-    )
-    default_permission: bool = Field(
-        default=True, description="Whether enabled by default"
+    id: Annotated[Snowflake, Field(description="Command ID (snowflake)")]
+    type: Annotated[DiscordCommandType, Field(description="Type of command")] = "chat_input"
+    application_id: Annotated[
+        Snowflake, Field(description="Application ID that created the command")
+    ]
+    guild_id: Annotated[Snowflake | None, Field(description="Guild ID if guild-specific")] = None
+    name: Annotated[str, Field(min_length=1, max_length=32, description="Command name")]
+    description: Annotated[str, Field(description="Command description")] = ""
+    options: Annotated[
+        tuple[DiscordCommandOption, ...], Field(description="Command options/parameters")
+    ] = ()
+    default_permission: Annotated[bool, Field(description="Whether enabled by default")] = True
+    version: Annotated[str, Field(description="Command version identifier")]
+    created_at: Annotated[datetime | None, Field(description="Command creation timestamp")] = None
+    updated_at: Annotated[datetime | None, Field(description="Last update timestamp")] = None
+
+    model_config = ConfigDict(
+        json_schema_extra={"examples": [_DISCORD_COMMAND_EXAMPLE]},
     )
-    version: str = Field(..., description="Command version identifier")
-    created_at: datetime | None = Field(None, description="Command creation timestamp")
-    updated_at: datetime | None = Field(None, description="Last update timestamp")
-
-    model_config = {"use_enum_values": True}
-
-    class Config:
-        json_schema_extra = {
-            "examples": [
-                {
-                    "id": "999888777666555444",
-                    "type": "chat_input",
-                    "application_id": "111222333444555666",
-                    "name": "ask",
-                    "description": "Ask Agnaldo a question",
-                    "options": [],
-                    "default_permission": True,
-                    "version": "1.0.0",
-                }
-            ]
-        }
-
-
-class DiscordChannelType(str, Enum):
-    """Types of Discord channels."""
 
-    GUILD_TEXT = "guild_text"
-    """Text channel in a guild."""
 
-    GUILD_VOICE = "guild_voice"
-    """Voice channel in a guild."""
-
-    GUILD_CATEGORY = "guild_category"
-    """Category for organizing channels."""
-
-    DM = "dm"
-    """Direct message channel."""
-
-    GROUP_DM = "group_dm"
-    """Group direct message channel."""
-
-    GUILD_NEWS = "guild_news"
-    """News/announcement channel."""
-
-    GUILD_NEWS_THREAD = "guild_news_thread"
-    """Thread in a news channel."""
-
-    GUILD_PUBLIC_THREAD = "guild_public_thread"
-    """Public thread in a text channel."""
-
-    GUILD_PRIVATE_THREAD = "guild_private_thread"
-    """Private thread in a text channel."""
-
-    class Config:
-        use_enum_values = True
+DiscordChannelType = Literal[
+    "guild_text",
+    "guild_voice",
+    "guild_category",
+    "dm",
+    "group_dm",
+    "guild_news",
+    "guild_news_thread",
+    "guild_public_thread",
+    "guild_private_thread",
+]
+"""Types of Discord channels.
+
+- ``guild_text``: Text channel in a guild.
+- ``guild_voice``: Voice channel in a guild.
+- ``guild_category``: Category for organizing channels.
+- ``dm``: Direct message channel.
+- ``group_dm``: Group direct message channel.
+- ``guild_news``: News/announcement channel.
+- ``guild_news_thread``: Thread in a news channel.
+- ``guild_public_thread``: Public thread in a text channel.
+- ``guild_private_thread``: Private thread in a text channel.
+"""
 
 
 class DiscordChannel(BaseModel):
@@ -309,37 +363,27 @@ class DiscordChannel(BaseModel):
         created_at: Channel creation timestamp.
     """
 
-    id: str = Field(..., description="Channel ID (snowflake)")
-    type: DiscordChannelType = Field(..., description="Channel type")
-    guild_id: str | None = Field(None, description="Guild ID if in a guild")
-    position: int | None = Field(None, description="Sorting position")
-    name: str | None = Field(None, max_length=100, description="Channel name")
-    topic: str | None = Field(None, max_length=1024, description="Channel topic")
-    nsfw: bool = Field(default=False, description="Whether channel is NSFW")
-    last_message_id: str | None = Field(None, description="ID of last message")
-    bitrate: int | None = Field(None, ge=0, description="Voice channel bitrate")
-    user_limit: int | None = Field(None, ge=0, description="Voice channel user limit")
-    rate_limit_per_user: int = Field(default=0, ge=0, description="Slowmode delay")
-    parent_id: str | None = Field(None, description="Category parent ID")
-    created_at: datetime | None = Field(None, description="Channel creation timestamp")
-
-    model_config = {"use_enum_values": True}
-
-    class Config:
-        json_schema_extra = {
-            "examples": [
-                {
-                    "id": "777888999000111222",
-                    "type": "guild_text",
-                    "guild_id": "333444555666777888",
-                    "position": 0,
-                    "name": "general",
-                    "topic": "General discussion",
-                    "nsfw": False,
-                    "rate_limit_per_user": 0,
-                }
-            ]
-        }
+    id: Annotated[Snowflake, Field(description="Channel ID (snowflake)")]
+    type: Annotated[DiscordChannelType, Field(description="Channel type")]
+    guild_id: Annotated[Snowflake | None, Field(description="Guild ID if in a guild")] = None
+    position: Annotated[int | None, Field(description="Sorting position")] = None
+    name: Annotated[str | None, Field(max_length=100, description="Channel name")] = None
+    topic: Annotated[str | None, Field(max_length=1024, description="Channel topic")] = None
+    nsfw: Annotated[bool, Field(description="Whether channel is NSFW")] = False
+    last_message_id: Annotated[Snowflake | None, Field(description="ID of last message")] = None
+    bitrate: Annotated[int | None, Interval(ge=0), Field(description="Voice channel bitrate")] = (
+        None
+    )
+    user_limit: Annotated[
+        int | None, Interval(ge=0), Field(description="Voice channel user limit")
+    ] = None
+    rate_limit_per_user: Annotated[int, Interval(ge=0), Field(description="Slowmode delay")] = 0
+    parent_id: Annotated[Snowflake | None, Field(description="Category parent ID")] = None
+    created_at: Annotated[datetime | None, Field(description="Channel creation timestamp")] = None
+
+    model_config = ConfigDict(
+        json_schema_extra={"examples": [_DISCORD_CHANNEL_EXAMPLE]},
+    )
 
 
 class DiscordGuild(BaseModel):
@@ -369,48 +413,101 @@ class DiscordGuild(BaseModel):
         created_at: Guild creation timestamp.
     """
 
-    id: str = Field(..., description="Guild ID (snowflake)")
-    name: str = Field(..., min_length=1, max_length=100, description="Guild name")
-    icon_hash: str | None = Field(None, description="Hash for guild icon")
-    description: str | None = Field(None, description="Guild description")
-    splash_hash: str | None = Field(None, description="Hash for splash image")
-    owner_id: str = Field(..., description="Owner user ID")
-    region: str | None = Field(None, description="Voice region (deprecated)")
-    afk_channel_id: str | None = Field(None, description="AFK voice channel ID")
-    afk_timeout: int = Field(default=300, ge=0, description="AFK timeout in seconds")
-    verification_level: int = Field(default=0, ge=0, le=4, description="Verification level")
-    default_message_notifications: int = Field(
-        default=0, description="Default notification level"
+    id: Annotated[Snowflake, Field(description="Guild ID (snowflake)")]
+    name: Annotated[str, Field(min_length=1, max_length=100, description="Guild name")]
+    icon_hash: Annotated[str | None, Field(description="Hash for guild icon")] = None
+    description: Annotated[str | None, Field(description="Guild description")] = None
+    splash_hash: Annotated[str | None, Field(description="Hash for splash image")] = None
+    owner_id: Annotated[Snowflake, Field(description="Owner user ID")]
+    region: Annotated[str | None, Field(description="Voice region (deprecated)")] = None
+    afk_channel_id: Annotated[Snowflake | None, Field(description="AFK voice channel ID")] = None
+    afk_timeout: Annotated[int, Interval(ge=0), Field(description="AFK timeout in seconds")] = 300
+    verification_level: Annotated[
+        int, Interval(ge=0, le=4), Field(description="Verification level")
+    ] = 0
+    default_message_notifications: Annotated[
+        int, Field(description="Default notification level")
+    ] = 0
+    explicit_content_filter: Annotated[
+        int, Interval(ge=0, le=2), Field(description="Explicit content filter level")
+    ] = 0
+    roles: Annotated[tuple[DiscordRole, ...], Field(description="Guild roles")] = ()
+    emojis: Annotated[tuple[DiscordGuildEmoji, ...], Field(description="Guild emojis")] = ()
+    features: Annotated[tuple[str, ...], Field(description="Guild features")] = ()
+    mfa_level: Annotated[int, Interval(ge=0, le=1), Field(description="Required MFA level")] = 0
+    application_id: Annotated[
+        Snowflake | None, Field(description="Application ID if bot creator")
+    ] = None
+    system_channel_id: Annotated[Snowflake | None, Field(description="System channel ID")] = None
+    premium_tier: Annotated[int, Interval(ge=0, le=3), Field(description="Server boost level")] = 0
+    member_count: Annotated[
+        int | None, Interval(ge=0), Field(description="Approximate member count")
+    ] = None
+    created_at: Annotated[datetime | None, Field(description="Guild creation timestamp")] = None
+
+    model_config = ConfigDict(
+        json_schema_extra={"examples": [_DISCORD_GUILD_EXAMPLE]},
     )
-    explicit_content_filter: int = Field(
-        default=0, ge=0, le=2, description="Explicit content filter level"
-    )
-    roles: list[dict[str, Any]] = Field(default_factory=list, description="Guild roles")
-    emojis: list[dict[str, Any]] = Field(default_factory=list, description="Guild emojis")
-    features: list[str] = Field(default_factory=list, description="Guild features")
-    mfa_level: int = Field(default=0, ge=0, le=1, description="Required MFA level")
-    application_id: str | None = Field(None, description="Application ID if bot creator")
-    system_channel_id: str | None = Field(None, description="System channel ID")
-    premium_tier: int = Field(default=0, ge=0, le=3, description="Server boost level")
-    member_count: int | None = Field(None, ge=0, description="Approximate member count")
-    created_at: datetime | None = Field(None, description="Guild creation timestamp")
-
-    model_config = {"use_enum_values": True}
-
-    class Config:
-        json_schema_extra = {
-            "examples": [
-                {
-                    "id": "333444555666777888",
-                    "name": "Agnaldo's Server",
-                    "icon_hash": "icon_hash_value",
-                    "owner_id": "123456789012345678",
-                    "afk_timeout": 300,
-                    "verification_level": 0,
-                    "default_message_notifications": 0,
-                    "explicit_content_filter": 0,
-                    "premium_tier": 1,
-                    "member_count": 150,
-                }
-            ]
-        }
+
+
+# Reusable validators for payloads that are not a single model instance.
+# Building them once keeps list validation inside pydantic-core instead of
+# looping over ``DiscordMessage.model_validate`` in Python.
+MESSAGE_ADAPTER: Final = TypeAdapter(DiscordMessage)
+MESSAGE_LIST_ADAPTER: Final = TypeAdapter(list[DiscordMessage])
+USER_ADAPTER: Final = TypeAdapter(DiscordUser)
+CHANNEL_ADAPTER: Final = TypeAdapter(DiscordChannel)
+
+
+def validate_message(raw: bytes | str | dict[str, Any]) -> DiscordMessage:
+    """Validate a single Discord message payload.
+
+    Raw JSON goes straight to pydantic-core, which parses the timestamp
+    strings into ``datetime`` while reading the document instead of after a
+    separate ``json.loads``.
+
+    Args:
+        raw: Raw JSON object (bytes or str) or already-decoded message dict.
+
+    Returns:
+        The validated message.
+
+    Raises:
+        pydantic.ValidationError: If the message is invalid.
+    """
+    if isinstance(raw, (bytes, str)):
+        return MESSAGE_ADAPTER.validate_json(raw)
+    return MESSAGE_ADAPTER.validate_python(raw)
+
+
+def validate_messages(raw: bytes | str | list[dict[str, Any]]) -> list[DiscordMessage]:
+    """Validate a batch of Discord messages in a single call.
+
+    Args:
+        raw: Raw JSON array (bytes or str) or already-decoded list of message dicts.
+
+    Returns:
+        Validated messages, in payload order.
+
+    Raises:
+        pydantic.ValidationError: If any message is invalid.
+    """
+    if isinstance(raw, (bytes, str)):
+        return MESSAGE_LIST_ADAPTER.validate_json(raw)
+    return MESSAGE_LIST_ADAPTER.validate_python(raw)
+
+
+def dump_messages_json(messages: list[DiscordMessage]) -> bytes:
+    """Serialize a batch of Discord messages to a JSON array.
+
+    Prefer this over ``json.dumps([m.model_dump() for m in messages])``: the
+    adapter writes JSON directly in pydantic-core without building the
+    intermediate dicts.
+
+    Args:
+        messages: Messages to serialize.
+
+    Returns:
+        UTF-8 encoded JSON array, in input order.
+    """
+    return MESSAGE_LIST_ADAPTER.dump_json(messages)
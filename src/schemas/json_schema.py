@@ -0,0 +1,32 @@
+"""Cached JSON schemas for the Pydantic models in this package.
+
+``model_json_schema()`` walks every field, description and example each
+time it is called. The schemas never change at runtime, so they are built
+once per model and mode and reused.
+"""
+
+from functools import cache
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+
+@cache
+def json_schema_for(
+    model: type[BaseModel],
+    mode: Literal["validation", "serialization"] = "validation",
+) -> dict[str, Any]:
+    """Return the JSON schema for a model, generating it only on first use.
+
+    The returned dict is shared between callers and must be treated as
+    read-only; copy it before modifying.
+
+    Args:
+        model: Pydantic model class.
+        mode: Whether to describe the input (validation) or output
+            (serialization) shape.
+
+    Returns:
+        The model's JSON schema.
+    """
+    return model.model_json_schema(mode=mode)
@@ -3,10 +3,28 @@
 This module defines schemas for legal document ingestion and RAG operations.
 """
 
-from datetime import datetime
-from typing import Any
+import sys
+from operator import attrgetter
+from typing import Annotated, Any, Final
 
-from pydantic import BaseModel, Field
+from annotated_types import Interval
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter, computed_field
+
+_get_record_fields = attrgetter("content", "category", "archival_metadata")
+
+# Categorias, áreas e fontes vêm de um conjunto pequeno de valores repetidos
+# em milhares de chunks; internar faz todas as instâncias compartilharem o
+# mesmo objeto str.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Valores usados quando um registro arquivado não traz a fonte ou a área.
+_METADATA_FALLBACK: Final[dict[str, str]] = {
+    "fonte": "Fonte desconhecida",
+    "area_direito": "não informada",
+}
+
+# Categoria usada quando ``archival_memories.category`` é NULL.
+_CATEGORY_FALLBACK: Final = "sem_categoria"
 
 
 class LegalPDFMetadata(BaseModel):
@@ -21,12 +39,12 @@ class LegalPDFMetadata(BaseModel):
         pagina_final: Página final (se aplicável)
     """
 
-    fonte: str = Field(..., description="Nome da fonte jurídica")
-    autor: str | None = Field(None, description="Autor da obra (para doutrina)")
-    area_direito: str = Field(..., description="Área do direito")
-    ano_vigencia: int | None = Field(None, description="Ano de vigência ou publicação")
-    pagina_inicial: int | None = Field(None, description="Página inicial do documento")
-    pagina_final: int | None = Field(None, description="Página final do documento")
+    fonte: Annotated[InternedStr, Field(description="Nome da fonte jurídica")]
+    autor: Annotated[str | None, Field(description="Autor da obra (para doutrina)")] = None
+    area_direito: Annotated[InternedStr, Field(description="Área do direito")]
+    ano_vigencia: Annotated[int | None, Field(description="Ano de vigência ou publicação")] = None
+    pagina_inicial: Annotated[int | None, Field(description="Página inicial do documento")] = None
+    pagina_final: Annotated[int | None, Field(description="Página final do documento")] = None
 
 
 class LegalDocumentChunk(BaseModel):
@@ -42,10 +60,12 @@ class LegalDocumentChunk(BaseModel):
 
     content: str
     metadata: LegalPDFMetadata
-    category: str  # legal_legislacao, legal_doutrina, etc
+    category: InternedStr  # legal_legislacao, legal_doutrina, etc
     chunk_index: int
     total_chunks: int
 
+    model_config = ConfigDict(frozen=True)
+
 
 class IngestionResult(BaseModel):
     """Resultado da ingestão de PDF jurídico.
@@ -63,7 +83,7 @@ class IngestionResult(BaseModel):
     category: str
     total_chunks: int
     chunks_inserted: int
-    errors: list[str] = Field(default_factory=list)
+    errors: tuple[str, ...] = ()
     duration_seconds: float | None = None
 
 
@@ -79,23 +99,102 @@ class RAGSearchResult(BaseModel):
     """
 
     content: str
-    similarity: float = Field(..., ge=0.0, le=1.0)
-    category: str
-    metadata: dict[str, Any]
-    source: str
+    similarity: Annotated[float, Interval(ge=0.0, le=1.0)]
+    category: InternedStr
+    metadata: LegalPDFMetadata
+
+    # ``source`` é derivado de ``metadata.fonte``; ``extra="forbid"`` impede que
+    # um ``source=`` passado ao construtor seja descartado em silêncio.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def source(self) -> str:
+        """Fonte do documento, lida dos metadados."""
+        return self.metadata.fonte
+
+    @staticmethod
+    def metadata_from_archival(archival_metadata: dict[str, Any] | None) -> dict[str, Any]:
+        """Completa metadados arquivados com valores padrão para registros antigos.
+
+        Chaves extras gravadas na ingestão (``chunk_index``, ``ingested_at``...)
+        são ignoradas por ``LegalPDFMetadata``. Valores ``None`` gravados são
+        tratados como ausentes e não sobrescrevem o padrão.
+        """
+        if not archival_metadata:
+            return dict(_METADATA_FALLBACK)
+        stored = {key: value for key, value in archival_metadata.items() if value is not None}
+        return {**_METADATA_FALLBACK, **stored}
 
     @classmethod
     def from_db_record(cls, record: Any) -> "RAGSearchResult":
-        """Cria resultado a partir de um registro do banco."""
-        metadata = record.archival_metadata or {}
-        return cls(
-            content=record.content,
+        """Cria resultado a partir de um registro do banco.
+
+        O registro vem do nosso próprio banco (``ArchivalMemory``), já validado
+        na ingestão; por isso usa ``model_construct`` e não revalida os campos.
+        """
+        content, category, archival_metadata = _get_record_fields(record)
+        if category is None:
+            category = _CATEGORY_FALLBACK
+        metadata = cls.metadata_from_archival(archival_metadata)
+        fonte, area_direito = metadata["fonte"], metadata["area_direito"]
+        if isinstance(fonte, str) and isinstance(area_direito, str):
+            metadata["fonte"] = sys.intern(fonte)
+            metadata["area_direito"] = sys.intern(area_direito)
+            legal_metadata = LegalPDFMetadata.model_construct(**metadata)
+        else:
+            # Metadados fora do formato da ingestão: valida para falhar com
+            # ValidationError, como os chamadores esperam.
+            legal_metadata = LegalPDFMetadata.model_validate(metadata)
+        return cls.model_construct(
+            content=content,
             similarity=metadata.get("similarity", 0.0),
-            category=record.category,
-            metadata=metadata,
-            source=metadata.get("fonte", "Fonte desconhecida"),
+            category=sys.intern(category),
+            metadata=legal_metadata,
         )
 
+    @classmethod
+    def from_db_records(cls, records: list[Any]) -> list["RAGSearchResult"]:
+        """Cria e valida vários resultados em uma única chamada ao pydantic-core.
+
+        Args:
+            records: Registros ``ArchivalMemory`` (acesso por atributo).
+
+        Returns:
+            Resultados na mesma ordem dos registros.
+        """
+        rows = []
+        for record in records:
+            content, category, archival_metadata = _get_record_fields(record)
+            metadata = cls.metadata_from_archival(archival_metadata)
+            rows.append(
+                {
+                    "content": content,
+                    "similarity": metadata.get("similarity", 0.0),
+                    "category": _CATEGORY_FALLBACK if category is None else category,
+                    "metadata": metadata,
+                }
+            )
+        return RAG_RESULTS_ADAPTER.validate_python(rows)
+
+    @classmethod
+    def dump_list_json(cls, results: list["RAGSearchResult"]) -> bytes:
+        """Serializa vários resultados como um array JSON.
+
+        Prefira este método a ``json.dumps([r.model_dump() for r in results])``:
+        o adapter escreve o JSON direto no pydantic-core, sem dicts intermediários.
+
+        Args:
+            results: Resultados a serializar.
+
+        Returns:
+            Array JSON codificado em UTF-8, na ordem recebida.
+        """
+        return RAG_RESULTS_ADAPTER.dump_json(results)
+
+
+RAG_RESULTS_ADAPTER: Final = TypeAdapter(list[RAGSearchResult])
+
 
 class StudyAgentRequest(BaseModel):
     """Request para Study Agent.
@@ -110,11 +209,11 @@ class StudyAgentRequest(BaseModel):
 
     question: str
     user_id: str
-    category_filter: str | None = Field(
-        None, description="Filtro opcional por categoria (legal_legislacao, etc)"
-    )
-    max_results: int = Field(5, ge=1, le=10)
-    threshold: float = Field(0.7, ge=0.0, le=1.0)
+    category_filter: Annotated[
+        str | None, Field(description="Filtro opcional por categoria (legal_legislacao, etc)")
+    ] = None
+    max_results: Annotated[int, Interval(ge=1, le=10)] = 5
+    threshold: Annotated[float, Interval(ge=0.0, le=1.0)] = 0.7
 
 
 class StudyAgentResponse(BaseModel):
@@ -130,6 +229,6 @@ class StudyAgentResponse(BaseModel):
 
     answer: str
     sources: list[str]
-    confidence: float = Field(..., ge=0.0, le=1.0)
+    confidence: Annotated[float, Interval(ge=0.0, le=1.0)]
     didactic_content: str | None = None
     uncertainty: bool = False
@@ -5,11 +5,23 @@ This module defines Pydantic v2 schemas for memory tier management,
 including core, recall, and archival memory items with search and stats.
 """
 
+import base64
+import binascii
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from functools import partial
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field, model_validator
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+from pydantic.json_schema import SkipJsonSchema
+
+from src.utils.ranking import cosine_topk
+
+# Default factory for timestamp fields (UTC).
+_get_utc_now = partial(datetime.now, timezone.utc)
 
 
 class MemoryTier(str, Enum):
@@ -25,9 +37,41 @@ class MemoryTier(str, Enum):
     """Long-term storage for infrequently accessed content."""
 
 
+# Plain-string form of ``MemoryTier`` for model fields: validated as a literal
+# string, no enum lookup per instance. ``MemoryTier`` members are accepted too.
+MemoryTierName = Literal["core", "recall", "archival"]
+
+
+def quantize_embedding(embedding: Sequence[float]) -> tuple[bytes, float]:
+    """Quantize an embedding to int8 with a single per-vector scale.
+
+    Args:
+        embedding: Float embedding.
+
+    Returns:
+        The int8 values as bytes and the scale (``max(|v|) / 127``).
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    max_abs = float(np.abs(vector).max()) if vector.size else 0.0
+    if max_abs == 0.0:
+        return np.zeros(vector.size, dtype=np.int8).tobytes(), 0.0
+    q = np.clip(np.round(vector / max_abs * 127), -128, 127).astype(np.int8)
+    return q.tobytes(), max_abs / 127
+
+
+def dequantize_embedding(q8: bytes, scale: float) -> npt.NDArray[np.float32]:
+    """Rebuild a float32 embedding from :func:`quantize_embedding` output."""
+    vector = np.frombuffer(q8, dtype=np.int8).astype(np.float32)
+    vector *= np.float32(scale)
+    return vector
+
+
 class CoreMemoryItem(BaseModel):
     """Item stored in core memory tier.
 
+    Unlike the other memory models this one is not frozen: ``CoreMemory``
+    updates cached items in place on every access.
+
     Attributes:
         id: Unique identifier for the memory item.
         content: The content stored in core memory.
@@ -36,8 +80,10 @@ class CoreMemoryItem(BaseModel):
         last_accessed: Timestamp of last access.
         created_at: Timestamp when the item was created.
         metadata: Additional metadata associated with the item.
+        kind: Discriminator tag used by ``MemorySearchResult.results``.
     """
 
+    kind: Literal["core"] = "core"
     id: str = Field(..., description="Unique identifier for the memory item")
     content: str = Field(..., description="The content stored in core memory")
     importance: float = Field(
@@ -53,25 +99,20 @@ class CoreMemoryItem(BaseModel):
         None, description="Timestamp of last access"
     )
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Creation timestamp"
+        default_factory=_get_utc_now, description="Creation timestamp"
     )
     metadata: dict[str, Any] = Field(
         default_factory=dict, description="Additional metadata"
     )
 
-    model_config = {"use_enum_values": True, "json_schema_extra": {
-        "examples": [
-            {
-                "id": "core_mem_001",
-                "content": "User prefers concise responses",
-                "importance": 0.9,
-                "access_count": 42,
-                "last_accessed": "2026-02-17T12:00:00Z",
-                "created_at": "2026-02-15T08:00:00Z",
-                "metadata": {"source": "conversation", "user_id": "123"},
-            }
-        ]
-    }}
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "CoreMemoryItem":
+        """Build an item from a trusted database row without re-validating it.
+
+        Rows were validated when they were written, so this uses
+        ``model_construct``. Keys must already match the field names.
+        """
+        return cls.model_construct(**row)
 
 
 class RecallMemoryItem(BaseModel):
@@ -84,20 +125,26 @@ class RecallMemoryItem(BaseModel):
         message_id: Original message identifier if applicable.
         timestamp: Original message/contribution timestamp.
         embedding: Vector embedding for semantic search.
+        embedding_q8: int8-quantized embedding bytes, for compact storage.
+        embedding_scale: Scale that maps ``embedding_q8`` back to floats.
         relevance_score: Relevance score for current context.
         created_at: Timestamp when the item was stored.
+        kind: Discriminator tag used by ``MemorySearchResult.results``.
     """
 
+    kind: Literal["recall"] = "recall"
     id: str = Field(..., description="Unique identifier for the memory item")
     content: str = Field(..., description="The content stored in recall memory")
     conversation_id: str = Field(..., description="Associated conversation identifier")
     message_id: str | None = Field(None, description="Original message identifier")
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Original content timestamp"
+        default_factory=_get_utc_now, description="Original content timestamp"
     )
     embedding: list[float] | None = Field(
         None, description="Vector embedding for semantic search"
     )
+    embedding_q8: bytes | None = Field(None, description="int8-quantized embedding")
+    embedding_scale: float | None = Field(None, description="Dequantization scale")
     relevance_score: float = Field(
         default=0.5,
         ge=0.0,
@@ -105,23 +152,35 @@ class RecallMemoryItem(BaseModel):
         description="Relevance score for current context",
     )
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Storage timestamp"
+        default_factory=_get_utc_now, description="Storage timestamp"
     )
 
-    model_config = {"use_enum_values": True, "json_schema_extra": {
-        "examples": [
-            {
-                "id": "recall_mem_001",
-                "content": "Previous discussion about API authentication",
-                "conversation_id": "conv_123",
-                "message_id": "msg_456",
-                "timestamp": "2026-02-16T14:30:00Z",
-                "embedding": None,
-                "relevance_score": 0.85,
-                "created_at": "2026-02-16T14:30:00Z",
-            }
-        ]
-    }}
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "RecallMemoryItem":
+        """Build an item from a trusted database row; see :meth:`CoreMemoryItem.from_row`."""
+        return cls.model_construct(**row)
+
+    def quantized(self) -> "RecallMemoryItem":
+        """Return a copy storing the embedding as int8 instead of floats.
+
+        Returns the item unchanged when it has no float embedding.
+        """
+        if self.embedding is None:
+            return self
+        q8, scale = quantize_embedding(self.embedding)
+        return self.model_copy(
+            update={"embedding": None, "embedding_q8": q8, "embedding_scale": scale}
+        )
+
+    def embedding_array(self) -> np.ndarray | None:
+        """Return the embedding as float32, dequantizing ``embedding_q8`` if needed."""
+        if self.embedding is not None:
+            return np.asarray(self.embedding, dtype=np.float32)
+        if self.embedding_q8 is not None and self.embedding_scale is not None:
+            return dequantize_embedding(self.embedding_q8, self.embedding_scale)
+        return None
 
 
 class ArchivalMemoryItem(BaseModel):
@@ -136,37 +195,63 @@ class ArchivalMemoryItem(BaseModel):
         tags: Tags for categorization and retrieval.
         created_at: Timestamp when the item was archived.
         last_accessed: Timestamp of last access if any.
+        kind: Discriminator tag used by ``MemorySearchResult.results``.
     """
 
+    kind: Literal["archival"] = "archival"
     id: str = Field(..., description="Unique identifier for the memory item")
     content: str = Field(..., description="The content stored in archival memory")
-    tier: MemoryTier = Field(
-        default=MemoryTier.ARCHIVAL, description="Memory tier classification"
-    )
+    tier: MemoryTierName = Field(default="archival", description="Memory tier classification")
     compressed: bool = Field(
         default=False, description="Whether content is compressed"
     )
     storage_location: str = Field(..., description="Physical or logical storage location")
     tags: list[str] = Field(default_factory=list, description="Tags for categorization")
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Archive timestamp"
+        default_factory=_get_utc_now, description="Archive timestamp"
     )
     last_accessed: datetime | None = Field(None, description="Timestamp of last access")
 
-    model_config = {"use_enum_values": True, "json_schema_extra": {
-        "examples": [
-            {
-                "id": "archive_mem_001",
-                "content": "Historical conversation from 2025-01-15...",
-                "tier": "archival",
-                "compressed": True,
-                "storage_location": "s3://agnaldo-archive/2025/01/",
-                "tags": ["historical", "q1_2025"],
-                "created_at": "2025-01-15T10:00:00Z",
-                "last_accessed": None,
-            }
-        ]
-    }}
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "ArchivalMemoryItem":
+        """Build an item from a trusted database row; see :meth:`CoreMemoryItem.from_row`."""
+        return cls.model_construct(**row)
+
+
+def encode_cursor(created_at: datetime, item_id: str) -> str:
+    """Encode a keyset pagination cursor from the last row of a page.
+
+    Args:
+        created_at: ``created_at`` of the last returned row.
+        item_id: ``id`` of the last returned row.
+
+    Returns:
+        Opaque URL-safe cursor string.
+    """
+    raw = f"{created_at.isoformat()}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        created_at, item_id = base64.urlsafe_b64decode(cursor).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), item_id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+# Tagged union: pydantic reads ``kind`` and validates each item against a single
+# model instead of trying every member in turn. Raw dicts must carry ``kind``.
+MemoryItem = Annotated[
+    CoreMemoryItem | RecallMemoryItem | ArchivalMemoryItem, Field(discriminator="kind")
+]
 
 
 class MemorySearchResult(BaseModel):
@@ -181,38 +266,111 @@ class MemorySearchResult(BaseModel):
         total_pages: Total number of pages available.
         has_next: Whether there is a next page.
         has_previous: Whether there is a previous page.
+        cursor: Keyset cursor this page was fetched after, if any.
+        next_cursor: Cursor for the following page; ``None`` on the last page.
+            ``ArchivalMemory.search_page_by_metadata`` returns it with each page.
         searched_at: Timestamp of the search operation.
+        embeddings: Optional ``(len(results), dim)`` float32 matrix holding the
+            result embeddings contiguously. When set, the items' own
+            ``embedding`` is ``None``. Not serialized.
     """
 
     query: str = Field(..., description="The search query used")
-    results: list[CoreMemoryItem | RecallMemoryItem | ArchivalMemoryItem] = Field(
-        default_factory=list, description="Matching memory items"
-    )
+    results: list[MemoryItem] = Field(default_factory=list, description="Matching memory items")
     total_results: int = Field(..., ge=0, description="Total count of matching items")
     page: int = Field(default=1, ge=1, description="Current page number (1-indexed)")
     page_size: int = Field(default=10, ge=1, description="Results per page")
     total_pages: int = Field(default=1, ge=1, description="Total pages available")
     has_next: bool = Field(default=False, description="Whether next page exists")
     has_previous: bool = Field(default=False, description="Whether previous page exists")
+    cursor: str | None = Field(default=None, description="Cursor this page starts after")
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page")
     searched_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Search timestamp"
+        default_factory=_get_utc_now, description="Search timestamp"
+    )
+    embeddings: SkipJsonSchema[np.ndarray | None] = Field(
+        default=None, exclude=True, description="Result embeddings, one float32 row per item"
     )
 
-    model_config = {"use_enum_values": True, "json_schema_extra": {
-        "examples": [
-            {
-                "query": "API authentication",
-                "results": [],
-                "total_results": 25,
-                "page": 1,
-                "page_size": 10,
-                "total_pages": 3,
-                "has_next": True,
-                "has_previous": False,
-                "searched_at": "2026-02-17T12:00:00Z",
-            }
-        ]
-    }}
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    @model_validator(mode="after")
+    def validate_embeddings_shape(self) -> "MemorySearchResult":
+        """Ensure there is exactly one embedding row per result."""
+        if self.embeddings is not None and (
+            self.embeddings.ndim != 2 or self.embeddings.shape[0] != len(self.results)
+        ):
+            raise ValueError("embeddings must have shape (len(results), dim)")
+        return self
+
+    @classmethod
+    def with_packed_embeddings(
+        cls, *, results: list[MemoryItem], **data: Any
+    ) -> "MemorySearchResult":
+        """Build a result moving per-item embeddings into one contiguous matrix.
+
+        Packing only happens when every result carries an embedding (float or
+        int8-quantized); otherwise the items are kept as they are and
+        ``embeddings`` stays ``None``.
+
+        Args:
+            results: Matching memory items.
+            **data: Remaining ``MemorySearchResult`` fields.
+
+        Returns:
+            The search result.
+        """
+        vectors: list[np.ndarray] = []
+        for item in results:
+            vector = item.embedding_array() if isinstance(item, RecallMemoryItem) else None
+            if vector is None:
+                return cls(results=results, **data)
+            vectors.append(vector)
+        if not vectors:
+            return cls(results=results, **data)
+        cleared = {"embedding": None, "embedding_q8": None, "embedding_scale": None}
+        return cls(
+            results=[item.model_copy(update=cleared) for item in results],
+            embeddings=np.stack(vectors),
+            **data,
+        )
+
+    def similarities(self, query_embedding: Sequence[float]) -> np.ndarray:
+        """Score every result against a query embedding in one matrix product.
+
+        OpenAI embeddings are unit-length, so the dot product is the cosine
+        similarity.
+
+        Args:
+            query_embedding: Embedding of the query, same dimension as the rows.
+
+        Returns:
+            One score per result, in result order.
+
+        Raises:
+            ValueError: If the result was built without packed embeddings.
+        """
+        if self.embeddings is None:
+            raise ValueError("similarities requires packed embeddings")
+        return self.embeddings @ np.asarray(query_embedding, dtype=np.float32)
+
+    def top_k(self, query_embedding: Sequence[float], k: int) -> list[tuple[MemoryItem, float]]:
+        """Return the ``k`` results most similar to a query embedding.
+
+        Args:
+            query_embedding: Embedding of the query, same dimension as the rows.
+            k: Number of results to return.
+
+        Returns:
+            ``(item, score)`` pairs, most similar first.
+
+        Raises:
+            ValueError: If the result was built without packed embeddings.
+        """
+        if self.embeddings is None:
+            raise ValueError("top_k requires packed embeddings")
+        indices, scores = cosine_topk(np.asarray(query_embedding), self.embeddings, k)
+        return [(self.results[i], float(score)) for i, score in zip(indices, scores, strict=True)]
 
 
 class MemoryStats(BaseModel):
@@ -222,49 +380,34 @@ class MemoryStats(BaseModel):
         core_count: Number of items in core memory.
         recall_count: Number of items in recall memory.
         archival_count: Number of items in archival memory.
-        total_count: Total items across all tiers.
+        total_count: Total items across all tiers (derived).
         core_tokens: Total tokens in core memory.
         recall_tokens: Total tokens in recall memory.
         archival_tokens: Total tokens in archival memory.
-        total_tokens: Total tokens across all tiers.
+        total_tokens: Total tokens across all tiers (derived).
         last_updated: Timestamp of last statistics update.
     """
 
     core_count: int = Field(default=0, ge=0, description="Items in core memory")
     recall_count: int = Field(default=0, ge=0, description="Items in recall memory")
     archival_count: int = Field(default=0, ge=0, description="Items in archival memory")
-    total_count: int = Field(default=0, ge=0, description="Total items across all tiers")
     core_tokens: int = Field(default=0, ge=0, description="Tokens in core memory")
     recall_tokens: int = Field(default=0, ge=0, description="Tokens in recall memory")
     archival_tokens: int = Field(default=0, ge=0, description="Tokens in archival memory")
-    total_tokens: int = Field(default=0, ge=0, description="Total tokens across all tiers")
     last_updated: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Last update timestamp"
+        default_factory=_get_utc_now, description="Last update timestamp"
     )
 
-    model_config = {"use_enum_values": True, "json_schema_extra": {
-        "examples": [
-            {
-                "core_count": 150,
-                "recall_count": 1250,
-                "archival_count": 8500,
-                "total_count": 9900,
-                "core_tokens": 45000,
-                "recall_tokens": 375000,
-                "archival_tokens": 2550000,
-                "total_tokens": 2970000,
-                "last_updated": "2026-02-17T12:00:00Z",
-            }
-        ]
-    }}
+    model_config = ConfigDict(frozen=True)
 
-    @model_validator(mode="after")
-    def validate_totals(self) -> "MemoryStats":
-        """Ensure total counters match tier counters."""
-        expected_total_count = self.core_count + self.recall_count + self.archival_count
-        expected_total_tokens = self.core_tokens + self.recall_tokens + self.archival_tokens
-        if self.total_count != expected_total_count:
-            raise ValueError("total_count must equal core_count + recall_count + archival_count")
-        if self.total_tokens != expected_total_tokens:
-            raise ValueError("total_tokens must equal core_tokens + recall_tokens + archival_tokens")
-        return self
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def total_count(self) -> int:
+        """Total items across all tiers."""
+        return self.core_count + self.recall_count + self.archival_count
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def total_tokens(self) -> int:
+        """Total tokens across all tiers."""
+        return self.core_tokens + self.recall_tokens + self.archival_tokens
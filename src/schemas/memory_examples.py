@@ -0,0 +1,77 @@
+"""Example payloads for the memory schemas.
+
+Kept out of the models' ``model_config`` so importing ``src.schemas.memory``
+does not build or retain them. Code that publishes schemas (API docs,
+generators) attaches them on demand::
+
+    schema = {**json_schema_for(MemoryStats), "examples": EXAMPLES["MemoryStats"]}
+"""
+
+from typing import Any, Final
+
+EXAMPLES: Final[dict[str, list[dict[str, Any]]]] = {
+    "CoreMemoryItem": [
+        {
+            "kind": "core",
+            "id": "core_mem_001",
+            "content": "User prefers concise responses",
+            "importance": 0.9,
+            "access_count": 42,
+            "last_accessed": "2026-02-17T12:00:00Z",
+            "created_at": "2026-02-15T08:00:00Z",
+            "metadata": {"source": "conversation", "user_id": "123"},
+        }
+    ],
+    "RecallMemoryItem": [
+        {
+            "kind": "recall",
+            "id": "recall_mem_001",
+            "content": "Previous discussion about API authentication",
+            "conversation_id": "conv_123",
+            "message_id": "msg_456",
+            "timestamp": "2026-02-16T14:30:00Z",
+            "embedding": None,
+            "relevance_score": 0.85,
+            "created_at": "2026-02-16T14:30:00Z",
+        }
+    ],
+    "ArchivalMemoryItem": [
+        {
+            "kind": "archival",
+            "id": "archive_mem_001",
+            "content": "Historical conversation from 2025-01-15...",
+            "tier": "archival",
+            "compressed": True,
+            "storage_location": "s3://agnaldo-archive/2025/01/",
+            "tags": ["historical", "q1_2025"],
+            "created_at": "2025-01-15T10:00:00Z",
+            "last_accessed": None,
+        }
+    ],
+    "MemorySearchResult": [
+        {
+            "query": "API authentication",
+            "results": [],
+            "total_results": 25,
+            "page": 1,
+            "page_size": 10,
+            "total_pages": 3,
+            "has_next": True,
+            "has_previous": False,
+            "searched_at": "2026-02-17T12:00:00Z",
+        }
+    ],
+    "MemoryStats": [
+        {
+            "core_count": 150,
+            "recall_count": 1250,
+            "archival_count": 8500,
+            "total_count": 9900,
+            "core_tokens": 45000,
+            "recall_tokens": 375000,
+            "archival_tokens": 2550000,
+            "total_tokens": 2970000,
+            "last_updated": "2026-02-17T12:00:00Z",
+        }
+    ],
+}
@@ -5,17 +5,20 @@ including retry logic with exponential backoff, circuit breaker pattern,
 and standardized error response formatting.
 """
 
-import asyncio
+import inspect
+import itertools
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from datetime import datetime, timezone
 from enum import Enum
-from functools import wraps
-from typing import Any, TypeVar
+from functools import cache, wraps
+from types import MappingProxyType
+from typing import Any, ClassVar, Final, TypeVar, cast
 
 import openai
 from loguru import logger
+from pydantic_core import to_json
 from tenacity import (
     before_sleep_log,
     retry,
@@ -25,14 +28,9 @@ from tenacity import (
 )
 
 from src.exceptions import (
-    AgentCommunicationError,
     AgnaldoError,
     DatabaseError,
-    EmbeddingGenerationError,
-    IntentClassificationError,
     MemoryServiceError,
-    RateLimitError,
-    SupabaseConnectionError,
 )
 
 # Type variables for generic function wrappers
@@ -40,6 +38,61 @@ F = TypeVar("F", bound=Callable[..., Any])
 T = TypeVar("T")
 
 
+_BEFORE_SLEEP = before_sleep_log(logger, 30)
+
+
+@cache
+def _retry_policy(
+    attempts: int, min_wait: float, max_wait: float
+) -> tuple[stop_after_attempt, wait_exponential]:
+    """Return the stop and wait policies for the given limits, built once per key."""
+    return (
+        stop_after_attempt(attempts),
+        wait_exponential(multiplier=1, min=min_wait, max=max_wait),
+    )
+
+
+def _make_retry(
+    exc_type: type[BaseException],
+    *,
+    attempts: int = 3,
+    min_wait: float = 2,
+    max_wait: float = 10,
+) -> Callable[[F], F]:
+    """Build a tenacity decorator retrying only ``exc_type`` with exponential backoff.
+
+    Decorators built with the same ``attempts``/``min_wait``/``max_wait`` share
+    one stop and wait policy object.
+
+    Args:
+        exc_type: Exception type (and subclasses) that triggers a retry.
+        attempts: Maximum number of attempts, including the first call.
+        min_wait: Minimum wait between attempts, in seconds.
+        max_wait: Maximum wait between attempts, in seconds.
+
+    Returns:
+        A decorator applying the retry policy.
+    """
+    stop, wait = _retry_policy(attempts, min_wait, max_wait)
+    retrying = retry(
+        stop=stop,
+        wait=wait,
+        retry=retry_if_exception_type(exc_type),
+        before_sleep=_BEFORE_SLEEP,
+        reraise=True,
+    )
+
+    def decorator(func: F) -> F:
+        return cast("F", retrying(func))
+
+    return decorator
+
+
+_retry_database = _make_retry(DatabaseError)
+_retry_openai_rate_limit = _make_retry(openai.RateLimitError, attempts=5, min_wait=4, max_wait=60)
+_retry_memory = _make_retry(MemoryServiceError)
+
+
 # Retry decorators
 def retry_on_database_error(func: F) -> F:
     """Decorator to retry database operations with exponential backoff.
@@ -58,13 +111,7 @@ def retry_on_database_error(func: F) -> F:
         ... def fetch_user(user_id: int):
         ...     return db.query(user_id)
     """
-    return retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(DatabaseError),
-        before_sleep=before_sleep_log(logger, 30),
-        reraise=True,
-    )(func)
+    return _retry_database(func)
 
 
 def retry_on_openai_rate_limit(func: F) -> F:
@@ -84,13 +131,7 @@ def retry_on_openai_rate_limit(func: F) -> F:
         ... async def generate_completion(prompt: str):
         ...     return await client.chat.completions.create(messages=prompt)
     """
-    return retry(
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type(openai.RateLimitError),
-        before_sleep=before_sleep_log(logger, 30),
-        reraise=True,
-    )(func)
+    return _retry_openai_rate_limit(func)
 
 
 def retry_on_memory_error(func: F) -> F:
@@ -110,13 +151,7 @@ def retry_on_memory_error(func: F) -> F:
         ... async def search_embeddings(query: str):
         ...     return await vector_store.search(query)
     """
-    return retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(MemoryServiceError),
-        before_sleep=before_sleep_log(logger, 30),
-        reraise=True,
-    )(func)
+    return _retry_memory(func)
 
 
 # Circuit Breaker Pattern
@@ -146,7 +181,7 @@ class CircuitBreaker:
         timeout: Seconds to wait before attempting recovery.
         state: Current circuit state (CLOSED, OPEN, HALF_OPEN).
         failure_count: Current number of consecutive failures.
-        last_failure_time: Timestamp of the last failure.
+        last_failure_time: ``time.monotonic()`` reading of the last failure.
         recovery_attempt_count: Number of recovery attempts in HALF_OPEN.
 
     Example:
@@ -169,6 +204,10 @@ class CircuitBreaker:
         self.failure_count: int = 0
         self.last_failure_time: float | None = None
         self.recovery_attempt_count: int = 0
+        # ``next()`` on the C-implemented count is atomic under the GIL, so
+        # failure accounting does not need the lock; it only guards transitions.
+        # Resets swap in a fresh counter under the lock (see _on_failure).
+        self._failure_counter = itertools.count(1)
         self._lock = threading.Lock()
 
     def __call__(self, func: F) -> F:
@@ -181,44 +220,42 @@ class CircuitBreaker:
             The wrapped function with circuit breaker logic.
         """
 
-        @wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            return await self._call(func, *args, **kwargs)
+        # Pick the wrapper once at decoration time; each wrapper inlines the
+        # CLOSED fast path so a protected call adds a single Python frame.
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if self.state is not CircuitState.CLOSED:
+                    self._check_open(func)
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception:
+                    self._on_failure()
+                    raise
+                self._on_success()
+                return result
 
-        @wraps(func)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            return self._call_sync(func, *args, **kwargs)
-
-        # Return appropriate wrapper based on whether function is async
-        if asyncio.iscoroutinefunction(func):
             return async_wrapper  # type: ignore[return-value]
-        return sync_wrapper  # type: ignore[return-value]
-
-    async def _call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
-        """Execute async function with circuit breaker protection."""
-        with self._lock:
-            if self.state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    self.state = CircuitState.HALF_OPEN
-                    logger.info("Circuit breaker entering HALF_OPEN state")
-                else:
-                    raise CircuitBreakerError(
-                        f"Circuit breaker is OPEN. Rejecting call to {func.__name__}. "
-                        f"Retry after {self._get_remaining_timeout():.1f} seconds."
-                    )
 
-        try:
-            result = await func(*args, **kwargs)
+        @wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if self.state is not CircuitState.CLOSED:
+                self._check_open(func)
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                self._on_failure()
+                raise
             self._on_success()
             return result
-        except Exception:
-            self._on_failure()
-            raise
 
-    def _call_sync(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
-        """Execute sync function with circuit breaker protection."""
+        return sync_wrapper  # type: ignore[return-value]
+
+    def _check_open(self, func: Callable[..., Any]) -> None:
+        """Reject the call while OPEN, or move to HALF_OPEN once the timeout elapsed."""
         with self._lock:
-            if self.state == CircuitState.OPEN:
+            if self.state is CircuitState.OPEN:
                 if self._should_attempt_reset():
                     self.state = CircuitState.HALF_OPEN
                     logger.info("Circuit breaker entering HALF_OPEN state")
@@ -228,53 +265,63 @@ class CircuitBreaker:
                         f"Retry after {self._get_remaining_timeout():.1f} seconds."
                     )
 
-        try:
-            result = func(*args, **kwargs)
-            self._on_success()
-            return result
-        except Exception:
-            self._on_failure()
-            raise
-
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt recovery."""
         if self.last_failure_time is None:
             return True
-        return time.time() - self.last_failure_time >= self.timeout
+        return time.monotonic() - self.last_failure_time >= self.timeout
 
     def _get_remaining_timeout(self) -> float:
         """Get remaining seconds before recovery attempt."""
         if self.last_failure_time is None:
             return 0.0
-        elapsed = time.time() - self.last_failure_time
+        elapsed = time.monotonic() - self.last_failure_time
         return max(0.0, self.timeout - elapsed)
 
     def _on_success(self) -> None:
         """Handle successful call."""
+        # Nothing to reset on the common path: CLOSED with no recorded failures.
+        if self.state is CircuitState.CLOSED and self.failure_count == 0:
+            return
         with self._lock:
-            if self.state == CircuitState.HALF_OPEN:
+            if self.state is CircuitState.HALF_OPEN:
                 logger.info("Circuit breaker recovered to CLOSED state")
                 self.state = CircuitState.CLOSED
-            self.failure_count = 0
+            self._reset_failures()
             self.recovery_attempt_count = 0
             self.last_failure_time = None
 
+    def _reset_failures(self) -> None:
+        """Restart failure accounting from zero. Callers hold ``self._lock``."""
+        self._failure_counter = itertools.count(1)
+        self.failure_count = 0
+
     def _on_failure(self) -> None:
         """Handle failed call."""
+        counter = self._failure_counter
+        failures = next(counter)
+        if counter is not self._failure_counter:
+            # A reset swapped the counter while this failure was being counted.
+            # The failure belongs to the window the reset cleared, so it is
+            # dropped rather than written over the fresh count; losing it is
+            # accepted to keep the lock off the failure path.
+            return
+        self.failure_count = failures
+        self.last_failure_time = time.monotonic()
+        # Below the threshold a CLOSED breaker has no transition to make.
+        if self.state is CircuitState.CLOSED and failures < self.failure_threshold:
+            return
         with self._lock:
-            self.failure_count += 1
-            self.last_failure_time = time.time()
-
-            if self.state == CircuitState.HALF_OPEN:
+            if self.state is CircuitState.HALF_OPEN:
                 self.recovery_attempt_count += 1
                 logger.warning(
                     f"Circuit breaker recovery attempt {self.recovery_attempt_count} failed. "
                     f"Returning to OPEN state."
                 )
                 self.state = CircuitState.OPEN
-            elif self.failure_count >= self.failure_threshold:
+            elif self.state is CircuitState.CLOSED:
                 logger.warning(
-                    f"Circuit breaker tripped after {self.failure_count} failures. "
+                    f"Circuit breaker tripped after {failures} failures. "
                     f"Entering OPEN state for {self.timeout} seconds."
                 )
                 self.state = CircuitState.OPEN
@@ -283,7 +330,7 @@ class CircuitBreaker:
         """Manually reset the circuit breaker to CLOSED state."""
         with self._lock:
             self.state = CircuitState.CLOSED
-            self.failure_count = 0
+            self._reset_failures()
             self.last_failure_time = None
             self.recovery_attempt_count = 0
         logger.info("Circuit breaker manually reset to CLOSED state")
@@ -292,7 +339,8 @@ class CircuitBreaker:
 class CircuitBreakerError(AgnaldoError):
     """Exception raised when circuit breaker is OPEN."""
 
-    pass
+    error_code: ClassVar[str] = "CIRCUIT_BREAKER_OPEN"
+    retry_after = 30
 
 
 # Error Response Model
@@ -319,6 +367,8 @@ class ErrorResponse:
         >>> print(response.to_dict())
     """
 
+    __slots__ = ("_timestamp_iso", "details", "error", "error_code", "retry_after", "timestamp")
+
     def __init__(
         self,
         error: str,
@@ -341,6 +391,9 @@ class ErrorResponse:
         self.details = details or {}
         self.retry_after = retry_after
         self.timestamp = timestamp or datetime.now(timezone.utc)
+        # Responses are serialized several times (log, reply, metrics) and
+        # never mutated, so format the timestamp once.
+        self._timestamp_iso = self.timestamp.isoformat()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert error response to dictionary.
@@ -351,7 +404,7 @@ class ErrorResponse:
         result: dict[str, Any] = {
             "error": self.error,
             "error_code": self.error_code,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self._timestamp_iso,
         }
         if self.details:
             result["details"] = self.details
@@ -359,13 +412,42 @@ class ErrorResponse:
             result["retry_after"] = self.retry_after
         return result
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the error response straight to JSON.
+
+        Prefer this over ``json.dumps(response.to_dict())``: the payload is
+        encoded by pydantic-core's Rust serializer.
+
+        Returns:
+            UTF-8 encoded JSON object with the same keys as ``to_dict()``.
+        """
+        return to_json(self.to_dict())
+
     def __str__(self) -> str:
         """Return string representation of error response."""
         return f"{self.error_code}: {self.error}"
 
 
+# OpenAI SDK errors: (message, error_code, retry_after). A ``None`` message
+# reports the SDK's own text. Looked up along the exception's MRO, so the most
+# specific registered class wins.
+_OpenAIErrorInfo = tuple[str | None, str, int | None]
+_OPENAI_ERRORS: Final[Mapping[type[BaseException], _OpenAIErrorInfo]] = MappingProxyType(
+    {
+        openai.RateLimitError: ("OpenAI API rate limit exceeded", "OPENAI_RATE_LIMIT_ERROR", 60),
+        openai.APIConnectionError: (
+            "Failed to connect to OpenAI API",
+            "OPENAI_CONNECTION_ERROR",
+            10,
+        ),
+        openai.AuthenticationError: ("OpenAI API authentication failed", "OPENAI_AUTH_ERROR", None),
+        openai.APIError: (None, "OPENAI_API_ERROR", None),
+    }
+)
+
+
 # Error handler function
-def handle_error(error: Exception) -> ErrorResponse:
+def handle_error(error: Exception, timestamp: datetime | None = None) -> ErrorResponse:
     """Convert an exception into a standardized ErrorResponse.
 
     Maps different exception types to appropriate error codes and messages,
@@ -373,6 +455,9 @@ def handle_error(error: Exception) -> ErrorResponse:
 
     Args:
         error: The exception to handle.
+        timestamp: When the error occurred. Callers that already stamped the
+            incoming request (e.g. with the Discord message's ``created_at``)
+            can pass it to skip reading the clock; defaults to now in UTC.
 
     Returns:
         An ErrorResponse with appropriate error code and details.
@@ -384,128 +469,30 @@ def handle_error(error: Exception) -> ErrorResponse:
         ...     response = handle_error(e)
         ...     return response.to_dict()
     """
-    timestamp = datetime.now(timezone.utc)
-
-    # AgnaldoError hierarchy
-    if isinstance(error, SupabaseConnectionError):
-        return ErrorResponse(
-            error=str(error),
-            error_code="SUPABASE_CONNECTION_ERROR",
-            details={
-                **error.details,
-                "status_code": error.status_code,
-                "operation": error.operation,
-            },
-            timestamp=timestamp,
-        )
-
-    if isinstance(error, EmbeddingGenerationError):
-        return ErrorResponse(
-            error=str(error),
-            error_code="EMBEDDING_GENERATION_ERROR",
-            details={
-                **error.details,
-                "model": error.model,
-                "text_length": error.text_length,
-            },
-            timestamp=timestamp,
-        )
-
-    if isinstance(error, DatabaseError):
-        return ErrorResponse(
-            error=str(error),
-            error_code="DATABASE_ERROR",
-            details={**error.details, "operation": error.operation},
-            timestamp=timestamp,
-        )
-
-    if isinstance(error, MemoryServiceError):
-        return ErrorResponse(
-            error=str(error),
-            error_code="MEMORY_ERROR",
-            details={**error.details, "memory_type": error.memory_type},
-            timestamp=timestamp,
-        )
-
-    if isinstance(error, IntentClassificationError):
-        return ErrorResponse(
-            error=str(error),
-            error_code="INTENT_CLASSIFICATION_ERROR",
-            details={**error.details, "confidence": error.confidence},
-            timestamp=timestamp,
-        )
-
-    if isinstance(error, RateLimitError):
-        return ErrorResponse(
-            error=str(error),
-            error_code="RATE_LIMIT_ERROR",
-            details={
-                **error.details,
-                "limit": error.limit,
-            },
-            retry_after=error.retry_after,
-            timestamp=timestamp,
-        )
-
-    if isinstance(error, AgentCommunicationError):
-        return ErrorResponse(
-            error=str(error),
-            error_code="AGENT_COMMUNICATION_ERROR",
-            details={
-                **error.details,
-                "source_agent": error.source_agent,
-                "target_agent": error.target_agent,
-            },
-            timestamp=timestamp,
-        )
+    if timestamp is None:
+        timestamp = datetime.now(timezone.utc)
 
+    # Agnaldo errors describe themselves
     if isinstance(error, AgnaldoError):
         return ErrorResponse(
             error=str(error),
-            error_code="AGNALDO_ERROR",
-            details=error.details,
+            error_code=error.error_code,
+            details=error.error_details(),
+            retry_after=error.retry_after,
             timestamp=timestamp,
         )
 
     # OpenAI errors
-    if isinstance(error, openai.RateLimitError):
-        return ErrorResponse(
-            error="OpenAI API rate limit exceeded",
-            error_code="OPENAI_RATE_LIMIT_ERROR",
-            retry_after=60,
-            timestamp=timestamp,
-        )
-
-    if isinstance(error, openai.APIConnectionError):
-        return ErrorResponse(
-            error="Failed to connect to OpenAI API",
-            error_code="OPENAI_CONNECTION_ERROR",
-            retry_after=10,
-            timestamp=timestamp,
-        )
-
-    if isinstance(error, openai.AuthenticationError):
-        return ErrorResponse(
-            error="OpenAI API authentication failed",
-            error_code="OPENAI_AUTH_ERROR",
-            timestamp=timestamp,
-        )
-
-    if isinstance(error, openai.APIError):
-        return ErrorResponse(
-            error=f"OpenAI API error: {str(error)}",
-            error_code="OPENAI_API_ERROR",
-            timestamp=timestamp,
-        )
-
-    # Circuit breaker
-    if isinstance(error, CircuitBreakerError):
-        return ErrorResponse(
-            error=str(error),
-            error_code="CIRCUIT_BREAKER_OPEN",
-            retry_after=30,
-            timestamp=timestamp,
-        )
+    for cls in type(error).__mro__:
+        entry = _OPENAI_ERRORS.get(cls)
+        if entry is not None:
+            message, error_code, retry_after = entry
+            return ErrorResponse(
+                error=message or f"OpenAI API error: {str(error)}",
+                error_code=error_code,
+                retry_after=retry_after,
+                timestamp=timestamp,
+            )
 
     # Generic exceptions
     return ErrorResponse(
@@ -1,10 +1,13 @@
 """Logging configuration with Loguru."""
 
+import inspect
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+import zstandard
 from loguru import logger
 
 # Project root
@@ -29,19 +32,51 @@ FILE_FORMAT = (
 
 _LOGGING_CONFIGURED = False
 
+# zstd level 3 compresses several times faster than zip's DEFLATE at a similar
+# ratio, which keeps 100 MB rotations short
+_ZSTD_LEVEL = 3
+
+# Values accepted by _enable_diagnostics
+_DEBUG_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_PROD_ENVS = frozenset({"prod", "production"})
+
+
+# Frames from the stdlib logging module are skipped when attributing records
+_LOGGING_FILE = logging.__file__
+
+# High-volume third-party loggers, kept at WARNING by intercept_standard_logging
+_QUIET_LOGGERS = ("uvicorn", "fastapi", "sqlalchemy")
+
+# Per-request loggers whose records are discarded before they reach Loguru, so
+# InterceptHandler never walks frames for them
+_DISCARDED_LOGGERS = ("uvicorn.access",)
+
+# Loggers whose own handlers are dropped so their records reach the root
+# InterceptHandler; everything else already propagates to the root by default
+_INTERCEPTED_LOGGERS = (*_QUIET_LOGGERS, "uvicorn.error", "httpx", "asyncio", "discord")
+
 
 class InterceptHandler(logging.Handler):
     """Intercept standard logging and redirect to Loguru."""
 
+    def __init__(self, level: int | str = logging.NOTSET) -> None:
+        super().__init__(level)
+        # Standard level name -> Loguru level name, filled on first use
+        self._level_cache: dict[str, str] = {}
+
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record to Loguru."""
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-
-        frame, depth = logging.currentframe(), 2
-        while frame and frame.f_code.co_filename == logging.__file__:
+        level: str | int | None = self._level_cache.get(record.levelname)
+        if level is None:
+            try:
+                level = self._level_cache[record.levelname] = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+
+        # Find the first caller outside the logging module; depth counts from emit()
+        frame, depth = inspect.currentframe(), 1
+        frame = frame.f_back if frame else None
+        while frame and frame.f_code.co_filename == _LOGGING_FILE:
             frame = frame.f_back
             depth += 1
 
@@ -50,9 +85,13 @@ class InterceptHandler(logging.Handler):
         )
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str):
     """Get a logger with module binding.
 
+    Bound loggers share Loguru's handlers and never change their ``extra``,
+    so each name is bound once and the same logger is returned afterwards.
+
     Args:
         name: Module name for logger identification
 
@@ -62,11 +101,24 @@ def get_logger(name: str):
     return logger.bind(module=name)
 
 
+def _zstd_compress(path: str) -> None:
+    """Compress a rotated log file to ``<path>.zst`` and remove the original.
+
+    Args:
+        path: Path of the rotated log file, as passed by Loguru.
+    """
+    source_path = Path(path)
+    target_path = source_path.with_name(f"{source_path.name}.zst")
+    with source_path.open("rb") as source, target_path.open("wb") as destination:
+        zstandard.ZstdCompressor(level=_ZSTD_LEVEL).copy_stream(source, destination)
+    source_path.unlink()
+
+
 def _enable_diagnostics() -> bool:
     """Determine whether diagnostic stack inspection should be enabled."""
     environment = os.getenv("ENVIRONMENT", os.getenv("ENV", "development")).lower()
-    debug_enabled = os.getenv("DEBUG", "0").lower() in {"1", "true", "yes", "on"}
-    return debug_enabled or environment not in {"prod", "production"}
+    debug_enabled = os.getenv("DEBUG", "0").lower() in _DEBUG_TRUTHY
+    return debug_enabled or environment not in _PROD_ENVS
 
 
 def intercept_standard_logging() -> None:
@@ -74,17 +126,18 @@ def intercept_standard_logging() -> None:
     logging.root.handlers = [InterceptHandler()]
     logging.root.setLevel(os.getenv("LOG_LEVEL", "INFO"))
 
-    for name in logging.root.manager.loggerDict:
-        if name.startswith("loguru"):
-            continue
+    for name in _INTERCEPTED_LOGGERS:
         target_logger = logging.getLogger(name)
         target_logger.handlers = []
         target_logger.propagate = True
 
-    logging.getLogger("uvicorn").setLevel(logging.WARNING)
-    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
-    logging.getLogger("fastapi").setLevel(logging.WARNING)
-    logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
+    for name in _QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    for name in _DISCARDED_LOGGERS:
+        target_logger = logging.getLogger(name)
+        target_logger.handlers = [logging.NullHandler()]
+        target_logger.propagate = False
 
 
 def setup_logging() -> None:
@@ -115,9 +168,12 @@ def setup_logging() -> None:
         level=log_level,
         rotation="100 MB",
         retention="30 days",
-        compression="zip",
+        compression=_zstd_compress,
         backtrace=diagnostics_enabled,
         diagnose=diagnostics_enabled,
+        # Writes happen on Loguru's background thread; callers only enqueue.
+        # The stdout sink stays synchronous so console output keeps its order.
+        enqueue=True,
     )
 
     intercept_standard_logging()
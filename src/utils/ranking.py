@@ -0,0 +1,32 @@
+"""Vectorized ranking of memory embeddings.
+
+Embeddings are scored as one ``(N, D) @ (D,)`` matrix-vector product, which
+numpy hands to BLAS (SIMD, multi-threaded), and the best ``k`` rows are
+selected with ``argpartition`` instead of a full sort.
+"""
+
+import numpy as np
+
+
+def cosine_topk(query: np.ndarray, embeddings: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the ``k`` rows of ``embeddings`` most similar to ``query``.
+
+    Rows and query are expected to be unit-length (as OpenAI embeddings are),
+    so the dot product is the cosine similarity.
+
+    Args:
+        query: Query embedding, shape ``(D,)``.
+        embeddings: Candidate embeddings, shape ``(N, D)``, ideally contiguous
+            float32.
+        k: Number of results; clamped to ``N``.
+
+    Returns:
+        Row indices and their scores, both ordered from most to least similar.
+    """
+    scores = embeddings @ np.asarray(query, dtype=embeddings.dtype)
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=scores.dtype)
+    top = np.argpartition(scores, -k)[-k:]
+    order = top[np.argsort(scores[top])[::-1]]
+    return order, scores[order]
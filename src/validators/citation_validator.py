@@ -8,7 +8,9 @@ em conteúdo recuperado da base RAG.
 from __future__ import annotations
 
 import re
+import string
 from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING
 
 from loguru import logger
@@ -16,8 +18,16 @@ from loguru import logger
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+# Pontuação removida na busca parcial de citações ("art. 121" → "art 121").
+# ``º`` e ``ª`` são letras para o Unicode e ficam, como no ``[^\w\s]`` anterior.
+_PUNCT_TABLE = str.maketrans(
+    "",
+    "",
+    string.punctuation + "§°«»“”\u2018\u2019\u2013\u2014",  # aspas simples e travessões
+)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Resultado da validação de citações.
 
@@ -45,16 +55,28 @@ class CitationValidator:
     recuperado, prevenindo alucinações de referências jurídicas.
     """
 
-    # Padrões regex para citações jurídicas brasileiras
+    # Padrões regex para citações jurídicas brasileiras. A ordem importa: os
+    # padrões são fundidos em uma alternação e, numa mesma posição, vence o
+    # primeiro que casar — por isso "art. 5º, CF" vem antes do artigo simples.
     PATTERNS = {
+        "cf": r"constituição\s+Federal|art\.?\s*\d+[º°]?\s*,?\s*CF",
         "artigo": r"art\.?\s*\d+[º°]?\s*(?:§\s*\d+[º°]?\s*)?(?:incisos?\s*[IVX]+)?",
         "lei": r"lei\s*n?[º°]?\s*\d+[.,]?\d*\s*/\s*\d{4}",
         "codigo": r"código\s+(?:penal|civil|processual\s+civil|tributário)",
         "sumula": r"súmula\s*(?:vinculante\s*)?\d+",
-        "cf": r"constituição\s+Federal|art\.?\s*\d+[º°]?\s*,?\s*CF",
         "stf_stj": r"ST[FI].*?(?:\s+\d+)?",
     }
 
+    # Uma única passada sobre o texto encontra citações de todos os tipos; o
+    # grupo nomeado (``match.lastgroup``) indica qual padrão casou.
+    _FUSED_PATTERN: re.Pattern[str] = re.compile(
+        "(?i)" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in PATTERNS.items())
+    )
+
+    # Prefixos literais de todos os padrões acima: se nenhum aparece no texto,
+    # não há citação a extrair. Mantenha em sincronia com PATTERNS.
+    _CITATION_HINT: re.Pattern[str] = re.compile(r"(?i)art|lei|súmula|código|constituição|st[fi]")
+
     def __init__(self, strict_mode: bool = True) -> None:
         """Inicializa o validador.
 
@@ -98,9 +120,10 @@ class CitationValidator:
         verified: list[str] = []
         invalid: list[str] = []
 
+        normalized = {citation: self._normalize_citation(citation) for citation in citations}
+        found = self._find_citations_in_context(set(normalized.values()), context_text)
         for citation in citations:
-            normalized_citation = self._normalize_citation(citation)
-            if self._citation_in_context(normalized_citation, context_text):
+            if normalized[citation] in found:
                 verified.append(citation)
             else:
                 invalid.append(citation)
@@ -145,12 +168,12 @@ class CitationValidator:
         Returns:
             Lista de citações encontradas (sem duplicatas).
         """
-        citations: set[str] = set()
-        text_lower = text.lower()
+        if not text or self._CITATION_HINT.search(text) is None:
+            return []
 
-        for pattern_name, pattern in self.PATTERNS.items():
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            citations.update(matches)
+        # Só os trechos casados são convertidos para minúsculas, o que basta
+        # para unificar variações como "Art. 121" e "art. 121".
+        citations = {match.group(0).lower() for match in self._FUSED_PATTERN.finditer(text)}
 
         return sorted(citations)
 
@@ -163,7 +186,8 @@ class CitationValidator:
         Returns:
             Texto normalizado em minúsculas.
         """
-        return " ".join(context_list).lower()
+        # Minúsculas por chunk: evita criar o texto unido e depois uma cópia dele
+        return " ".join([chunk.lower() for chunk in context_list])
 
     def _normalize_citation(self, citation: str) -> str:
         """Normaliza uma citação para comparação.
@@ -176,12 +200,44 @@ class CitationValidator:
         """
         return citation.lower().strip()
 
-    def _citation_in_context(self, citation: str, context: str) -> bool:
+    def _find_citations_in_context(self, citations: set[str], context: str) -> set[str]:
+        """Retorna as citações normalizadas presentes no contexto.
+
+        A cópia do contexto sem pontuação só é criada se alguma citação não
+        aparecer na forma exata, e então é compartilhada entre as restantes.
+
+        Args:
+            citations: Citações normalizadas.
+            context: Contexto normalizado.
+
+        Returns:
+            Subconjunto de ``citations`` encontrado no contexto.
+        """
+        found = {citation for citation in citations if citation in context}
+        remaining = citations - found
+        if not remaining:
+            return found
+
+        context_partial = context.translate(_PUNCT_TABLE)
+        found.update(
+            citation for citation in remaining if self._citation_in_context(citation, context, context_partial)
+        )
+        return found
+
+    def _citation_in_context(
+        self,
+        citation: str,
+        context: str,
+        context_partial: str | None = None,
+    ) -> bool:
         """Verifica se a citação existe no contexto.
 
         Args:
             citation: Citação normalizada.
             context: Contexto normalizado.
+            context_partial: Contexto já sem pontuação. Quem verifica várias
+                citações contra o mesmo contexto deve calculá-lo uma vez e
+                repassá-lo; se omitido, é calculado aqui.
 
         Returns:
             True se a citação for encontrada no contexto.
@@ -191,9 +247,9 @@ class CitationValidator:
             return True
 
         # Busca parcial para artigos (ex: "art. 121" → "art 121")
-        partial = re.sub(r"[^\w\s]", "", citation)
-        context_partial = re.sub(r"[^\w\s]", "", context)
-        return partial in context_partial
+        if context_partial is None:
+            context_partial = context.translate(_PUNCT_TABLE)
+        return citation.translate(_PUNCT_TABLE) in context_partial
 
     def format_response_with_validation(
         self,
@@ -224,12 +280,20 @@ class CitationValidator:
         return f"{response}\n\n📊 **Validação**: {badge}"
 
 
-# Singleton instance
-_validator: CitationValidator | None = None
+@cache
+def _validator_for(strict_mode: bool) -> CitationValidator:
+    """Instância compartilhada por modo; chamada sempre com argumento posicional."""
+    return CitationValidator(strict_mode=strict_mode)
 
 
 def get_citation_validator(strict_mode: bool = True) -> CitationValidator:
-    """Retorna instância singleton do CitationValidator.
+    """Retorna a instância compartilhada do CitationValidator para o modo dado.
+
+    O validador não guarda estado além de ``strict_mode``; há uma instância
+    por modo, então alternar entre os modos não recria o objeto. O cache fica
+    em ``_validator_for`` para que ``get_citation_validator()``,
+    ``get_citation_validator(True)`` e ``get_citation_validator(strict_mode=True)``
+    devolvam a mesma instância.
 
     Args:
         strict_mode: Modo estrito de validação.
@@ -237,9 +301,4 @@ def get_citation_validator(strict_mode: bool = True) -> CitationValidator:
     Returns:
         Instância do CitationValidator.
     """
-    global _validator
-
-    if _validator is None or _validator.strict_mode != strict_mode:
-        _validator = CitationValidator(strict_mode=strict_mode)
-
-    return _validator
+    return _validator_for(bool(strict_mode))
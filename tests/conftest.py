@@ -5,14 +5,18 @@ Este módulo contém fixtures reutilizáveis para todos os testes.
 
 import asyncio
 from collections.abc import Callable, Generator
-from typing import Any, NamedTuple
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, NamedTuple
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
 
 from src.base.logging import setup_logging
-from src.discord.commands import setup_commands
+
+if TYPE_CHECKING:
+    from tests.fixtures.openai import FrozenEmbeddingResponse
 
 pytest_plugins = ["tests.fixtures.discord"]
 
@@ -21,6 +25,57 @@ pytest_plugins = ["tests.fixtures.discord"]
 setup_logging(level="DEBUG", json_output=False)
 
 
+class _AsyncContext:
+    """Context manager assíncrono que apenas devolve ``value`` ao entrar."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: Any) -> None:
+        self._value = value
+
+    async def __aenter__(self) -> Any:
+        return self._value
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+class _FakePool:
+    """Pool com a forma de ``asyncpg.Pool``: ``acquire()`` entrega sempre ``conn``.
+
+    Escrito à mão para que cada ``async with pool.acquire()`` do código testado
+    não passe pelo registro de chamadas de um ``AsyncMock``. O context manager
+    não guarda estado, então o mesmo objeto serve a todas as aquisições.
+    """
+
+    __slots__ = ("_acquire",)
+
+    def __init__(self, conn: AsyncMock) -> None:
+        self._acquire = _AsyncContext(conn)
+
+    def acquire(self) -> _AsyncContext:
+        return self._acquire
+
+
+@dataclass(slots=True)
+class _FakeBot:
+    """Substituto do AgnaldoBot com só o que os comandos slash usam.
+
+    Os comandos acessam o bot por duck typing, então um dataclass basta e
+    dispensa a criação de mocks filhos a cada atributo lido.
+    """
+
+    tree: "MockCommandTree"
+    user: Any
+    rate_limiter: MagicMock
+    db_pool: Any = None
+    guilds: list[Any] = field(default_factory=list)
+    latency: float = 0.05
+
+    def get_rate_limiter(self) -> MagicMock:
+        return self.rate_limiter
+
+
 class BotTestContext(NamedTuple):
     """Contexto de teste para bot com comandos configurados.
 
@@ -30,8 +85,8 @@ class BotTestContext(NamedTuple):
         conn: Conexão de banco de dados mockada.
     """
 
-    bot: MagicMock
-    pool: MagicMock
+    bot: _FakeBot
+    pool: _FakePool
     conn: AsyncMock
 
 
@@ -50,12 +105,12 @@ class MockCommandTree:
 
         def decorator(func: Any) -> Any:
             cmd_name = name or func.__name__
-            command = MagicMock()
-            command.name = cmd_name
-            command.qualified_name = cmd_name
-            command.description = description or ""
-            command.callback = func
-            self._commands[cmd_name] = command
+            self._commands[cmd_name] = SimpleNamespace(
+                name=cmd_name,
+                qualified_name=cmd_name,
+                description=description or "",
+                callback=func,
+            )
             return func
 
         return decorator
@@ -87,40 +142,38 @@ class MockCommandTree:
         return self._commands.get(name)
 
 
-@pytest_asyncio.fixture
-async def bot_with_commands(monkeypatch) -> BotTestContext:
-    """Build a bot-like object with all slash commands registered.
+# Variáveis exigidas pelo singleton de settings nos testes de comandos
+_BOT_TEST_ENV = {
+    "DISCORD_BOT_TOKEN": "test_token_123",
+    "SUPABASE_URL": "https://test.supabase.co",
+    "SUPABASE_DB_URL": "postgresql://test",
+    "SUPABASE_SERVICE_ROLE_KEY": "test_key",
+    "OPENAI_API_KEY": "sk-test-key",
+}
 
-    Returns:
-        BotTestContext com bot, pool e conn mockados.
-    """
-    # Required settings for the settings singleton
-    monkeypatch.setenv("DISCORD_BOT_TOKEN", "test_token_123")
-    monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
-    monkeypatch.setenv("SUPABASE_DB_URL", "postgresql://test")
-    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test_key")
-    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
-
-    from src.config.settings import reset_settings
-
-    reset_settings()
 
+def _build_db_mocks() -> tuple[_FakePool, AsyncMock]:
+    """Monta pool e conexão asyncpg mockados, com respostas padrão."""
     mock_conn = AsyncMock()
     mock_conn.fetch = AsyncMock(return_value=[])
     mock_conn.fetchval = AsyncMock(return_value="mock-uuid")
     mock_conn.fetchrow = AsyncMock(return_value=None)
     mock_conn.execute = AsyncMock(return_value="INSERT 1")
+    mock_conn.transaction = MagicMock(return_value=_AsyncContext(None))
+    return _FakePool(mock_conn), mock_conn
 
-    transaction_cm = AsyncMock()
-    transaction_cm.__aenter__.return_value = None
-    transaction_cm.__aexit__.return_value = None
-    mock_conn.transaction = MagicMock(return_value=transaction_cm)
 
-    acquire_cm = AsyncMock()
-    acquire_cm.__aenter__.return_value = mock_conn
-    acquire_cm.__aexit__.return_value = None
-    mock_pool = MagicMock()
-    mock_pool.acquire = MagicMock(return_value=acquire_cm)
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _bot_session() -> _FakeBot:
+    """Bot com todos os comandos slash registrados, montado uma vez por sessão.
+
+    Os callbacks dos comandos leem ``bot.db_pool`` e as settings a cada
+    chamada, então o estado por teste fica em ``bot_with_commands``.
+    """
+    # Importado aqui: carregar os comandos puxa discord.py e o grafo de
+    # conhecimento, o que custa mais de um segundo na coleta de testes que
+    # nem usam este fixture.
+    from src.discord.commands import setup_commands
 
     rate_limiter = MagicMock()
     rate_limiter.acquire = AsyncMock()
@@ -131,18 +184,46 @@ async def bot_with_commands(monkeypatch) -> BotTestContext:
         }
     )
 
-    bot = MagicMock()
-    bot.tree = MockCommandTree()
-    bot.db_pool = mock_pool
-    bot.user = MagicMock()
-    bot.user.mention = "@Agnaldo"
-    bot.user.name = "Agnaldo"
-    bot.guilds = []
-    bot.latency = 0.05
-    bot.get_rate_limiter = MagicMock(return_value=rate_limiter)
+    bot = _FakeBot(
+        tree=MockCommandTree(),
+        user=SimpleNamespace(mention="@Agnaldo", name="Agnaldo"),
+        rate_limiter=rate_limiter,
+    )
 
     await setup_commands(bot)
+    return bot
+
+
+@pytest.fixture(scope="session")
+def _bot_settings() -> Any:
+    """Settings construídas uma vez a partir de ``_BOT_TEST_ENV``."""
+    from src.config.settings import Settings
 
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in _BOT_TEST_ENV.items():
+            mp.setenv(name, value)
+        return Settings()
+
+
+@pytest.fixture
+def bot_with_commands(_bot_session: _FakeBot, _bot_settings: Any, monkeypatch) -> BotTestContext:
+    """Bot com os comandos slash registrados e banco mockado novo por teste.
+
+    Returns:
+        BotTestContext com bot, pool e conn mockados.
+    """
+    import src.config.settings as settings_module
+
+    for name, value in _BOT_TEST_ENV.items():
+        monkeypatch.setenv(name, value)
+    # Instala as settings da sessão no singleton; o valor anterior volta ao
+    # fim do teste, sem reconstruir Settings a cada teste.
+    monkeypatch.setattr(settings_module, "_settings", _bot_settings)
+
+    mock_pool, mock_conn = _build_db_mocks()
+    bot = _bot_session
+    bot.db_pool = mock_pool
+    bot.rate_limiter.reset_mock()
     return BotTestContext(bot=bot, pool=mock_pool, conn=mock_conn)
 
 
@@ -220,28 +301,35 @@ def mock_db_connection() -> AsyncMock:
 
 
 @pytest.fixture
-def mock_openai_client() -> AsyncMock:
+def mock_openai_client(shared_embedding_response: "FrozenEmbeddingResponse") -> AsyncMock:
     """Mock do cliente OpenAI.
 
+    As respostas são instâncias imutáveis compartilhadas; o embedding vem de
+    ``shared_embedding_response``.
+
     Returns:
         AsyncMock com interface de AsyncOpenAI.
     """
+    from tests.fixtures.openai import SHARED_CHAT_COMPLETION
+
     client = AsyncMock()
+    client.embeddings.create = AsyncMock(return_value=shared_embedding_response)
+    client.chat.completions.create = AsyncMock(return_value=SHARED_CHAT_COMPLETION)
+    return client
 
-    # Mock de embeddings
-    embedding_response = MagicMock()
-    embedding_response.data = [MagicMock(embedding=[0.1] * 1536)]
-    client.embeddings.create = AsyncMock(return_value=embedding_response)
 
-    # Mock de chat completions
-    chat_response = MagicMock()
-    chat_response.choices = [
-        MagicMock(message=MagicMock(content="Mocked response"))
-    ]
-    chat_response.usage = MagicMock(total_tokens=100)
-    client.chat.completions.create = AsyncMock(return_value=chat_response)
+@pytest.fixture(scope="session")
+def shared_embedding_response() -> "FrozenEmbeddingResponse":
+    """Resposta de ``embeddings.create`` compartilhada pela sessão.
 
-    return client
+    ``data[0].embedding`` é ``FAKE_EMBEDDING``; os testes só a repassam como
+    ``return_value`` dos clientes OpenAI mockados.
+    """
+    # Importado aqui: importar tests.fixtures no topo carregaria o plugin
+    # tests.fixtures.discord antes de o pytest marcá-lo para reescrita de asserts.
+    from tests.fixtures.openai import SHARED_EMBEDDING_RESPONSE
+
+    return SHARED_EMBEDDING_RESPONSE
 
 
 # ============================================================================
@@ -5,21 +5,81 @@ desde a chamada do comando até a resposta ao usuário, usando todos os
 mocks necessários (Discord, OpenAI, DB).
 """
 
+import asyncio
 import re
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from tests.fixtures.discord import create_light_interaction
+from tests.fixtures.openai import FAKE_EMBEDDING
+
+# Cada teste recebe seu próprio pool, conexão e interações, e o bot/settings de
+# sessão são montados por processo: o módulo pode rodar em paralelo com
+# ``pytest -n auto`` (pytest-xdist). Os testes rodam no mesmo event loop de
+# sessão do ``_bot_session``, em vez de criar e fechar um loop por teste.
+pytestmark = [pytest.mark.e2e, pytest.mark.discord, pytest.mark.asyncio(loop_scope="session")]
+
+# Timestamp fixo das linhas simuladas do banco; nenhum comando depende do
+# valor exato de created_at/updated_at.
+_NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# Latência exibida pelo /ping, ex.: "Latency: 50ms"
+_MS_RE = re.compile(r"\d+ms")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_openai(shared_embedding_response):
+    """Substitui o AsyncOpenAI de recall e do grafo uma vez para o módulo todo.
+
+    Os dois módulos recebem o mesmo cliente, já montado com ``embeddings.create``
+    devolvendo ``shared_embedding_response``; nenhum teste daqui chama a API real.
+    """
+    client = SimpleNamespace(
+        embeddings=SimpleNamespace(create=AsyncMock(return_value=shared_embedding_response))
+    )
+    with (
+        patch("src.memory.recall.AsyncOpenAI", return_value=client),
+        patch("src.knowledge.graph.AsyncOpenAI", return_value=client),
+    ):
+        yield client
+
+
+@pytest.fixture
+def interaction_factory():
+    """Fábrica de Interactions leves e independentes para o mesmo usuário e canal."""
+    return create_light_interaction
+
+
 # ============================================================================
 # Testes E2E de Comandos de Memória
 # ============================================================================
 
 
-@pytest.mark.e2e
-@pytest.mark.discord
-@pytest.mark.asyncio
-async def test_memory_add_command_flow(bot_with_commands, mock_discord_interaction):
+@pytest.mark.parametrize(
+    ("key", "value", "importance", "expected_substrs"),
+    [
+        pytest.param(
+            "linguagem_preferida",
+            "Python",
+            0.8,
+            ("linguagem_preferida", "Python", "0.8"),
+            id="sucesso",
+        ),
+        pytest.param(
+            "teste",
+            "valor",
+            1.5,  # Inválido (> 1.0)
+            ("Importance must be between 0.0 and 1.0",),
+            id="importancia_invalida",
+        ),
+    ],
+)
+async def test_memory_add_command_flow(
+    bot_with_commands, mock_discord_interaction, key, value, importance, expected_substrs
+):
     """Teste E2E do fluxo de adicionar memória via comando /memory add."""
     ctx = bot_with_commands
     bot = ctx.bot
@@ -35,49 +95,55 @@ async def test_memory_add_command_flow(bot_with_commands, mock_discord_interacti
 
     # Executar o comando
     await memory_add_cmd.callback(
-        mock_discord_interaction, key="linguagem_preferida", value="Python", importance=0.8
+        mock_discord_interaction, key=key, value=value, importance=importance
     )
 
     # Verificar que a resposta foi enviada
     mock_discord_interaction.response.send_message.assert_called_once()
-    call_args = mock_discord_interaction.response.send_message.call_args
-    assert "linguagem_preferida" in call_args[0][0]
-    assert "Python" in call_args[0][0]
-    assert "0.8" in call_args[0][0]
-
-
-@pytest.mark.e2e
-@pytest.mark.discord
-@pytest.mark.asyncio
-async def test_memory_add_invalid_importance_flow(bot_with_commands, mock_discord_interaction):
-    """Teste E2E do fluxo de adicionar memória com importância inválida."""
-    ctx = bot_with_commands
-    bot = ctx.bot
-    mock_conn = ctx.conn
-
-    # Obter o comando de adicionar memória
-    memory_add_cmd = bot.tree.get_command("memory add")
-
-    # Executar com importância inválida
-    await memory_add_cmd.callback(
-        mock_discord_interaction,
-        key="teste",
-        value="valor",
-        importance=1.5,  # Inválido (> 1.0)
-    )
-
-    # Verificar mensagem de erro
-    mock_discord_interaction.response.send_message.assert_called_once()
-    call_args = mock_discord_interaction.response.send_message.call_args
-    assert "Importance must be between 0.0 and 1.0" in call_args[0][0]
-
-
-@pytest.mark.e2e
-@pytest.mark.discord
-@patch("src.memory.recall.AsyncOpenAI")
-@patch("src.knowledge.graph.AsyncOpenAI")
+    response_text = mock_discord_interaction.response.send_message.call_args[0][0]
+    for expected in expected_substrs:
+        assert expected in response_text
+
+
+@pytest.mark.parametrize(
+    ("query", "rows", "expected_substrs"),
+    [
+        pytest.param(
+            "linguagem de programação",
+            [
+                {
+                    "id": "mem-uuid-1",
+                    "content": "O usuário prefere programar em Python",
+                    "importance": 0.9,
+                    "similarity": 0.92,
+                    "distance": 0.08,
+                    "created_at": _NOW,
+                    "updated_at": _NOW,
+                    "access_count": 0,
+                },
+                {
+                    "id": "mem-uuid-2",
+                    "content": "Python é a linguagem favorita",
+                    "importance": 0.8,
+                    "similarity": 0.85,
+                    "distance": 0.15,
+                    "created_at": _NOW,
+                    "updated_at": _NOW,
+                    "access_count": 0,
+                },
+            ],
+            ("Found 2 memories", "92%"),
+            id="com_resultados",
+        ),
+        pytest.param("algo que não existe", [], ("No memories found",), id="sem_resultados"),
+    ],
+)
 async def test_memory_search_command_flow(
-    mock_openai_graph, mock_openai_recall, bot_with_commands, mock_discord_interaction
+    bot_with_commands,
+    mock_discord_interaction,
+    query,
+    rows,
+    expected_substrs,
 ):
     """Teste E2E do fluxo de buscar memória via comando /memory recall."""
     ctx = bot_with_commands
@@ -85,87 +151,20 @@ async def test_memory_search_command_flow(
     mock_conn = ctx.conn
 
     # Configurar mocks para busca semântica
-
-    now = datetime.now(timezone.utc)
-    mock_conn.fetch.return_value = [
-        {
-            "id": "mem-uuid-1",
-            "content": "O usuário prefere programar em Python",
-            "importance": 0.9,
-            "similarity": 0.92,
-            "created_at": now,
-            "updated_at": now,
-            "access_count": 0,
-        },
-        {
-            "id": "mem-uuid-2",
-            "content": "Python é a linguagem favorita",
-            "importance": 0.8,
-            "similarity": 0.85,
-            "created_at": now,
-            "updated_at": now,
-            "access_count": 0,
-        },
-    ]
-
-    # Mock OpenAI para evitar chamadas reais de API
-    mock_openai_response = MagicMock()
-    mock_openai_response.data = [MagicMock(embedding=[0.1] * 1536)]
-
-    # Configurar o mock que já foi injetado pelo decorator @patch
-    mock_client = mock_openai_recall.return_value
-    mock_client.embeddings.create = AsyncMock(return_value=mock_openai_response)
+    mock_conn.fetch.return_value = rows
 
     # Obter o comando de recall
     memory_recall_cmd = bot.tree.get_command("memory recall")
     assert memory_recall_cmd is not None
 
     # Executar o comando
-    await memory_recall_cmd.callback(
-        mock_discord_interaction, query="linguagem de programação", limit=5
-    )
+    await memory_recall_cmd.callback(mock_discord_interaction, query=query, limit=5)
 
     # Verificar resposta
     mock_discord_interaction.response.send_message.assert_called_once()
-    call_args = mock_discord_interaction.response.send_message.call_args
-    response_text = call_args[0][0]
-    assert "Found 2 memories" in response_text or "memories" in response_text.lower()
-    assert "92%" in response_text or "85%" in response_text
-
-
-@pytest.mark.e2e
-@pytest.mark.discord
-@patch("src.memory.recall.AsyncOpenAI")
-@patch("src.knowledge.graph.AsyncOpenAI")
-async def test_memory_search_empty_results_flow(
-    mock_openai_graph, mock_openai_recall, bot_with_commands, mock_discord_interaction
-):
-    """Teste E2E do fluxo de busca sem resultados."""
-    ctx = bot_with_commands
-    bot = ctx.bot
-    mock_conn = ctx.conn
-
-    # Configurar mock para não retornar resultados
-    mock_conn.fetch.return_value = []
-
-    # Mock OpenAI para evitar chamadas reais de API
-    mock_openai_response = MagicMock()
-    mock_openai_response.data = [MagicMock(embedding=[0.1] * 1536)]
-
-    # Configurar o mock injetado
-    mock_client = mock_openai_recall.return_value
-    mock_client.embeddings.create = AsyncMock(return_value=mock_openai_response)
-
-    # Obter o comando de recall
-    memory_recall_cmd = bot.tree.get_command("memory recall")
-
-    # Executar o comando
-    await memory_recall_cmd.callback(mock_discord_interaction, query="algo que não existe", limit=5)
-
-    # Verificar mensagem de "não encontrado"
-    mock_discord_interaction.response.send_message.assert_called_once()
-    call_args = mock_discord_interaction.response.send_message.call_args
-    assert "No memories found" in call_args[0][0]
+    response_text = mock_discord_interaction.response.send_message.call_args[0][0]
+    for expected in expected_substrs:
+        assert expected in response_text
 
 
 # ============================================================================
@@ -173,215 +172,119 @@ async def test_memory_search_empty_results_flow(
 # ============================================================================
 
 
-@pytest.mark.e2e
-@pytest.mark.discord
-@patch("src.memory.recall.AsyncOpenAI")
-@patch("src.knowledge.graph.AsyncOpenAI")
-async def test_graph_add_node_command_flow(
-    mock_openai_graph, mock_openai_recall, bot_with_commands, mock_discord_interaction
-):
-    """Teste E2E do fluxo de adicionar nó ao grafo via /graph add_node."""
-    ctx = bot_with_commands
-    bot = ctx.bot
-    mock_conn = ctx.conn
-
-    # Configurar mocks
-    mock_conn.fetchval.return_value = "node-uuid-123"
-    mock_conn.fetchrow.return_value = {
-        "id": "node-uuid-123",
-        "label": "Python",
-        "node_type": "language",
-        "properties": {},
-        "embedding": None,
-        "created_at": None,
-        "updated_at": None,
-    }
-
-    # Obter o comando
-    graph_add_node_cmd = bot.tree.get_command("graph add_node")
-    assert graph_add_node_cmd is not None
-
-    # Configurar mock OpenAI recall e graph
-    mock_openai_response = MagicMock()
-    mock_openai_response.data = [MagicMock(embedding=[0.1] * 1536)]
-
-    mock_recall_client = mock_openai_recall.return_value
-    mock_recall_client.embeddings.create = AsyncMock(return_value=mock_openai_response)
-
-    mock_graph_client = mock_openai_graph.return_value
-    mock_graph_client.embeddings.create = AsyncMock(return_value=mock_openai_response)
-
-    # Configurar mocks para o nó criado
-    mock_conn.fetchval.return_value = "node-uuid-123"
-    mock_conn.fetchrow.return_value = {
-        "id": "node-uuid-123",
-        "label": "Python",
-        "node_type": "language",
+def _node_row(node_id: str, label: str, node_type: str) -> dict:
+    """Linha de nó retornada pelo banco após add_node."""
+    return {
+        "id": node_id,
+        "label": label,
+        "node_type": node_type,
         "properties": {},
-        "embedding": [0.1] * 1536,
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc),
+        "embedding": FAKE_EMBEDDING,
+        "created_at": _NOW,
+        "updated_at": _NOW,
     }
 
-    # Executar o comando
-    await graph_add_node_cmd.callback(
-        mock_discord_interaction, label="Python", node_type="language"
-    )
 
-    # Verificar resposta
-    mock_discord_interaction.response.send_message.assert_called_once()
-    call_args = mock_discord_interaction.response.send_message.call_args
-    assert "Python" in call_args[0][0]
-    assert "language" in call_args[0][0]
-
-
-@pytest.mark.e2e
-@pytest.mark.discord
-@patch("src.memory.recall.AsyncOpenAI")
-@patch("src.knowledge.graph.AsyncOpenAI")
-async def test_graph_add_edge_command_flow(
-    mock_openai_graph, mock_openai_recall, bot_with_commands, mock_discord_interaction
+@pytest.mark.parametrize(
+    ("command_name", "kwargs", "db_config", "expected_substrs"),
+    [
+        pytest.param(
+            "graph add_node",
+            {"label": "Python", "node_type": "language"},
+            {
+                "fetchval.return_value": "node-uuid-123",
+                "fetchrow.return_value": _node_row("node-uuid-123", "Python", "language"),
+            },
+            ("Python", "language"),
+            id="add_node",
+        ),
+        pytest.param(
+            "graph add_edge",
+            {"source": "Python", "target": "Discord", "edge_type": "used_for", "weight": 1.0},
+            {
+                # search_nodes não encontra nada -> cria origem, destino e a aresta
+                "fetch.return_value": [],
+                "fetchval.return_value": "uuid-gerado",
+                "fetchrow.side_effect": [
+                    _node_row("node-source-123", "Python", "language"),
+                    _node_row("node-target-789", "Discord API", "library"),
+                    {
+                        "id": "edge-uuid-456",
+                        "source_id": "node-source-123",
+                        "target_id": "node-target-789",
+                        "edge_type": "é_usado_em",
+                        "weight": 1.0,
+                        "properties": {},
+                        "created_at": _NOW,
+                    },
+                ],
+            },
+            ("Python", "Discord", "used_for"),
+            id="add_edge",
+        ),
+        pytest.param(
+            "graph query",
+            {"query": "bibliotecas para bots discord", "limit": 5},
+            {
+                "fetch.return_value": [
+                    {
+                        "id": "node-uuid-1",
+                        "label": "Python Programming",
+                        "node_type": "language",
+                        "properties": {},
+                        "similarity": 0.88,
+                        "created_at": None,
+                    },
+                    {
+                        "id": "node-uuid-2",
+                        "label": "Discord.py",
+                        "node_type": "library",
+                        "properties": {},
+                        "similarity": 0.75,
+                        "created_at": None,
+                    },
+                ],
+                # get_neighbors
+                "fetchrow.return_value": {
+                    "id": "neighbor-1",
+                    "label": "AsyncIO",
+                    "node_type": "concept",
+                    "properties": {},
+                },
+            },
+            ("Found 2 nodes", "Python Programming"),
+            id="query",
+        ),
+    ],
+)
+async def test_graph_command_flow(
+    bot_with_commands,
+    mock_discord_interaction,
+    command_name,
+    kwargs,
+    db_config,
+    expected_substrs,
 ):
-    """Teste E2E do fluxo de adicionar aresta ao grafo via /graph add_edge."""
+    """Teste E2E dos fluxos /graph add_node, add_edge e query."""
     ctx = bot_with_commands
     bot = ctx.bot
     mock_conn = ctx.conn
 
-    # Configurar mocks para busca de nós (não encontra) -> criação de nós -> criação de aresta
-    mock_conn.fetch.return_value = []  # search_nodes não encontra nada inicialmente
-    mock_conn.fetchval.return_value = "uuid-gerado"
-
-    # Criar resultados para as chamadas consecutivas de fetchrow:
-    # 1. add_node(source)
-    # 2. add_node(target)
-    # 3. add_edge(source, target)
-    now = datetime.now(timezone.utc)
-    res_source = {
-        "id": "node-source-123",
-        "label": "Python",
-        "node_type": "language",
-        "properties": {},
-        "embedding": [0.1] * 1536,
-        "created_at": now,
-        "updated_at": now,
-    }
-    res_target = {
-        "id": "node-target-789",
-        "label": "Discord API",
-        "node_type": "library",
-        "properties": {},
-        "embedding": [0.1] * 1536,
-        "created_at": now,
-        "updated_at": now,
-    }
-    res_edge = {
-        "id": "edge-uuid-456",
-        "source_id": "node-source-123",
-        "target_id": "node-target-789",
-        "edge_type": "é_usado_em",
-        "weight": 1.0,
-        "properties": {},
-        "created_at": now,
-    }
-
-    mock_conn.fetchrow.side_effect = [res_source, res_target, res_edge]
-
-    # Configurar mock OpenAI recall e graph
-    mock_openai_response = MagicMock()
-    mock_openai_response.data = [MagicMock(embedding=[0.1] * 1536)]
-
-    mock_recall_client = mock_openai_recall.return_value
-    mock_recall_client.embeddings.create = AsyncMock(return_value=mock_openai_response)
-
-    mock_graph_client = mock_openai_graph.return_value
-    mock_graph_client.embeddings.create = AsyncMock(return_value=mock_openai_response)
+    # Configurar mocks do banco para o comando
+    mock_conn.configure_mock(**db_config)
 
     # Obter o comando
-    graph_add_edge_cmd = bot.tree.get_command("graph add_edge")
-    assert graph_add_edge_cmd is not None
+    graph_cmd = bot.tree.get_command(command_name)
+    assert graph_cmd is not None
 
     # Executar o comando
-    await graph_add_edge_cmd.callback(
-        mock_discord_interaction,
-        source="Python",
-        target="Discord",
-        edge_type="used_for",
-        weight=1.0,
-    )
+    await graph_cmd.callback(mock_discord_interaction, **kwargs)
 
     # Verificar resposta
     mock_discord_interaction.response.send_message.assert_called_once()
-    call_args = mock_discord_interaction.response.send_message.call_args
-    response_text = call_args[0][0]
-    assert "Python" in response_text
-    assert "Discord" in response_text
-    assert "used_for" in response_text
-
-
-@pytest.mark.e2e
-@pytest.mark.discord
-@patch("src.memory.recall.AsyncOpenAI")
-@patch("src.knowledge.graph.AsyncOpenAI")
-async def test_graph_query_command_flow(
-    mock_openai_graph, mock_openai_recall, bot_with_commands, mock_discord_interaction
-):
-    """Teste E2E do fluxo de query no grafo via /graph query."""
-    ctx = bot_with_commands
-    bot = ctx.bot
-    mock_conn = ctx.conn
-
-    # Configurar mocks para busca de nós
-    mock_conn.fetch.return_value = [
-        {
-            "id": "node-uuid-1",
-            "label": "Python Programming",
-            "node_type": "language",
-            "properties": {},
-            "similarity": 0.88,
-            "created_at": None,
-        },
-        {
-            "id": "node-uuid-2",
-            "label": "Discord.py",
-            "node_type": "library",
-            "properties": {},
-            "similarity": 0.75,
-            "created_at": None,
-        },
-    ]
-
-    # Mock para get_neighbors
-    mock_conn.fetchrow.return_value = {
-        "id": "neighbor-1",
-        "label": "AsyncIO",
-        "node_type": "concept",
-        "properties": {},
-    }
-
-    # Obter o comando
-    graph_query_cmd = bot.tree.get_command("graph query")
-    assert graph_query_cmd is not None
-
-    # Configurar mock OpenAI recall e graph
-    mock_openai_response = MagicMock()
-    mock_openai_response.data = [MagicMock(embedding=[0.1] * 1536)]
-
-    mock_recall_client = mock_openai_recall.return_value
-    mock_recall_client.embeddings.create = AsyncMock(return_value=mock_openai_response)
-
-    mock_graph_client = mock_openai_graph.return_value
-    mock_graph_client.embeddings.create = AsyncMock(return_value=mock_openai_response)
-
-    # Executar o comando
-    await graph_query_cmd.callback(
-        mock_discord_interaction, query="bibliotecas para bots discord", limit=5
-    )
-
-    # Verificar resposta
-    mock_discord_interaction.response.send_message.assert_called_once()
-    call_args = mock_discord_interaction.response.send_message.call_args
-    response_text = call_args[0][0]
-    assert "nodes" in response_text.lower() or "Python Programming" in response_text
+    response_text = mock_discord_interaction.response.send_message.call_args[0][0]
+    for expected in expected_substrs:
+        assert expected in response_text
 
 
 # ============================================================================
@@ -389,35 +292,35 @@ async def test_graph_query_command_flow(
 # ============================================================================
 
 
-@pytest.mark.e2e
-@pytest.mark.discord
-@pytest.mark.asyncio
-async def test_help_command_flow(bot_with_commands, mock_discord_interaction):
-    """Teste E2E do fluxo do comando /help."""
-    ctx = bot_with_commands
-    bot = ctx.bot
-    mock_conn = ctx.conn
+@pytest.mark.parametrize(
+    ("command_name", "expected_substrs"),
+    [
+        pytest.param("help", ("Agnaldo Bot Commands", "/ping", "/help", "/status"), id="help"),
+        pytest.param(
+            "status", ("Agnaldo Bot Status", "@Agnaldo", "Rate Limit Status"), id="status"
+        ),
+    ],
+)
+async def test_simple_command_flow(
+    bot_with_commands, mock_discord_interaction, command_name, expected_substrs
+):
+    """Teste E2E dos comandos /help e /status, que respondem direto com texto."""
+    bot = bot_with_commands.bot
 
-    # Obter o comando help
-    help_cmd = bot.tree.get_command("help")
-    assert help_cmd is not None
+    # Obter o comando
+    cmd = bot.tree.get_command(command_name)
+    assert cmd is not None
 
     # Executar o comando
-    await help_cmd.callback(mock_discord_interaction)
+    await cmd.callback(mock_discord_interaction)
 
     # Verificar resposta
     mock_discord_interaction.response.send_message.assert_called_once()
-    call_args = mock_discord_interaction.response.send_message.call_args
-    response_text = call_args[0][0]
-    assert "Agnaldo Bot Commands" in response_text
-    assert "/ping" in response_text
-    assert "/help" in response_text
-    assert "/status" in response_text
+    response_text = mock_discord_interaction.response.send_message.call_args[0][0]
+    for expected in expected_substrs:
+        assert expected in response_text
 
 
-@pytest.mark.e2e
-@pytest.mark.discord
-@pytest.mark.asyncio
 async def test_ping_command_flow(bot_with_commands, mock_discord_interaction):
     """Teste E2E do fluxo do comando /ping."""
     ctx = bot_with_commands
@@ -437,32 +340,7 @@ async def test_ping_command_flow(bot_with_commands, mock_discord_interaction):
     call_args = mock_discord_interaction.followup.send.call_args
 
     assert "Pong!" in call_args[0][0]
-    assert re.search(r"\d+ms", call_args[0][0])  # Verifica latência via regex
-
-
-@pytest.mark.e2e
-@pytest.mark.discord
-@pytest.mark.asyncio
-async def test_status_command_flow(bot_with_commands, mock_discord_interaction):
-    """Teste E2E do fluxo do comando /status."""
-    ctx = bot_with_commands
-    bot = ctx.bot
-    mock_conn = ctx.conn
-
-    # Obter o comando status
-    status_cmd = bot.tree.get_command("status")
-    assert status_cmd is not None
-
-    # Executar o comando
-    await status_cmd.callback(mock_discord_interaction)
-
-    # Verificar resposta
-    mock_discord_interaction.response.send_message.assert_called_once()
-    call_args = mock_discord_interaction.response.send_message.call_args
-    response_text = call_args[0][0]
-    assert "Agnaldo Bot Status" in response_text
-    assert "@Agnaldo" in response_text
-    assert "Rate Limit Status" in response_text
+    assert _MS_RE.search(call_args[0][0])  # Verifica latência via regex
 
 
 # ============================================================================
@@ -470,103 +348,70 @@ async def test_status_command_flow(bot_with_commands, mock_discord_interaction):
 # ============================================================================
 
 
-@pytest.mark.e2e
-@pytest.mark.discord
-@patch("src.memory.recall.AsyncOpenAI")
-@patch("src.knowledge.graph.AsyncOpenAI")
-async def test_multi_command_session(mock_openai_graph, mock_openai_recall, bot_with_commands):
-    """Teste E2E de múltiplos comandos em sequência simulando uma sessão."""
+async def test_multi_command_session(
+    bot_with_commands,
+    interaction_factory,
+):
+    """Teste E2E de múltiplos comandos simultâneos na mesma sessão."""
     ctx = bot_with_commands
     bot = ctx.bot
     mock_conn = ctx.conn
 
-    # Configurar mock OpenAI recall e graph para a sessão
-    mock_openai_response = MagicMock()
-    mock_openai_response.data = [MagicMock(embedding=[0.1] * 1536)]
-    mock_client_recall = mock_openai_recall.return_value
-    mock_client_recall.embeddings.create = AsyncMock(return_value=mock_openai_response)
-    mock_client_graph = mock_openai_graph.return_value
-    mock_client_graph.embeddings.create = AsyncMock(return_value=mock_openai_response)
-
-    # Comando 1: Adicionar memória
-    interaction1 = MagicMock()
-    interaction1.response.is_done.return_value = False
-    interaction1.response.send_message = AsyncMock()
-    interaction1.user.id = 123456789
-    interaction1.channel_id = 987654321
-
-    mock_conn.fetch.return_value = []
-    mock_conn.fetchval.return_value = "uuid-1"
-
-    memory_add_cmd = bot.tree.get_command("memory add")
-    await memory_add_cmd.callback(interaction1, key="projeto", value="Agnaldo Bot", importance=0.9)
-
-    # Verificar primeiro comando
-    interaction1.response.send_message.assert_called_once()
-    assert "projeto" in interaction1.response.send_message.call_args[0][0]
-
-    # Reset mocks para próximo comando
-    mock_conn.reset_mock()
-
-    # Comando 2: Adicionar nó ao grafo
-    interaction2 = MagicMock()
-    interaction2.response.is_done.return_value = False
-    interaction2.response.send_message = AsyncMock()
-    interaction2.user.id = 123456789
-    interaction2.channel_id = 987654321
-
-    mock_conn.fetchval.return_value = "node-uuid-1"
+    # Os três comandos rodam concorrentemente e a ordem das consultas não é
+    # fixa: as respostas do banco dependem da tabela consultada, não da ordem.
+    recall_rows = [
+        {
+            "id": "uuid-1",
+            "content": "Agnaldo Bot",
+            "importance": 0.9,
+            "similarity": 0.95,
+            "distance": 0.05,
+            "created_at": _NOW,
+            "updated_at": _NOW,
+            "access_count": 0,
+        }
+    ]
+    mock_conn.fetch.side_effect = lambda query, *args: (
+        recall_rows if "recall_memories" in query else []
+    )
+    mock_conn.fetchval.side_effect = lambda query, *args: (
+        "node-uuid-1" if "knowledge_nodes" in query else "uuid-1"
+    )
     mock_conn.fetchrow.return_value = {
         "id": "node-uuid-1",
         "label": "Python",
         "node_type": "language",
         "properties": {},
-        "embedding": [0.1] * 1536,
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc),
+        "embedding": FAKE_EMBEDDING,
+        "created_at": _NOW,
+        "updated_at": _NOW,
     }
 
+    interaction1, interaction2, interaction3 = (interaction_factory() for _ in range(3))
+    memory_add_cmd = bot.tree.get_command("memory add")
     graph_add_node_cmd = bot.tree.get_command("graph add_node")
-    await graph_add_node_cmd.callback(interaction2, label="Python", node_type="language")
+    memory_recall_cmd = bot.tree.get_command("memory recall")
+
+    # Adicionar memória, adicionar nó ao grafo e buscar memória ao mesmo tempo
+    await asyncio.gather(
+        memory_add_cmd.callback(interaction1, key="projeto", value="Agnaldo Bot", importance=0.9),
+        graph_add_node_cmd.callback(interaction2, label="Python", node_type="language"),
+        memory_recall_cmd.callback(interaction3, query="nome do projeto", limit=5),
+    )
+
+    # Verificar primeiro comando
+    interaction1.response.send_message.assert_called_once()
+    assert "projeto" in interaction1.response.send_message.call_args[0][0]
 
     # Verificar segundo comando
     interaction2.response.send_message.assert_called_once()
     assert "Python" in interaction2.response.send_message.call_args[0][0]
 
-    # Reset mocks para próximo comando
-    mock_conn.reset_mock()
-
-    # Comando 3: Buscar memória
-    interaction3 = MagicMock()
-    interaction3.response.is_done.return_value = False
-    interaction3.response.send_message = AsyncMock()
-    interaction3.user.id = 123456789
-    interaction3.channel_id = 987654321
-
-    now = datetime.now(timezone.utc)
-    mock_conn.fetch.return_value = [
-        {
-            "id": "uuid-1",
-            "content": "Agnaldo Bot",
-            "importance": 0.9,
-            "similarity": 0.95,
-            "created_at": now,
-            "updated_at": now,
-            "access_count": 0,
-        }
-    ]
-
-    memory_recall_cmd = bot.tree.get_command("memory recall")
-    await memory_recall_cmd.callback(interaction3, query="nome do projeto", limit=5)
-
     # Verificar terceiro comando
     interaction3.response.send_message.assert_called_once()
-    assert "memories" in interaction3.response.send_message.call_args[0][0].lower()
+    assert "Found 1 memories" in interaction3.response.send_message.call_args[0][0]
 
 
-@pytest.mark.e2e
-@pytest.mark.discord
-@pytest.mark.asyncio
 async def test_command_without_database_flow(bot_with_commands, mock_discord_interaction):
     """Teste E2E do comportamento quando banco de dados não está disponível."""
     ctx = bot_with_commands
@@ -588,9 +433,6 @@ async def test_command_without_database_flow(bot_with_commands, mock_discord_int
     assert "Database not available" in call_args[0][0]
 
 
-@pytest.mark.e2e
-@pytest.mark.discord
-@pytest.mark.asyncio
 async def test_command_with_database_error_flow(bot_with_commands, mock_discord_interaction):
     """Teste E2E do comportamento quando ocorre erro no banco de dados."""
     ctx = bot_with_commands
@@ -618,10 +460,7 @@ async def test_command_with_database_error_flow(bot_with_commands, mock_discord_
 # ============================================================================
 
 
-@pytest.mark.e2e
-@pytest.mark.discord
-@pytest.mark.asyncio
-async def test_rate_limiting_on_commands(bot_with_commands):
+async def test_rate_limiting_on_commands(bot_with_commands, interaction_factory):
     """Teste E2E de que rate limiter é aplicado aos comandos."""
     ctx = bot_with_commands
     bot = ctx.bot
@@ -630,11 +469,7 @@ async def test_rate_limiting_on_commands(bot_with_commands):
     # Criar múltiplas interações no mesmo canal
     interactions = []
     for i in range(3):
-        interaction = MagicMock()
-        interaction.response.is_done.return_value = False
-        interaction.response.send_message = AsyncMock()
-        interaction.user.id = 123456789
-        interaction.channel_id = 987654321  # Mesmo canal
+        interaction = interaction_factory()  # Mesmo usuário e canal
         interactions.append(interaction)
 
     # Configurar mocks
@@ -659,17 +494,21 @@ async def test_rate_limiting_on_commands(bot_with_commands):
 # ============================================================================
 
 
-@pytest.mark.e2e
-@pytest.mark.discord
-@pytest.mark.asyncio
-async def test_sync_command_admin_flow(bot_with_commands, mock_discord_interaction):
-    """Teste E2E do comando /sync com permissões de admin."""
-    ctx = bot_with_commands
-    bot = ctx.bot
-    mock_conn = ctx.conn
+@pytest.mark.parametrize(
+    ("guild_permissions", "expected"),
+    [
+        pytest.param(SimpleNamespace(administrator=True), "synced", id="admin"),
+        pytest.param(None, "administrator permissions", id="sem_permissao"),
+    ],
+)
+async def test_sync_command_flow(
+    bot_with_commands, mock_discord_interaction, guild_permissions, expected
+):
+    """Teste E2E do comando /sync com e sem permissões de admin."""
+    bot = bot_with_commands.bot
 
-    # Configurar usuário como admin
-    mock_discord_interaction.user.guild_permissions.administrator = True
+    # Configurar as permissões do usuário
+    mock_discord_interaction.user.guild_permissions = guild_permissions
 
     # Obter o comando sync
     sync_cmd = bot.tree.get_command("sync")
@@ -678,31 +517,6 @@ async def test_sync_command_admin_flow(bot_with_commands, mock_discord_interacti
     # Executar o comando
     await sync_cmd.callback(mock_discord_interaction)
 
-    # Verificar resposta de sucesso
-    mock_discord_interaction.response.send_message.assert_called_once()
-    call_args = mock_discord_interaction.response.send_message.call_args
-    assert "synced" in call_args[0][0].lower()
-
-
-@pytest.mark.e2e
-@pytest.mark.discord
-@pytest.mark.asyncio
-async def test_sync_command_non_admin_flow(bot_with_commands, mock_discord_interaction):
-    """Teste E2E do comando /sync sem permissões de admin."""
-    ctx = bot_with_commands
-    bot = ctx.bot
-    mock_conn = ctx.conn
-
-    # Configurar usuário sem permissões de admin
-    mock_discord_interaction.user.guild_permissions = None
-
-    # Obter o comando sync
-    sync_cmd = bot.tree.get_command("sync")
-
-    # Executar o comando
-    await sync_cmd.callback(mock_discord_interaction)
-
-    # Verificar resposta de permissão negada
+    # Verificar resposta
     mock_discord_interaction.response.send_message.assert_called_once()
-    call_args = mock_discord_interaction.response.send_message.call_args
-    assert "administrator permissions" in call_args[0][0].lower()
+    assert expected in mock_discord_interaction.response.send_message.call_args[0][0].lower()
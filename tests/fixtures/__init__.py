@@ -26,6 +26,7 @@ from typing import Any
 
 # Exporta funções mais comuns para facilitar imports
 from tests.fixtures.discord import (
+    create_light_interaction,
     create_mock_bot,
     create_mock_channel,
     create_mock_guild,
@@ -85,6 +86,7 @@ __all__ = [
     # Discord mocks
     "create_mock_user",
     "create_mock_message",
+    "create_light_interaction",
     "create_mock_interaction",
     "create_mock_guild",
     "create_mock_channel",
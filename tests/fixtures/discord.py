@@ -5,6 +5,7 @@ para facilitar testes isolados de componentes Discord.
 """
 
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -215,6 +216,49 @@ def create_mock_interaction(
     return mock_interaction
 
 
+def create_light_interaction(
+    user_id: int = 123456789,
+    channel_id: int = 987654321,
+    guild_id: int | None = 111222333,
+    response_done: bool = False,
+) -> SimpleNamespace:
+    """Cria uma Interaction leve para testes que só leem atributos.
+
+    Diferente de ``create_mock_interaction``, usa ``SimpleNamespace`` nos
+    contêineres; apenas os métodos aguardados pelos comandos são ``AsyncMock``.
+    Atributos não definidos aqui levantam ``AttributeError``.
+
+    Args:
+        user_id: ID do usuário.
+        channel_id: ID do canal da interação.
+        guild_id: ID do servidor, ou None para DM.
+        response_done: Valor retornado por ``response.is_done()``.
+
+    Returns:
+        SimpleNamespace com a forma de uma Interaction do Discord.
+    """
+    user = SimpleNamespace(
+        id=user_id,
+        name="TestUser",
+        global_name="Test User",
+        guild_permissions=SimpleNamespace(administrator=False),
+    )
+    guild = SimpleNamespace(id=guild_id, name="Test Guild") if guild_id else None
+
+    return SimpleNamespace(
+        user=user,
+        guild=guild,
+        guild_id=guild_id,
+        channel_id=channel_id,
+        response=SimpleNamespace(
+            is_done=lambda: response_done,
+            send_message=AsyncMock(),
+            defer=AsyncMock(),
+        ),
+        followup=SimpleNamespace(send=AsyncMock()),
+    )
+
+
 def create_mock_bot(
     bot_id: int = 111222333444555666,
     username: str = "Agnaldo",
@@ -329,8 +373,8 @@ def mock_discord_message():
 
 @pytest.fixture
 def mock_discord_interaction():
-    """Fixture pytest que retorna um mock de Interaction do Discord."""
-    return create_mock_interaction()
+    """Fixture pytest que retorna uma Interaction leve do Discord."""
+    return create_light_interaction()
 
 
 @pytest.fixture
@@ -5,6 +5,7 @@ usando Faker, facilitando a criação de dados realistas.
 """
 
 import hashlib
+import itertools
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
@@ -15,6 +16,11 @@ from faker import Faker
 # Instância singleton do Faker com locale pt-BR
 _fake = Faker("pt_BR")
 
+# Sentenças e palavras geradas uma única vez, na importação; as factories só
+# percorrem estes pools em vez de pedir texto novo ao Faker a cada chamada.
+_SENTENCES = itertools.cycle([_fake.sentence() for _ in range(256)])
+_WORDS = itertools.cycle(_fake.words(nb=128, unique=True))
+
 
 def get_faker() -> Faker:
     """Retorna a instância do Faker.
@@ -91,7 +97,7 @@ def create_test_memory_item(
 
     if content is None:
         # Gera conteúdo mais realista baseado em contexto
-        content = _fake.sentence()
+        content = next(_SENTENCES)
 
     if user_id is None:
         user_id = str(_fake.random_int(min=100000000000000000, max=999999999999999999))
@@ -166,7 +172,7 @@ def create_test_graph_node(
         node_id = str(uuid4())
 
     if label is None:
-        label = _fake.word()
+        label = next(_WORDS)
 
     if node_type is None:
         node_type = _fake.word(
@@ -184,7 +190,7 @@ def create_test_graph_node(
         "label": label,
         "node_type": node_type,
         "properties": {
-            "description": _fake.sentence() if _fake.boolean() else None,
+            "description": next(_SENTENCES) if _fake.boolean() else None,
             "created_by": "test",
         },
         "embedding": embedding,
@@ -276,7 +282,7 @@ def create_test_discord_message(
         message_id = str(_fake.random_int(min=100000000000000000, max=999999999999999999))
 
     if content is None:
-        content = _fake.sentence()
+        content = next(_SENTENCES)
 
     if user_id is None:
         user_id = str(_fake.random_int(min=100000000000000000, max=999999999999999999))
@@ -332,7 +338,7 @@ def create_test_agent_message(
         Dict com dados de mensagem compatível com AgentMessage schema.
     """
     if content is None:
-        content = {"action": _fake.word(), "params": {}}
+        content = {"action": next(_WORDS), "params": {}}
 
     return {
         "id": str(uuid4()),
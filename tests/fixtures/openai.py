@@ -4,11 +4,17 @@ Este módulo fornece mocks assíncronos do cliente OpenAI
 para testes de embeddings e chat completions.
 """
 
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+# Embedding fixo dos testes que só repassam o vetor; tupla para que nenhum
+# teste o altere e para ser compartilhado sem cópias.
+FAKE_EMBEDDING: tuple[float, ...] = (0.1,) * 1536
+
 
 def create_mock_embedding(
     embedding: list[float] | None = None,
@@ -262,6 +268,72 @@ class MockOpenAIChatCompletionResponse:
             self.total_tokens = total_tokens
 
 
+# Variantes imutáveis das respostas acima, para compartilhar entre testes sem
+# montar árvores de MagicMock a cada teste.
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenEmbeddingData:
+    """Item imutável de ``response.data`` em embeddings."""
+
+    embedding: Sequence[float]
+    index: int = 0
+    object: str = "embedding"
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenEmbeddingResponse:
+    """Resposta imutável de ``embeddings.create``."""
+
+    data: tuple[FrozenEmbeddingData, ...]
+    model: str = "text-embedding-3-small"
+    object: str = "list"
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenChatMessage:
+    """Mensagem imutável de uma choice de chat completion."""
+
+    content: str
+    role: str = "assistant"
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenChatChoice:
+    """Choice imutável de chat completion."""
+
+    message: FrozenChatMessage
+    index: int = 0
+    finish_reason: str = "stop"
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenChatUsage:
+    """Usage imutável de chat completion."""
+
+    prompt_tokens: int = 20
+    completion_tokens: int = 10
+    total_tokens: int = 30
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenChatCompletionResponse:
+    """Resposta imutável de ``chat.completions.create``."""
+
+    choices: tuple[FrozenChatChoice, ...]
+    usage: FrozenChatUsage
+    model: str = "gpt-4o"
+
+
+SHARED_EMBEDDING_RESPONSE = FrozenEmbeddingResponse(
+    data=(FrozenEmbeddingData(embedding=FAKE_EMBEDDING),)
+)
+SHARED_CHAT_COMPLETION = FrozenChatCompletionResponse(
+    choices=(FrozenChatChoice(message=FrozenChatMessage(content="Mocked response")),),
+    usage=FrozenChatUsage(prompt_tokens=60, completion_tokens=40, total_tokens=100),
+)
+
+
 @pytest.fixture
 def mock_openai_client():
     """Fixture pytest que retorna um mock do cliente OpenAI."""
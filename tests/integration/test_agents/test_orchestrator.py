@@ -74,15 +74,6 @@ async def mock_openai_with_embeddings():
     return _build_mock_openai_with_embeddings()
 
 
-@pytest.fixture
-async def mock_asyncpg_pool():
-    """Fixture for mock asyncpg pool."""
-    mock_conn = AsyncMock()
-    # Mock for recall memory search
-    mock_conn.fetch.return_value = []
-    return _build_mock_pool(mock_conn)
-
-
 @pytest.fixture
 async def mock_asyncpg_pool_with_memories():
     """Fixture for mock asyncpg pool with pre-existing memories."""
@@ -98,6 +89,7 @@ async def mock_asyncpg_pool_with_memories():
             "content": "Previous conversation about AI",
             "importance": 0.7,
             "similarity": 0.85,
+            "distance": 0.15,
             "created_at": datetime.now(timezone.utc),
             "updated_at": datetime.now(timezone.utc),
             "last_accessed": datetime.now(timezone.utc),
@@ -113,6 +113,15 @@ class TestOpenAIMocks:
         assert client.chat.completions is not None
         assert client.chat.completions.create is not None
 
+    async def test_mock_openai_client_fixture(self, mock_openai_client):
+        """Testa as respostas compartilhadas do fixture mock_openai_client."""
+        chat = await mock_openai_client.chat.completions.create(model="gpt-4o", messages=[])
+        embedding = await mock_openai_client.embeddings.create(model="x", input="texto")
+
+        assert chat.choices[0].message.content == "Mocked response"
+        assert chat.usage.total_tokens == 100
+        assert len(embedding.data[0].embedding) == 1536
+
 
 class TestFactories:
     """Testes para factories de dados de teste."""
@@ -1,11 +1,13 @@
 """Unit tests for ArchivalMemory validation and edge cases."""
 
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.exceptions import DatabaseError, MemoryServiceError
 from src.memory.archival import ArchivalMemory
+from src.schemas.memory import encode_cursor
 
 
 def _build_mock_pool(mock_conn: AsyncMock) -> MagicMock:
@@ -95,3 +97,71 @@ async def test_update_metadata_not_found_returns_false():
     success = await archival.update_metadata(memory_id="00000000-0000-0000-0000-000000000000", metadata={"k": "v"})
 
     assert success is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_by_metadata_with_cursor_uses_keyset():
+    """ArchivalMemory.search_by_metadata should seek past the cursor instead of using OFFSET."""
+    mock_conn = AsyncMock()
+    mock_conn.fetch.return_value = []
+    archival = ArchivalMemory(user_id="user-1", repository=_build_mock_pool(mock_conn))
+    last_seen = datetime(2026, 2, 17, 12, 0, tzinfo=timezone.utc)
+
+    await archival.search_by_metadata(filters={"topic": "penal"}, limit=10, cursor=encode_cursor(last_seen, "row-id"))
+
+    query, *params = mock_conn.fetch.call_args.args
+    assert "(created_at, id) < ($3::timestamptz, $4::uuid)" in query
+    assert "OFFSET" not in query
+    assert params == ["user-1", "penal", last_seen, "row-id", 10]
+
+
+def _archival_row(row_id: str, created_at: datetime) -> dict:
+    """Build an archival_memories row as returned by asyncpg."""
+    return {
+        "id": row_id,
+        "content": f"Conteúdo {row_id}",
+        "source": "discord",
+        "metadata": {"topic": "penal"},
+        "session_id": None,
+        "compressed": False,
+        "compressed_into_id": None,
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_page_by_metadata_walks_consecutive_pages():
+    """ArchivalMemory.search_page_by_metadata should hand out cursors until the last page."""
+    first_ts = datetime(2026, 2, 17, 12, 0, tzinfo=timezone.utc)
+    second_ts = datetime(2026, 2, 16, 12, 0, tzinfo=timezone.utc)
+    third_ts = datetime(2026, 2, 15, 12, 0, tzinfo=timezone.utc)
+    mock_conn = AsyncMock()
+    mock_conn.fetch.side_effect = [
+        [_archival_row("row-1", first_ts), _archival_row("row-2", second_ts)],
+        [_archival_row("row-3", third_ts)],
+    ]
+    archival = ArchivalMemory(user_id="user-1", repository=_build_mock_pool(mock_conn))
+
+    first_page, cursor = await archival.search_page_by_metadata({"topic": "penal"}, limit=2)
+    second_page, last_cursor = await archival.search_page_by_metadata({"topic": "penal"}, limit=2, cursor=cursor)
+
+    assert [r["memory_id"] for r in first_page] == ["row-1", "row-2"]
+    assert cursor == encode_cursor(second_ts, "row-2")
+    assert [r["memory_id"] for r in second_page] == ["row-3"]
+    assert last_cursor is None
+    query, *params = mock_conn.fetch.call_args.args
+    assert "OFFSET" not in query
+    assert params == ["user-1", "penal", second_ts, "row-2", 2]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_by_metadata_invalid_cursor_raises():
+    """ArchivalMemory.search_by_metadata should reject malformed cursors."""
+    archival = ArchivalMemory(user_id="user-1", repository=MagicMock())
+
+    with pytest.raises(MemoryServiceError, match="Invalid pagination cursor"):
+        await archival.search_by_metadata(filters={"topic": "penal"}, cursor="not-a-cursor")
@@ -5,6 +5,7 @@ testing semantic search functionality, embedding generation, and error handling.
 All database operations are mocked to ensure isolated, fast unit tests.
 """
 
+import asyncio
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -107,6 +108,7 @@ async def test_search_by_embedding(
             "content": "Python é uma linguagem de programação",
             "importance": 0.8,
             "similarity": 0.92,
+            "distance": 0.08,
             "created_at": datetime.now(timezone.utc),
             "updated_at": datetime.now(timezone.utc),
             "access_count": 5,
@@ -170,6 +172,7 @@ async def test_search_by_content(
             "content": "Machine learning é um ramo da IA",
             "importance": 0.9,
             "similarity": 0.88,
+            "distance": 0.12,
             "created_at": datetime.now(timezone.utc),
             "updated_at": None,
             "access_count": 2,
@@ -179,6 +182,7 @@ async def test_search_by_content(
             "content": "Redes neurais processam dados",
             "importance": 0.75,
             "similarity": 0.82,
+            "distance": 0.18,
             "created_at": datetime.now(timezone.utc),
             "updated_at": None,
             "access_count": 1,
@@ -246,6 +250,7 @@ async def test_threshold_filtering(
             "content": "Resultado altamente relevante",
             "importance": 1.0,
             "similarity": 0.95,
+            "distance": 0.05,
             "created_at": datetime.now(timezone.utc),
             "updated_at": None,
             "access_count": 10,
@@ -307,6 +312,7 @@ async def test_threshold_with_min_importance(
             "content": "Memória importante",
             "importance": 0.9,
             "similarity": 0.85,
+            "distance": 0.15,
             "created_at": datetime.now(timezone.utc),
             "updated_at": None,
             "access_count": 3,
@@ -699,3 +705,193 @@ async def test_search_with_limit_parameter(
     # Check that limit (5) is in the call args
     # Args: query_embedding_str, user_id, min_importance, max_distance, limit
     assert 5 in call_args[0]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_acquires_connection_before_embedding(
+    recall_memory, mock_db_pool, mock_openai_client, sample_embedding
+):
+    """Test that the pool connection is acquired while the embedding is generated."""
+    acquire_cm = mock_db_pool.acquire.return_value
+
+    async def create_embedding(**kwargs):
+        # The acquire task was scheduled before the OpenAI call started
+        await asyncio.sleep(0)
+        assert acquire_cm.__aenter__.await_count == 1
+        mock_response = MagicMock()
+        mock_response.data[0].embedding = sample_embedding
+        return mock_response
+
+    mock_openai_client.embeddings.create.side_effect = create_embedding
+    acquire_cm.__aenter__.return_value.fetch.return_value = []
+
+    await recall_memory.search(query="test")
+
+    acquire_cm.__aexit__.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_releases_connection_on_embedding_failure(
+    recall_memory, mock_db_pool, mock_openai_client
+):
+    """Test that a background-acquired connection is released if embedding fails."""
+
+    async def create_embedding(**kwargs):
+        # Let the acquire task finish before the OpenAI call fails
+        await asyncio.sleep(0)
+        raise Exception("API timeout")
+
+    mock_openai_client.embeddings.create.side_effect = create_embedding
+
+    with pytest.raises(EmbeddingGenerationError):
+        await recall_memory.search(query="test query")
+
+    acquire_cm = mock_db_pool.acquire.return_value
+    acquire_cm.__aenter__.assert_awaited_once()
+    acquire_cm.__aexit__.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_cancels_pending_acquire_on_embedding_failure(
+    recall_memory, mock_db_pool, mock_openai_client
+):
+    """Test that an acquire still waiting for the pool is cancelled, not released."""
+    acquire_cm = mock_db_pool.acquire.return_value
+    acquire_cm.__aenter__.side_effect = asyncio.Event().wait
+    mock_openai_client.embeddings.create.side_effect = Exception("API timeout")
+
+    with pytest.raises(EmbeddingGenerationError):
+        await recall_memory.search(query="test query")
+
+    acquire_cm.__aexit__.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_cancellation_propagates_while_acquire_pending(
+    recall_memory, mock_db_pool, mock_openai_client
+):
+    """Test that cancelling the caller is not swallowed while a pending acquire winds down."""
+    acquire_cm = mock_db_pool.acquire.return_value
+    acquire_cancelled = asyncio.Event()
+    pool_released = asyncio.Event()
+
+    async def slow_acquire():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            # The pool takes a moment to give up the pending acquire
+            acquire_cancelled.set()
+            await pool_released.wait()
+            raise
+
+    async def create_embedding(**kwargs):
+        # Let the acquire start waiting on the pool before the OpenAI call fails
+        await asyncio.sleep(0)
+        raise Exception("API timeout")
+
+    acquire_cm.__aenter__.side_effect = slow_acquire
+    mock_openai_client.embeddings.create.side_effect = create_embedding
+
+    search = asyncio.create_task(recall_memory.search(query="test query"))
+    await acquire_cancelled.wait()
+    search.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await search
+    pool_released.set()
+    acquire_cm.__aexit__.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_after_cursor(
+    recall_memory, mock_db_pool, mock_openai_client, sample_embedding
+):
+    """Test that ``after`` adds a (distance, id) keyset predicate and results carry cursors."""
+    mock_response = MagicMock()
+    mock_response.data[0].embedding = sample_embedding
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    mock_conn = mock_db_pool.acquire.return_value.__aenter__.return_value
+    mock_conn.fetch.return_value = [
+        {
+            "id": "550e8400-e29b-41d4-a716-446655440010",
+            "content": "Segunda página",
+            "importance": 0.5,
+            "similarity": 0.75,
+            "distance": 0.25,
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc),
+            "access_count": 0,
+        }
+    ]
+    mock_conn.execute.return_value = None
+
+    after = (0.25, "550e8400-e29b-41d4-a716-446655440009")
+    results = await recall_memory.search(query="test", limit=5, after=after)
+
+    sql, *params = mock_conn.fetch.call_args[0]
+    # Ties on distance are broken by id, both in the predicate and the ordering
+    assert "(embedding <=> $1::vector, id) > ($6, $7::uuid)" in sql
+    assert "ORDER BY embedding <=> $1::vector, id" in sql
+    assert params[-2:] == [0.25, "550e8400-e29b-41d4-a716-446655440009"]
+    assert results[0]["distance"] == 0.25
+    assert results[0]["cursor"] == (0.25, "550e8400-e29b-41d4-a716-446655440010")
+
+    # Without a cursor the predicate and its parameters are omitted
+    await recall_memory.search(query="test", limit=5)
+    sql, *params = mock_conn.fetch.call_args[0]
+    assert "$6" not in sql
+    assert len(params) == 5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_add_many_single_round_trip(
+    recall_memory, mock_db_pool, mock_openai_client, sample_embedding
+):
+    """Test that add_many embeds in one request and inserts in one query."""
+    mock_response = MagicMock()
+    mock_response.data = [
+        MagicMock(index=1, embedding=sample_embedding),
+        MagicMock(index=0, embedding=sample_embedding),
+    ]
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    mock_conn = mock_db_pool.acquire.return_value.__aenter__.return_value
+    mock_conn.fetch.return_value = [{"id": "uuid-a"}, {"id": "uuid-b"}]
+
+    memory_ids = await recall_memory.add_many([("primeira", 0.4), ("segunda", 0.9)])
+
+    assert memory_ids == ["uuid-a", "uuid-b"]
+    mock_openai_client.embeddings.create.assert_called_once()
+    assert mock_openai_client.embeddings.create.call_args.kwargs["input"] == [
+        "primeira",
+        "segunda",
+    ]
+    mock_conn.fetch.assert_called_once()
+    sql, user_id, contents, embeddings, importances = mock_conn.fetch.call_args[0]
+    assert "unnest" in sql
+    assert user_id == "test_user_123"
+    assert contents == ["primeira", "segunda"]
+    assert len(embeddings) == 2
+    assert importances == [0.4, 0.9]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_add_many_validation(recall_memory, mock_openai_client):
+    """Test that add_many validates every item and skips work for empty input."""
+    assert await recall_memory.add_many([]) == []
+
+    with pytest.raises(MemoryServiceError):
+        await recall_memory.add_many([("ok", 0.5), ("", 0.5)])
+
+    with pytest.raises(MemoryServiceError):
+        await recall_memory.add_many([("ok", 1.5)])
+
+    mock_openai_client.embeddings.create.assert_not_called()
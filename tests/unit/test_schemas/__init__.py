@@ -0,0 +1 @@
+"""Testes unitários dos schemas Pydantic."""
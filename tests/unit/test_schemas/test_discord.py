@@ -0,0 +1,212 @@
+"""Testes unitários para os schemas Discord."""
+
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+import src.schemas.discord as discord_schemas
+from src.schemas.discord import (
+    DiscordChannel,
+    DiscordCommand,
+    DiscordGuild,
+    DiscordMessage,
+    DiscordUser,
+    dump_messages_json,
+    validate_message,
+    validate_messages,
+)
+
+
+class TestDiscordSchemas:
+    """Testes para os modelos Pydantic de entidades Discord."""
+
+    def test_examples_are_exposed_in_json_schema(self) -> None:
+        """Verifica se os exemplos de model_config chegam ao JSON schema."""
+        for model in (DiscordUser, DiscordMessage, DiscordCommand, DiscordChannel, DiscordGuild):
+            schema = model.model_json_schema()
+            assert schema["examples"], model.__name__
+
+    def test_examples_validate(self) -> None:
+        """Verifica se cada exemplo documentado é um payload válido."""
+        for model in (DiscordUser, DiscordMessage, DiscordCommand, DiscordChannel, DiscordGuild):
+            for example in model.model_json_schema()["examples"]:
+                model.model_validate(example)
+
+    def test_type_fields_are_plain_strings(self) -> None:
+        """Verifica se os campos de tipo são strings literais."""
+        command = DiscordCommand(id="1", application_id="2", name="ask", version="1")
+        channel = DiscordChannel(id="3", type="guild_text")
+
+        assert command.type == "chat_input"
+        assert channel.type == "guild_text"
+
+    def test_unknown_type_is_rejected(self) -> None:
+        """Verifica se tipos fora do conjunto literal são rejeitados."""
+        with pytest.raises(ValidationError):
+            DiscordChannel(id="3", type="guild_forum")
+
+
+class TestValidateMessages:
+    """Testes para a validação em lote de mensagens."""
+
+    def test_validate_messages_from_json_and_python(self) -> None:
+        """Verifica se bytes JSON e listas de dicts produzem o mesmo resultado."""
+        payload = (
+            b'[{"id": "1", "channel_id": "2", "timestamp": "2026-02-17T12:00:00Z",'
+            b' "author": {"id": "3", "username": "User"}}]'
+        )
+        from_json = validate_messages(payload)
+        from_python = validate_messages([message.model_dump() for message in from_json])
+
+        assert len(from_json) == 1
+        assert isinstance(from_json[0], DiscordMessage)
+        assert from_json[0].author.username == "User"
+        assert from_json == from_python
+
+    def test_validate_message_parses_timestamps_from_json(self) -> None:
+        """Verifica se timestamps do JSON bruto viram datetimes com fuso."""
+        message = validate_message(
+            b'{"id": "1", "channel_id": "2", "timestamp": "2026-02-17T12:00:00Z",'
+            b' "edited_timestamp": "2026-02-17T12:05:00+00:00",'
+            b' "author": {"id": "3", "username": "User"}}'
+        )
+
+        assert message.timestamp == datetime(2026, 2, 17, 12, 0, tzinfo=timezone.utc)
+        assert message.edited_timestamp == datetime(2026, 2, 17, 12, 5, tzinfo=timezone.utc)
+
+    def test_validate_messages_rejects_invalid_item(self) -> None:
+        """Verifica se um item inválido faz o lote inteiro falhar."""
+        with pytest.raises(ValidationError):
+            validate_messages([{"id": "1"}])
+
+    def test_dump_messages_json_round_trips(self) -> None:
+        """Verifica se o lote serializado valida de volta nas mesmas mensagens."""
+        messages = validate_messages(
+            b'[{"id": "1", "channel_id": "2", "timestamp": "2026-02-17T12:00:00Z",'
+            b' "author": {"id": "3", "username": "User"}}]'
+        )
+
+        dumped = dump_messages_json(messages)
+
+        assert isinstance(dumped, bytes)
+        assert validate_messages(dumped) == messages
+
+
+class TestTypedSubmodels:
+    """Testes para os submodelos tipados de campos aninhados."""
+
+    def test_nested_payloads_are_typed(self) -> None:
+        """Verifica se dicts aninhados viram submodelos tipados."""
+        message = DiscordMessage.model_validate(
+            {
+                "id": "1",
+                "channel_id": "2",
+                "timestamp": "2026-02-17T12:00:00Z",
+                "author": {"id": "3", "username": "User"},
+                "reactions": [{"emoji": {"name": "👍"}, "count": 2}],
+                "message_reference": {"message_id": "9", "channel_id": "2"},
+            }
+        )
+
+        assert message.reactions[0].emoji.name == "👍"
+        assert message.message_reference is not None
+        assert message.message_reference.message_id == 9
+
+    def test_command_options_and_guild_collections(self) -> None:
+        """Verifica opções de comando aninhadas e coleções da guild."""
+        command = DiscordCommand(
+            id="1",
+            application_id="2",
+            name="ask",
+            version="1",
+            options=[{"type": 1, "name": "sub", "options": [{"type": 3, "name": "q"}]}],
+        )
+        guild = DiscordGuild(
+            id="4",
+            name="Server",
+            owner_id="5",
+            roles=[{"id": "6", "name": "admin"}],
+            emojis=[{"id": "7", "name": "agnaldo", "roles": ["6"]}],
+        )
+
+        assert command.options[0].options[0].name == "q"
+        assert guild.roles[0].name == "admin"
+        assert guild.emojis[0].roles == (6,)
+
+
+class TestSnowflake:
+    """Testes para IDs snowflake armazenados como inteiros."""
+
+    def test_string_ids_are_coerced_to_int(self) -> None:
+        """Verifica se IDs em string são convertidos para int."""
+        user = DiscordUser(id="123456789012345678", username="Agnaldo")
+
+        assert user.id == 123456789012345678
+
+    def test_ids_serialize_as_strings_in_json(self) -> None:
+        """Verifica se IDs voltam como string no JSON, como na API do Discord."""
+        user = DiscordUser(id=123456789012345678, username="Agnaldo")
+
+        assert user.model_dump()["id"] == 123456789012345678
+        assert '"id":"123456789012345678"' in user.model_dump_json()
+
+    def test_out_of_range_ids_are_rejected(self) -> None:
+        """Verifica se IDs fora do intervalo de 64 bits são rejeitados."""
+        with pytest.raises(ValidationError):
+            DiscordUser(id=-1, username="Agnaldo")
+        with pytest.raises(ValidationError):
+            DiscordUser(id=1 << 64, username="Agnaldo")
+
+
+class TestIngressConstraints:
+    """Testes para restrições aplicadas apenas na entrada de dados."""
+
+    def test_constraints_apply_to_raw_payloads(self) -> None:
+        """Verifica se limites de tamanho valem para dados brutos."""
+        with pytest.raises(ValidationError):
+            DiscordUser(id="1", username="x" * 33)
+
+    def test_internal_round_trips_skip_constraints(self) -> None:
+        """Verifica se cópias e instâncias aninhadas não são revalidadas."""
+        user = DiscordUser(id="1", username="User")
+        copied = user.model_copy(update={"username": "x" * 33})
+        message = DiscordMessage(id="2", channel_id="3", author=copied, timestamp="2026-02-17T12:00:00Z")
+
+        assert message.author is copied
+
+
+class TestEmptyCollections:
+    """Testes para coleções vazias compartilhadas."""
+
+    def test_empty_collections_share_the_empty_tuple(self) -> None:
+        """Verifica se coleções omitidas usam a tupla vazia compartilhada."""
+        author = {"id": "3", "username": "A"}
+        first = DiscordMessage(id="1", channel_id="2", author=author, timestamp="2026-02-17T12:00:00Z")
+        second = DiscordMessage(id="4", channel_id="2", author=author, timestamp="2026-02-17T12:00:00Z")
+
+        assert first.attachments == ()
+        assert first.reactions is second.reactions
+
+    def test_lists_are_accepted_and_serialized_as_arrays(self) -> None:
+        """Verifica se listas são aceitas na entrada e viram arrays no JSON."""
+        guild = DiscordGuild(id="1", name="Server", owner_id="2", features=["COMMUNITY"])
+
+        assert guild.features == ("COMMUNITY",)
+        assert '"features":["COMMUNITY"]' in guild.model_dump_json()
+
+
+class TestSchemaBuild:
+    """Testes para a construção dos validadores na importação."""
+
+    def test_all_models_are_complete_at_import(self) -> None:
+        """Verifica se nenhum modelo depende de resolução tardia de referências."""
+        models = [
+            obj
+            for obj in vars(discord_schemas).values()
+            if isinstance(obj, type) and issubclass(obj, BaseModel) and obj is not BaseModel
+        ]
+
+        assert models
+        for model in models:
+            assert model.__pydantic_complete__, model.__name__
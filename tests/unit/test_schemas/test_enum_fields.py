@@ -0,0 +1,38 @@
+"""Testes para campos enum dos schemas de agentes, memória e contexto."""
+
+from src.schemas.agents import AgentResponse, ResponseStatus
+from src.schemas.context import ContextMetrics, ContextMode, ContextWindow
+from src.schemas.memory import ArchivalMemoryItem, MemoryTier
+
+
+class TestEnumFields:
+    """Testes para enums mantidos na validação e serializados pelo valor."""
+
+    def test_agent_response_status(self) -> None:
+        """Verifica se o status fica como enum e é serializado como string."""
+        response = AgentResponse(message_id="msg_1", status="success")
+
+        assert response.status is ResponseStatus.SUCCESS
+        assert response.model_dump()["status"] == "success"
+        assert type(response.model_dump()["status"]) is str
+        assert response.model_dump_json() == ('{"message_id":"msg_1","status":"success","data":null,"error":null}')
+
+    def test_archival_memory_item_tier(self) -> None:
+        """Verifica se o tier é uma string literal e aceita membros do enum."""
+        item = ArchivalMemoryItem(id="a1", content="texto", storage_location="s3://bucket")
+        from_enum = ArchivalMemoryItem(id="a2", content="texto", storage_location="s3://bucket", tier=MemoryTier.CORE)
+
+        assert type(item.tier) is str
+        assert item.model_dump()["tier"] == "archival"
+        assert from_enum.tier == "core"
+
+    def test_context_metrics_mode(self) -> None:
+        """Verifica se o modo é serializado como string."""
+        metrics = ContextMetrics(
+            mode="active",
+            current_window=ContextWindow(total_tokens=10, max_tokens=100, utilization_percent=10.0),
+        )
+
+        assert metrics.mode is ContextMode.ACTIVE
+        assert type(metrics.model_dump()["mode"]) is str
+        assert metrics.model_dump()["mode"] == "active"
@@ -0,0 +1,20 @@
+"""Testes unitários para o cache de JSON schemas."""
+
+from src.schemas import json_schema_for
+from src.schemas.discord import DiscordMessage
+from src.schemas.knowledge import RAGSearchResult
+
+
+class TestJsonSchemaFor:
+    """Testes para json_schema_for."""
+
+    def test_schema_is_built_once(self) -> None:
+        """Verifica se chamadas repetidas devolvem o mesmo objeto."""
+        assert json_schema_for(DiscordMessage) is json_schema_for(DiscordMessage)
+
+    def test_schema_matches_pydantic(self) -> None:
+        """Verifica se o schema em cache é o gerado pelo Pydantic."""
+        assert json_schema_for(RAGSearchResult) == RAGSearchResult.model_json_schema()
+        assert json_schema_for(DiscordMessage, mode="serialization") == DiscordMessage.model_json_schema(
+            mode="serialization"
+        )
@@ -0,0 +1,217 @@
+"""Testes unitários para os schemas de conhecimento jurídico."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from src.schemas.knowledge import (
+    LegalDocumentChunk,
+    LegalPDFMetadata,
+    RAGSearchResult,
+    StudyAgentRequest,
+)
+
+
+class TestReadOnlyModels:
+    """Testes para os modelos imutáveis após a construção."""
+
+    def test_rag_search_result_is_frozen(self) -> None:
+        """Verifica se RAGSearchResult não aceita atribuição."""
+        result = RAGSearchResult(
+            content="Art. 121 - Matar alguém",
+            similarity=0.9,
+            category="legal_legislacao",
+            metadata=LegalPDFMetadata(fonte="Código Penal", area_direito="penal"),
+        )
+
+        with pytest.raises(ValidationError):
+            result.similarity = 0.1
+
+    def test_legal_document_chunk_is_frozen(self) -> None:
+        """Verifica se LegalDocumentChunk não aceita atribuição."""
+        chunk = LegalDocumentChunk(
+            content="Art. 1º",
+            metadata=LegalPDFMetadata(fonte="Constituição Federal", area_direito="constitucional"),
+            category="legal_legislacao",
+            chunk_index=0,
+            total_chunks=1,
+        )
+
+        with pytest.raises(ValidationError):
+            chunk.chunk_index = 1
+
+
+class TestFromDbRecord:
+    """Testes para a construção a partir de registros do banco."""
+
+    def test_from_db_record_reads_metadata(self) -> None:
+        """Verifica se fonte e similaridade vêm dos metadados arquivados."""
+        record = SimpleNamespace(
+            content="Art. 5º",
+            category="legal_legislacao",
+            archival_metadata={"fonte": "Constituição Federal", "similarity": 0.8},
+        )
+
+        result = RAGSearchResult.from_db_record(record)
+
+        assert result.content == "Art. 5º"
+        assert result.category == "legal_legislacao"
+        assert result.similarity == 0.8
+        assert result.source == "Constituição Federal"
+
+    def test_from_db_record_without_metadata(self) -> None:
+        """Verifica os valores padrão quando o registro não tem metadados."""
+        record = SimpleNamespace(content="Trecho", category="legal_doutrina", archival_metadata=None)
+
+        result = RAGSearchResult.from_db_record(record)
+
+        assert result.metadata.area_direito == "não informada"
+        assert result.similarity == 0.0
+        assert result.source == "Fonte desconhecida"
+
+    def test_from_db_record_null_category_uses_fallback(self) -> None:
+        """Verifica se registros com ``category`` NULL recebem a categoria padrão."""
+        record = SimpleNamespace(content="Trecho", category=None, archival_metadata=None)
+
+        result = RAGSearchResult.from_db_record(record)
+        (batch_result,) = RAGSearchResult.from_db_records([record])
+
+        assert result.category == "sem_categoria"
+        assert batch_result.category == "sem_categoria"
+
+    def test_from_db_record_null_metadata_values_use_fallback(self) -> None:
+        """Verifica se ``None`` gravado nos metadados não substitui o padrão."""
+        record = SimpleNamespace(
+            content="Trecho",
+            category="legal_doutrina",
+            archival_metadata={"fonte": None, "area_direito": None, "similarity": 0.4},
+        )
+
+        result = RAGSearchResult.from_db_record(record)
+        (batch_result,) = RAGSearchResult.from_db_records([record])
+
+        assert result.source == batch_result.source == "Fonte desconhecida"
+        assert result.metadata.area_direito == "não informada"
+        assert result.similarity == 0.4
+
+    def test_from_db_record_rejects_malformed_metadata(self) -> None:
+        """Verifica se metadados com tipo inesperado falham com ValidationError."""
+        record = SimpleNamespace(content="Trecho", category="legal_doutrina", archival_metadata={"fonte": 123})
+
+        with pytest.raises(ValidationError):
+            RAGSearchResult.from_db_record(record)
+
+    def test_source_is_serialized_from_metadata(self) -> None:
+        """Verifica se ``source`` continua no dump, derivado de ``metadata.fonte``."""
+        record = SimpleNamespace(
+            content="Art. 5º",
+            category="legal_legislacao",
+            archival_metadata={
+                "fonte": "Constituição Federal",
+                "area_direito": "constitucional",
+                "chunk_index": 3,
+            },
+        )
+
+        dumped = RAGSearchResult.from_db_records([record])[0].model_dump()
+
+        assert dumped["source"] == "Constituição Federal"
+        assert dumped["metadata"]["area_direito"] == "constitucional"
+        assert "chunk_index" not in dumped["metadata"]
+
+    def test_source_kwarg_is_rejected(self) -> None:
+        """Verifica se ``source`` não é aceito no construtor, já que é derivado."""
+        with pytest.raises(ValidationError):
+            RAGSearchResult(
+                content="Trecho",
+                similarity=0.5,
+                category="legal_legislacao",
+                metadata={"fonte": "Constituição Federal", "area_direito": "constitucional"},
+                source="Outra fonte",
+            )
+
+    def test_dump_list_json_matches_model_dump(self) -> None:
+        """Verifica se o JSON do lote equivale a ``model_dump`` item a item."""
+        records = [
+            SimpleNamespace(
+                content=f"Trecho {i}",
+                category="legal_legislacao",
+                archival_metadata={"fonte": "Código Penal", "area_direito": "penal"},
+            )
+            for i in range(2)
+        ]
+        results = RAGSearchResult.from_db_records(records)
+
+        dumped = RAGSearchResult.dump_list_json(results)
+
+        assert json.loads(dumped) == [r.model_dump(mode="json") for r in results]
+
+    def test_from_db_records_validates_batch(self) -> None:
+        """Verifica se o lote é validado e mantém a ordem dos registros."""
+        records = [
+            SimpleNamespace(
+                content=f"Trecho {i}",
+                category="legal_legislacao",
+                archival_metadata={"fonte": "Código Penal", "similarity": 0.5},
+            )
+            for i in range(3)
+        ]
+
+        results = RAGSearchResult.from_db_records(records)
+
+        assert [r.content for r in results] == ["Trecho 0", "Trecho 1", "Trecho 2"]
+        assert all(isinstance(r, RAGSearchResult) for r in results)
+
+    def test_from_db_records_rejects_invalid_similarity(self) -> None:
+        """Verifica se similaridade fora de [0, 1] invalida o lote."""
+        records = [
+            SimpleNamespace(
+                content="Trecho",
+                category="legal_legislacao",
+                archival_metadata={"similarity": 1.5},
+            )
+        ]
+
+        with pytest.raises(ValidationError):
+            RAGSearchResult.from_db_records(records)
+
+
+class TestInternedStrings:
+    """Testes para strings categóricas internadas."""
+
+    def test_categories_share_the_same_object(self) -> None:
+        """Verifica se categorias iguais apontam para o mesmo objeto str."""
+        first = RAGSearchResult(
+            content="a",
+            similarity=0.5,
+            category="".join(["legal_", "legislacao"]),
+            metadata={"fonte": "".join(["Código ", "Penal"]), "area_direito": "penal"},
+        )
+        second = RAGSearchResult(
+            content="b",
+            similarity=0.5,
+            category="".join(["legal_", "legislacao"]),
+            metadata={"fonte": "".join(["Código ", "Penal"]), "area_direito": "penal"},
+        )
+
+        assert first.category is second.category
+        assert first.source is second.source
+
+
+class TestRangeConstraints:
+    """Testes para os limites numéricos declarados com ``Interval``."""
+
+    @pytest.mark.parametrize("field, value", [("max_results", 0), ("max_results", 11), ("threshold", 1.5)])
+    def test_study_agent_request_rejects_out_of_range(self, field: str, value: float) -> None:
+        """Verifica se valores fora do intervalo são rejeitados."""
+        with pytest.raises(ValidationError):
+            StudyAgentRequest(question="O que é dolo?", user_id="1", **{field: value})
+
+    def test_study_agent_request_accepts_bounds(self) -> None:
+        """Verifica se os limites do intervalo são aceitos."""
+        request = StudyAgentRequest(question="O que é dolo?", user_id="1", max_results=10, threshold=0.0)
+
+        assert request.max_results == 10
+        assert request.threshold == 0.0
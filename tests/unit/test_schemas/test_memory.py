@@ -0,0 +1,253 @@
+"""Testes unitários para os schemas de memória."""
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from src.schemas.memory import (
+    ArchivalMemoryItem,
+    CoreMemoryItem,
+    MemorySearchResult,
+    MemoryStats,
+    RecallMemoryItem,
+    decode_cursor,
+    dequantize_embedding,
+    encode_cursor,
+    quantize_embedding,
+)
+from src.schemas.memory_examples import EXAMPLES
+
+
+class TestMemoryStats:
+    """Testes para os totais derivados de MemoryStats."""
+
+    def test_totals_are_derived_from_tiers(self) -> None:
+        """Verifica se os totais somam os contadores de cada tier."""
+        stats = MemoryStats(
+            core_count=1,
+            recall_count=2,
+            archival_count=3,
+            core_tokens=10,
+            recall_tokens=20,
+            archival_tokens=30,
+        )
+
+        assert stats.total_count == 6
+        assert stats.total_tokens == 60
+
+    def test_totals_are_serialized(self) -> None:
+        """Verifica se os totais continuam presentes no dump."""
+        dumped = MemoryStats(core_count=4, core_tokens=40).model_dump()
+
+        assert dumped["total_count"] == 4
+        assert dumped["total_tokens"] == 40
+
+
+class TestMemorySearchResult:
+    """Testes para a união discriminada de itens de memória."""
+
+    def test_results_dispatch_on_kind(self) -> None:
+        """Verifica se cada item é validado pelo modelo indicado em ``kind``."""
+        result = MemorySearchResult(
+            query="dolo",
+            total_results=3,
+            results=[
+                {"kind": "core", "id": "c1", "content": "a"},
+                {"kind": "recall", "id": "r1", "content": "b", "conversation_id": "conv"},
+                {"kind": "archival", "id": "a1", "content": "c", "storage_location": "s3://x"},
+            ],
+        )
+
+        assert [type(item) for item in result.results] == [
+            CoreMemoryItem,
+            RecallMemoryItem,
+            ArchivalMemoryItem,
+        ]
+
+    def test_results_accept_model_instances(self) -> None:
+        """Verifica se instâncias já construídas são aceitas sem ``kind`` explícito."""
+        item = CoreMemoryItem(id="c1", content="a")
+
+        result = MemorySearchResult(query="dolo", total_results=1, results=[item])
+
+        assert result.results == [item]
+
+    def test_results_reject_unknown_kind(self) -> None:
+        """Verifica se um ``kind`` desconhecido é rejeitado."""
+        with pytest.raises(ValidationError):
+            MemorySearchResult(query="dolo", total_results=1, results=[{"kind": "other", "id": "x"}])
+
+
+class TestExamples:
+    """Testes para os exemplos mantidos fora do model_config."""
+
+    @pytest.mark.parametrize(
+        "model",
+        [CoreMemoryItem, RecallMemoryItem, ArchivalMemoryItem, MemorySearchResult, MemoryStats],
+    )
+    def test_examples_validate(self, model: type[BaseModel]) -> None:
+        """Verifica se cada exemplo documentado é um payload válido."""
+        for example in EXAMPLES[model.__name__]:
+            model.model_validate(example)
+
+    def test_examples_are_not_in_json_schema(self) -> None:
+        """Verifica se os modelos não carregam exemplos no schema."""
+        assert "examples" not in MemoryStats.model_json_schema()
+
+
+class TestFrozenModels:
+    """Testes para os modelos de memória imutáveis."""
+
+    @pytest.mark.parametrize(
+        "instance, field",
+        [
+            (RecallMemoryItem(id="r1", content="a", conversation_id="conv"), "content"),
+            (ArchivalMemoryItem(id="a1", content="a", storage_location="s3://x"), "content"),
+            (MemorySearchResult(query="dolo", total_results=0), "page"),
+            (MemoryStats(), "core_count"),
+        ],
+    )
+    def test_assignment_is_rejected(self, instance: BaseModel, field: str) -> None:
+        """Verifica se atribuição após a construção é rejeitada."""
+        with pytest.raises(ValidationError):
+            setattr(instance, field, 1)
+
+    def test_core_memory_item_stays_mutable(self) -> None:
+        """Verifica se CoreMemoryItem aceita as atualizações feitas pelo cache."""
+        item = CoreMemoryItem(id="c1", content="a")
+
+        item.access_count += 1
+
+        assert item.access_count == 1
+
+
+class TestFromRow:
+    """Testes para a construção a partir de linhas confiáveis do banco."""
+
+    def test_from_row_fills_defaults(self) -> None:
+        """Verifica se campos ausentes recebem os valores padrão."""
+        item = RecallMemoryItem.from_row({"id": "r1", "content": "a", "conversation_id": "conv"})
+
+        assert item.kind == "recall"
+        assert item.relevance_score == 0.5
+        assert item.embedding is None
+
+    def test_from_row_skips_validation(self) -> None:
+        """Verifica se a linha não é revalidada."""
+        item = CoreMemoryItem.from_row({"id": "c1", "content": "a", "importance": 2.0})
+
+        assert item.importance == 2.0
+
+
+class TestPackedEmbeddings:
+    """Testes para a matriz contígua de embeddings em MemorySearchResult."""
+
+    def _recall(self, item_id: str, embedding: list[float] | None) -> RecallMemoryItem:
+        return RecallMemoryItem(id=item_id, content="a", conversation_id="conv", embedding=embedding)
+
+    def test_packs_embeddings_into_float32_matrix(self) -> None:
+        """Verifica se os embeddings viram uma matriz (N, D) float32."""
+        result = MemorySearchResult.with_packed_embeddings(
+            query="dolo",
+            total_results=2,
+            results=[self._recall("r1", [1.0, 0.0]), self._recall("r2", [0.0, 1.0])],
+        )
+
+        assert result.embeddings.shape == (2, 2)
+        assert result.embeddings.dtype == np.float32
+        assert all(item.embedding is None for item in result.results)
+        assert result.similarities([1.0, 0.0]).tolist() == [1.0, 0.0]
+        assert "embeddings" not in result.model_dump()
+
+    def test_keeps_items_when_an_embedding_is_missing(self) -> None:
+        """Verifica se nada é empacotado quando algum item não tem embedding."""
+        result = MemorySearchResult.with_packed_embeddings(
+            query="dolo",
+            total_results=2,
+            results=[self._recall("r1", [1.0, 0.0]), self._recall("r2", None)],
+        )
+
+        assert result.embeddings is None
+        assert result.results[0].embedding == [1.0, 0.0]
+        with pytest.raises(ValueError):
+            result.similarities([1.0, 0.0])
+
+    def test_rejects_mismatched_embedding_rows(self) -> None:
+        """Verifica se o número de linhas precisa bater com os resultados."""
+        with pytest.raises(ValidationError):
+            MemorySearchResult(
+                query="dolo",
+                total_results=1,
+                results=[self._recall("r1", None)],
+                embeddings=np.zeros((2, 3), dtype=np.float32),
+            )
+
+
+class TestQuantizedEmbeddings:
+    """Testes para embeddings quantizados em int8."""
+
+    def test_round_trip_is_close(self) -> None:
+        """Verifica se a dequantização fica próxima do vetor original."""
+        vector = np.linspace(-1.0, 1.0, 64, dtype=np.float32)
+
+        q8, scale = quantize_embedding(vector)
+
+        assert len(q8) == 64
+        assert np.allclose(dequantize_embedding(q8, scale), vector, atol=scale)
+
+    def test_zero_vector(self) -> None:
+        """Verifica se o vetor nulo não divide por zero."""
+        q8, scale = quantize_embedding([0.0, 0.0])
+
+        assert dequantize_embedding(q8, scale).tolist() == [0.0, 0.0]
+
+    def test_quantized_item_drops_float_embedding(self) -> None:
+        """Verifica se o item quantizado guarda só os bytes e a escala."""
+        item = RecallMemoryItem(id="r1", content="a", conversation_id="conv", embedding=[0.5, -1.0]).quantized()
+
+        assert item.embedding is None
+        assert item.embedding_q8 is not None
+        assert np.allclose(item.embedding_array(), [0.5, -1.0], atol=item.embedding_scale)
+
+    def test_quantized_items_are_packed(self) -> None:
+        """Verifica se itens quantizados entram na matriz de embeddings."""
+        item = RecallMemoryItem(id="r1", content="a", conversation_id="conv", embedding=[1.0, 0.0]).quantized()
+
+        result = MemorySearchResult.with_packed_embeddings(query="dolo", total_results=1, results=[item])
+
+        assert result.embeddings.shape == (1, 2)
+        assert result.results[0].embedding_q8 is None
+
+
+class TestCursor:
+    """Testes para os cursores de paginação keyset."""
+
+    def test_round_trip(self) -> None:
+        """Verifica se o cursor decodifica no mesmo par (created_at, id)."""
+        created_at = datetime(2026, 2, 17, 12, 0, tzinfo=timezone.utc)
+
+        assert decode_cursor(encode_cursor(created_at, "abc")) == (created_at, "abc")
+
+    def test_rejects_garbage(self) -> None:
+        """Verifica se cursores malformados geram ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestTopK:
+    """Testes para MemorySearchResult.top_k."""
+
+    def test_top_k_returns_items_with_scores(self) -> None:
+        """Verifica se top_k devolve os itens mais similares primeiro."""
+        items = [
+            RecallMemoryItem(id=f"r{i}", content="a", conversation_id="conv", embedding=vector)
+            for i, vector in enumerate([[1.0, 0.0], [0.0, 1.0], [0.8, 0.6]])
+        ]
+        result = MemorySearchResult.with_packed_embeddings(query="dolo", total_results=3, results=items)
+
+        ranked = result.top_k([0.0, 1.0], k=2)
+
+        assert [item.id for item, _ in ranked] == ["r1", "r2"]
+        assert ranked[0][1] == 1.0
@@ -0,0 +1,245 @@
+"""Testes unitários para os utilitários de tratamento de erros."""
+
+import json
+from datetime import datetime, timezone
+
+import httpx
+import openai
+import pytest
+
+from src.exceptions import (
+    AgnaldoError,
+    DatabaseError,
+    EmbeddingGenerationError,
+    MemoryServiceError,
+    RateLimitError,
+    SupabaseConnectionError,
+)
+from src.utils import error_handlers
+from src.utils.error_handlers import (
+    CircuitBreaker,
+    CircuitBreakerError,
+    CircuitState,
+    ErrorResponse,
+    handle_error,
+    retry_on_database_error,
+    retry_on_memory_error,
+)
+
+
+class TestRetryDecorators:
+    """Testes para os decoradores de retry."""
+
+    def test_db_and_memory_share_stop_and_wait_policies(self) -> None:
+        """Verifica se decoradores com a mesma política reutilizam os objetos."""
+
+        @retry_on_database_error
+        def fetch() -> None:
+            pass
+
+        @retry_on_memory_error
+        def search() -> None:
+            pass
+
+        assert fetch.retry.stop is search.retry.stop
+        assert fetch.retry.wait is search.retry.wait
+        assert fetch.retry.retry is not search.retry.retry
+
+
+class TestHandleError:
+    """Testes para o mapeamento de exceções em ErrorResponse."""
+
+    @pytest.mark.parametrize(
+        "error, expected_code",
+        [
+            (SupabaseConnectionError("falhou", status_code=503), "SUPABASE_CONNECTION_ERROR"),
+            (DatabaseError("falhou", operation="select"), "DATABASE_ERROR"),
+            (EmbeddingGenerationError("falhou", model="m"), "EMBEDDING_GENERATION_ERROR"),
+            (MemoryServiceError("falhou", memory_type="core"), "MEMORY_ERROR"),
+            (RateLimitError("falhou", retry_after=5), "RATE_LIMIT_ERROR"),
+            (CircuitBreakerError("aberto"), "CIRCUIT_BREAKER_OPEN"),
+            (AgnaldoError("falhou"), "AGNALDO_ERROR"),
+            (ValueError("falhou"), "INTERNAL_ERROR"),
+        ],
+    )
+    def test_most_specific_handler_wins(self, error: Exception, expected_code: str) -> None:
+        """Verifica se a classe mais específica da hierarquia define o código."""
+        assert handle_error(error).error_code == expected_code
+
+    def test_unknown_subclass_reports_its_own_code(self) -> None:
+        """Verifica se subclasses novas definem o código sem mudar handle_error."""
+
+        class QuotaError(AgnaldoError):
+            error_code = "QUOTA_ERROR"
+
+        response = handle_error(QuotaError("sem cota", details={"plan": "free"}))
+
+        assert response.error_code == "QUOTA_ERROR"
+        assert response.details == {"plan": "free"}
+
+    def test_circuit_breaker_error_suggests_retry(self) -> None:
+        """Verifica se o circuito aberto sugere aguardar 30 segundos."""
+        assert handle_error(CircuitBreakerError("aberto")).retry_after == 30
+
+    def test_openai_connection_error(self) -> None:
+        """Verifica se erros do SDK da OpenAI usam a tabela de respostas."""
+        error = openai.APIConnectionError(request=httpx.Request("POST", "https://api.openai.com/v1/embeddings"))
+
+        response = handle_error(error)
+
+        assert response.error_code == "OPENAI_CONNECTION_ERROR"
+        assert response.retry_after == 10
+
+    def test_openai_subclass_uses_nearest_registered_base(self) -> None:
+        """Verifica se subclasses não mapeadas usam a base mais próxima no MRO."""
+        error = openai.APITimeoutError(request=httpx.Request("POST", "https://api.openai.com/v1/embeddings"))
+
+        response = handle_error(error)
+
+        assert response.error_code == "OPENAI_CONNECTION_ERROR"
+        assert response.error == "Failed to connect to OpenAI API"
+
+    def test_openai_mapping_is_read_only(self) -> None:
+        """Verifica se a tabela de erros da OpenAI não pode ser alterada."""
+        with pytest.raises(TypeError):
+            error_handlers._OPENAI_ERRORS[ValueError] = (None, "X", None)  # type: ignore[index]
+
+    def test_uses_caller_timestamp(self) -> None:
+        """Verifica se o timestamp recebido do chamador é reaproveitado."""
+        received_at = datetime(2026, 2, 17, 12, 0, tzinfo=timezone.utc)
+
+        response = handle_error(ValueError("falhou"), timestamp=received_at)
+
+        assert response.timestamp is received_at
+
+    def test_rate_limit_keeps_retry_after(self) -> None:
+        """Verifica se o retry_after da exceção é propagado."""
+        response = handle_error(RateLimitError("falhou", retry_after=5))
+
+        assert response.retry_after == 5
+
+
+class TestCircuitBreaker:
+    """Testes para as transições de estado do circuit breaker."""
+
+    def test_trips_after_threshold_and_rejects_calls(self) -> None:
+        """Verifica se o circuito abre após o limite de falhas."""
+        breaker = CircuitBreaker(failure_threshold=2, timeout=60)
+
+        @breaker
+        def fail() -> None:
+            raise ValueError("falhou")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                fail()
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitBreakerError):
+            fail()
+
+    async def test_recovers_after_timeout(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifica se o circuito fecha após sucesso em HALF_OPEN."""
+        clock = [100.0]
+        monkeypatch.setattr(error_handlers.time, "monotonic", lambda: clock[0])
+        breaker = CircuitBreaker(failure_threshold=1, timeout=10)
+        outcomes = [ValueError("falhou"), "ok"]
+
+        @breaker
+        async def call() -> str:
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with pytest.raises(ValueError):
+            await call()
+        assert breaker.state is CircuitState.OPEN
+
+        clock[0] += 10
+        assert await call() == "ok"
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.failure_count == 0
+
+    def test_success_while_closed_resets_failures(self) -> None:
+        """Verifica se um sucesso zera falhas acumuladas abaixo do limite."""
+        breaker = CircuitBreaker(failure_threshold=3)
+        outcomes = [ValueError("falhou"), "ok"]
+
+        @breaker
+        def call() -> str:
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with pytest.raises(ValueError):
+            call()
+        assert breaker.failure_count == 1
+
+        assert call() == "ok"
+        assert breaker.failure_count == 0
+        assert breaker.last_failure_time is None
+
+    def test_reset_restarts_failure_count(self) -> None:
+        """Verifica se após reset manual a contagem de falhas recomeça do zero."""
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        @breaker
+        def fail() -> None:
+            raise ValueError("falhou")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                fail()
+        breaker.reset()
+
+        with pytest.raises(ValueError):
+            fail()
+        assert breaker.failure_count == 1
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failure_racing_reset_does_not_overwrite_count(self) -> None:
+        """Verifica se uma falha contada durante um reset não sobrescreve a contagem zerada."""
+        breaker = CircuitBreaker(failure_threshold=5)
+
+        class _ResetWhileCounting:
+            def __next__(self) -> int:
+                # Simula um reset entre a leitura do contador e o ``next()``
+                breaker.reset()
+                return 4
+
+        breaker._failure_counter = _ResetWhileCounting()
+        breaker._on_failure()
+
+        assert breaker.failure_count == 0
+        assert breaker.state is CircuitState.CLOSED
+
+
+class TestErrorResponse:
+    """Testes para o formato de ErrorResponse."""
+
+    def test_to_dict_omits_empty_optional_fields(self) -> None:
+        """Verifica se details e retry_after só aparecem quando definidos."""
+        timestamp = datetime(2026, 2, 17, 12, 0, tzinfo=timezone.utc)
+
+        response = ErrorResponse(error="falhou", error_code="X", timestamp=timestamp)
+
+        assert response.to_dict() == {
+            "error": "falhou",
+            "error_code": "X",
+            "timestamp": "2026-02-17T12:00:00+00:00",
+        }
+
+    def test_instances_have_no_dict(self) -> None:
+        """Verifica se as instâncias usam __slots__ em vez de __dict__."""
+        response = ErrorResponse(error="falhou", error_code="X", retry_after=5)
+
+        assert not hasattr(response, "__dict__")
+        assert response.to_dict()["retry_after"] == 5
+
+    def test_to_json_bytes_matches_to_dict(self) -> None:
+        """Verifica se o JSON serializado tem o mesmo conteúdo de to_dict."""
+        response = ErrorResponse(error="falhou", error_code="X", details={"op": "select"}, retry_after=5)
+
+        assert json.loads(response.to_json_bytes()) == response.to_dict()
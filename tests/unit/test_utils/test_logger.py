@@ -0,0 +1,173 @@
+"""Testes unitários para a configuração de logging."""
+
+import logging
+from pathlib import Path
+
+import pytest
+import zstandard
+from loguru import logger
+
+from src.utils import logger as logger_module
+from src.utils.logger import (
+    InterceptHandler,
+    _enable_diagnostics,
+    get_logger,
+    intercept_standard_logging,
+)
+
+
+@pytest.fixture
+def captured() -> list[dict]:
+    """Captura os registros emitidos no Loguru durante o teste."""
+    records: list[dict] = []
+    sink_id = logger.add(lambda message: records.append(message.record), level=0)
+    yield records
+    logger.remove(sink_id)
+
+
+@pytest.fixture
+def handler() -> InterceptHandler:
+    """Handler que redireciona o logging padrão ao Loguru."""
+    return InterceptHandler()
+
+
+@pytest.fixture
+def std_logger(handler: InterceptHandler) -> logging.Logger:
+    """Logger padrão cujos registros são redirecionados ao Loguru."""
+    target = logging.getLogger("tests.intercept")
+    target.addHandler(handler)
+    target.setLevel(logging.DEBUG)
+    target.propagate = False
+    yield target
+    target.removeHandler(handler)
+
+
+class TestInterceptHandler:
+    """Testes para o redirecionamento do logging padrão."""
+
+    def test_record_is_attributed_to_caller(self, captured: list[dict], std_logger: logging.Logger) -> None:
+        """Verifica se o registro aponta para quem chamou o logging, não para o módulo logging."""
+        std_logger.warning("falhou")
+
+        assert captured[-1]["function"] == "test_record_is_attributed_to_caller"
+        assert captured[-1]["level"].name == "WARNING"
+        assert captured[-1]["message"] == "falhou"
+
+    @pytest.mark.parametrize("name", ["uvicorn.access", "sqlalchemy.engine.Engine"])
+    def test_quiet_logger_exception_is_attributed_to_caller(
+        self, captured: list[dict], handler: InterceptHandler, name: str
+    ) -> None:
+        """Verifica se ``.exception()`` de loggers ruidosos aponta para quem chamou."""
+        quiet = logging.getLogger(name)
+        quiet.addHandler(handler)
+        try:
+            try:
+                raise RuntimeError("falhou")
+            except RuntimeError:
+                quiet.exception("lento")
+        finally:
+            quiet.removeHandler(handler)
+
+        assert captured[-1]["function"] == "test_quiet_logger_exception_is_attributed_to_caller"
+        assert captured[-1]["message"] == "lento"
+
+    def test_level_name_is_cached(
+        self, captured: list[dict], handler: InterceptHandler, std_logger: logging.Logger
+    ) -> None:
+        """Verifica se o nível do Loguru é resolvido uma vez por nome de nível."""
+        std_logger.info("primeiro")
+        std_logger.info("segundo")
+
+        assert handler._level_cache == {"INFO": "INFO"}
+        assert [r["message"] for r in captured[-2:]] == ["primeiro", "segundo"]
+
+    def test_unknown_level_falls_back_to_number(
+        self, captured: list[dict], handler: InterceptHandler, std_logger: logging.Logger
+    ) -> None:
+        """Verifica se níveis desconhecidos do Loguru usam o número do nível."""
+        std_logger.log(15, "detalhe")
+
+        assert captured[-1]["level"].no == 15
+        assert handler._level_cache == {}
+
+
+class TestInterceptStandardLogging:
+    """Testes para a configuração do logging padrão."""
+
+    @pytest.fixture
+    def restore_logging(self) -> None:
+        """Restaura handlers, nível e propagação alterados pelo teste."""
+        names = ("", *logger_module._INTERCEPTED_LOGGERS, *logger_module._DISCARDED_LOGGERS)
+        saved = [
+            (target, target.handlers[:], target.level, target.propagate) for target in map(logging.getLogger, names)
+        ]
+        yield
+        for target, handlers, level, propagate in saved:
+            target.handlers = handlers
+            target.setLevel(level)
+            target.propagate = propagate
+
+    @pytest.mark.usefixtures("restore_logging")
+    def test_access_log_never_reaches_loguru(self, captured: list[dict]) -> None:
+        """Verifica se o log de acesso do uvicorn é descartado antes do InterceptHandler."""
+        intercept_standard_logging()
+        access = logging.getLogger("uvicorn.access")
+
+        access.warning("GET / 200")
+        logging.getLogger("uvicorn.error").warning("falhou")
+
+        assert access.propagate is False
+        assert [r["message"] for r in captured] == ["falhou"]
+
+
+class TestGetLogger:
+    """Testes para get_logger."""
+
+    def test_same_name_returns_same_logger(self, captured: list[dict]) -> None:
+        """Verifica se o logger vinculado é reaproveitado por nome de módulo."""
+        log = get_logger("tests.modulo")
+
+        assert get_logger("tests.modulo") is log
+        assert get_logger("tests.outro") is not log
+
+        log.info("ok")
+        assert captured[-1]["extra"] == {"module": "tests.modulo"}
+
+
+class TestEnableDiagnostics:
+    """Testes para a decisão de habilitar diagnósticos."""
+
+    @pytest.mark.parametrize(
+        ("environment", "debug", "expected"),
+        [
+            ("development", "0", True),
+            ("production", "0", False),
+            ("PROD", "0", False),
+            ("production", "yes", True),
+        ],
+    )
+    def test_environment_and_debug_flag(
+        self, monkeypatch: pytest.MonkeyPatch, environment: str, debug: str, expected: bool
+    ) -> None:
+        """Verifica se diagnósticos só ficam desligados em produção sem DEBUG."""
+        monkeypatch.setenv("ENVIRONMENT", environment)
+        monkeypatch.setenv("DEBUG", debug)
+
+        assert _enable_diagnostics() is expected
+
+
+class TestLogCompression:
+    """Testes para a compressão de logs rotacionados."""
+
+    def test_zstd_compress_replaces_file(self, tmp_path: Path) -> None:
+        """Verifica se o log rotacionado vira um .zst legível e o original é removido."""
+        log_file = tmp_path / "app.2026-02-17.log"
+        log_file.write_text("linha de log\n" * 100)
+
+        logger_module._zstd_compress(str(log_file))
+
+        compressed = tmp_path / "app.2026-02-17.log.zst"
+        assert not log_file.exists()
+        with compressed.open("rb") as stream:
+            data = zstandard.ZstdDecompressor().stream_reader(stream).read()
+        assert data == b"linha de log\n" * 100
@@ -0,0 +1,33 @@
+"""Testes unitários para o ranking vetorizado de embeddings."""
+
+import numpy as np
+
+from src.utils.ranking import cosine_topk
+
+
+class TestCosineTopk:
+    """Testes para cosine_topk."""
+
+    def test_returns_best_rows_in_order(self) -> None:
+        """Verifica se os k melhores índices vêm do mais para o menos similar."""
+        embeddings = np.array([[1.0, 0.0], [0.0, 1.0], [0.6, 0.8], [0.8, 0.6]], dtype=np.float32)
+
+        indices, scores = cosine_topk(np.array([1.0, 0.0]), embeddings, k=2)
+
+        assert indices.tolist() == [0, 3]
+        assert np.allclose(scores, [1.0, 0.8])
+
+    def test_k_is_clamped_to_rows(self) -> None:
+        """Verifica se k maior que N devolve todas as linhas."""
+        embeddings = np.eye(2, dtype=np.float32)
+
+        indices, _ = cosine_topk(np.array([0.0, 1.0]), embeddings, k=5)
+
+        assert indices.tolist() == [1, 0]
+
+    def test_k_zero_returns_empty(self) -> None:
+        """Verifica se k=0 devolve arrays vazios."""
+        indices, scores = cosine_topk(np.ones(2), np.eye(2, dtype=np.float32), k=0)
+
+        assert indices.size == 0
+        assert scores.size == 0
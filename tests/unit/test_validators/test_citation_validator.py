@@ -4,6 +4,8 @@ Este módulo testa a validação de citações jurídicas para minimizar alucina
 no StudyAgent do Agnaldo Concursos RAG.
 """
 
+import dataclasses
+
 import pytest
 
 from src.validators.citation_validator import (
@@ -23,6 +25,13 @@ class TestCitationValidator:
         assert validator.PATTERNS is not None
         assert len(validator.PATTERNS) > 0
 
+    def test_patterns_are_fused(self) -> None:
+        """Testa se os padrões são fundidos em uma alternação com grupos nomeados."""
+        fused = CitationValidator._FUSED_PATTERN
+
+        assert set(fused.groupindex) == set(CitationValidator.PATTERNS)
+        assert fused.search("SÚMULA 11") is not None
+
     def test_extract_citations_artigo(self) -> None:
         """Testa extração de citações de artigos."""
         validator = CitationValidator(strict_mode=True)
@@ -73,6 +82,29 @@ class TestCitationValidator:
         assert len(citations) > 0
         assert any("cf" in c.lower() or "constituição" in c.lower() for c in citations)
 
+    def test_extract_citations_cf_not_split_into_artigo(self) -> None:
+        """Testa se "Art. 5º, CF" vira uma única citação, não também um artigo solto."""
+        validator = CitationValidator(strict_mode=True)
+
+        citations = validator._extract_citations("Conforme Art. 5º, CF, todos são iguais.")
+
+        assert citations == ["art. 5º, cf"]
+
+    def test_extract_citations_without_hint_returns_empty(self) -> None:
+        """Testa o atalho para textos sem nenhum prefixo de citação."""
+        validator = CitationValidator(strict_mode=True)
+
+        assert validator._extract_citations("") == []
+        assert validator._extract_citations("O homicídio é crime grave.") == []
+
+    def test_extract_citations_merges_case_variants(self) -> None:
+        """Testa se variações de caixa da mesma citação viram uma só entrada."""
+        validator = CitationValidator(strict_mode=True)
+
+        citations = validator._extract_citations("Art. 121; ART. 121.")
+
+        assert citations == ["art. 121"]
+
     def test_validate_response_with_valid_citations(self) -> None:
         """Testa validação de resposta com citações válidas (presentes no contexto)."""
         validator = CitationValidator(strict_mode=True)
@@ -147,6 +179,23 @@ class TestCitationValidator:
 
         assert result is False
 
+    def test_citation_in_context_ignores_punctuation(self) -> None:
+        """Testa busca parcial sem pontuação, mantendo ordinais como "º"."""
+        validator = CitationValidator(strict_mode=True)
+        context = "art 121 § 2º, inciso i, do código penal"
+
+        assert validator._citation_in_context("art. 121, § 2º", context) is True
+        assert validator._citation_in_context("art. 121, § 3º", context) is False
+
+    def test_find_citations_in_context(self) -> None:
+        """Testa a busca de várias citações de uma vez, exata ou sem pontuação."""
+        validator = CitationValidator(strict_mode=True)
+        context = "art 121 do código penal; súmula 11"
+
+        found = validator._find_citations_in_context({"art. 121", "código penal", "súmula 11", "art. 999"}, context)
+
+        assert found == {"art. 121", "código penal", "súmula 11"}
+
     def test_confidence_score_all_verified(self) -> None:
         """Testa cálculo de score de confiança quando todas citações são verificadas."""
         validator = CitationValidator(strict_mode=True)
@@ -192,6 +241,32 @@ class TestCitationValidator:
         # Singleton deve retornar a mesma instância
         assert validator1 is validator2
 
+    def test_get_citation_validator_keeps_one_instance_per_mode(self) -> None:
+        """Testa se alternar o modo não recria as instâncias compartilhadas."""
+        strict = get_citation_validator(strict_mode=True)
+        lenient = get_citation_validator(strict_mode=False)
+
+        assert lenient.strict_mode is False
+        assert get_citation_validator(strict_mode=True) is strict
+        assert get_citation_validator(strict_mode=False) is lenient
+
+    def test_get_citation_validator_ignores_call_form(self) -> None:
+        """Testa se formas diferentes de chamada devolvem a mesma instância por modo."""
+        strict = get_citation_validator()
+
+        assert get_citation_validator(True) is strict
+        assert get_citation_validator(strict_mode=True) is strict
+        assert get_citation_validator(False) is get_citation_validator(strict_mode=False)
+        assert get_citation_validator(False) is not strict
+
+    def test_validation_result_is_frozen_and_slotted(self) -> None:
+        """Testa se o resultado é imutável e não carrega __dict__."""
+        result = CitationValidator(strict_mode=True).validate_response("Sem citações.", [])
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.is_valid = False  # type: ignore[misc]
+
     def test_strict_mode_false(self) -> None:
         """Testa comportamento em modo não-estrito."""
         validator = CitationValidator(strict_mode=False)